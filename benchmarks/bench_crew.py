@@ -0,0 +1,92 @@
+"""Time the banking incident crew end to end against the mock LLM.
+
+    python benchmarks/bench_crew.py --mode dag --runs 5 --llm-latency-ms 800 --tokens-per-s 50
+
+Each run is a fresh ``main.py`` process in ``crewai-banking-inc-mgmt`` with
+``OPENAI_BASE_URL`` pointed at the mock, the response cache off and a scratch
+tools database, so runs are independent. The mock answers every call with a
+``Final Answer:`` so each agent finishes in one LLM round trip; the numbers
+measure orchestration, prompt building and tool overhead on top of the
+configured model latency.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import ROOT, latency_summary, print_metrics, save_results
+from mock_servers import start_server
+
+APP_DIR = os.path.join(ROOT, "crewai-banking-inc-mgmt")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["sequential", "dag"], default="dag")
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--llm-latency-ms", type=float, default=500.0)
+    parser.add_argument("--llm-jitter-ms", type=float, default=100.0)
+    parser.add_argument("--tokens-per-s", type=float, default=0.0, help="Mock LLM generation speed (0 = instant)")
+    parser.add_argument("--completion-tokens", type=int, default=200)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="Fraction of calls answered with a 429")
+    parser.add_argument("--timeout", type=float, default=1800.0, help="Seconds allowed per run")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    mock = start_server("llm", latency_ms=args.llm_latency_ms, jitter_ms=args.llm_jitter_ms,
+                        tokens_per_s=args.tokens_per_s, completion_tokens=args.completion_tokens,
+                        reply="final_answer", error_rate=args.llm_error_rate, error_status=429)
+    workdir = tempfile.mkdtemp(prefix="bench-crew-")
+    env = {
+        **os.environ,
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{mock.server_address[1]}/v1",
+        "OPENAI_API_KEY": "bench",
+        "LLM_CACHE_MODE": "off",
+        "TOOLS_DB_PATH": os.path.join(workdir, "tools.sqlite"),
+        "CHECKPOINT_DIR": os.path.join(workdir, "checkpoints"),
+    }
+
+    wall, task_wall, llm_calls, failures = [], {}, [], 0
+    try:
+        for run in range(args.runs):
+            trace_path = os.path.join(workdir, f"trace-{run}.json")
+            command = [sys.executable, "main.py", "--mode", args.mode, "--max-concurrency",
+                       str(args.max_concurrency), "--trace-json", trace_path]
+            start = time.perf_counter()
+            result = subprocess.run(command, cwd=APP_DIR, env=env, capture_output=True, text=True,
+                                    timeout=args.timeout)
+            elapsed = (time.perf_counter() - start) * 1000
+            if result.returncode != 0 or not os.path.exists(trace_path):
+                failures += 1
+                print(f"run {run} failed (exit {result.returncode}):\n{result.stderr[-2000:]}", file=sys.stderr)
+                continue
+            wall.append(elapsed)
+            with open(trace_path) as f:
+                summary = json.load(f)["summary"]
+            for agent, row in summary.items():
+                task_wall.setdefault(agent, []).append(row["wall_ms"])
+            llm_calls.append(sum(row["llm_calls"] for row in summary.values()))
+            print(f"run {run}: {elapsed / 1000:.1f}s", file=sys.stderr)
+    finally:
+        mock.shutdown()
+    if not wall:
+        sys.exit(f"All {args.runs} runs failed; no results saved")
+
+    metrics = {"runs": len(wall), "failed_runs": failures}
+    metrics.update(latency_summary(wall, "crew_wall"))
+    metrics["llm_calls_per_run"] = sum(llm_calls) / len(llm_calls) if llm_calls else 0.0
+    for agent, samples in sorted(task_wall.items()):
+        metrics[f"task_{agent}_mean_ms"] = sum(samples) / len(samples)
+    print_metrics(metrics)
+    path = save_results(f"crew-{args.mode}", metrics, {k: v for k, v in vars(args).items() if k != "timeout"})
+    print(f"\nSaved {path}")
+
+
+if __name__ == "__main__":
+    main()
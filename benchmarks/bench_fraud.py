@@ -0,0 +1,117 @@
+"""Load-test the fraud API's ``/ingest`` and ``/score`` endpoints.
+
+    python benchmarks/bench_fraud.py --store pinecone --pinecone-latency-ms 15 --requests 2000 --concurrency 32
+
+Starts ``pincode-fraud-detection`` under uvicorn against the mock Pinecone
+server (or an in-process ``--store``), ingests a seeded synthetic history,
+then scores fresh transactions. The encoder runs for real.
+"""
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+
+from common import ROOT, HTTPLoad, print_metrics, save_results, wait_for_http
+from mock_servers import start_server
+
+APP_DIR = os.path.join(ROOT, "pincode-fraud-detection")
+LOCATIONS = ["Mumbai", "Delhi", "Bengaluru", "Chennai", "Kolkata", "Hyderabad", "Pune", "Jaipur"]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def transactions(count: int, seed: int, prefix: str, fraud_rate: float = 0.0):
+    """Seeded synthetic transactions; ``fraud_rate`` of them carry ``fraud_flag=True``."""
+    rng = random.Random(seed)
+    accounts = [f"ACC{n:05d}" for n in range(500)]
+    batch = []
+    for i in range(count):
+        fraud = rng.random() < fraud_rate
+        batch.append({
+            "transaction_id": f"{prefix}-{i:07d}",
+            "sender": rng.choice(accounts),
+            "receiver": rng.choice(accounts),
+            "amount": round(rng.uniform(50_000, 500_000) if fraud else rng.lognormvariate(7, 1.2), 2),
+            "timestamp": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T"
+                         f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00",
+            "location": rng.choice(LOCATIONS),
+            **({"fraud_flag": fraud} if fraud_rate else {}),
+        })
+    return batch
+
+
+def start_app(port: int, env: dict) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=APP_DIR, env={**os.environ, **env},
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store", default="pinecone", help="FRAUD_VECTOR_STORE: pinecone (mock), numpy, faiss-hnsw")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per endpoint")
+    parser.add_argument("--history", type=int, default=2000, help="Transactions ingested before scoring")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--no-prescore", action="store_true", help="Send every /score through the vector path")
+    parser.add_argument("--pinecone-latency-ms", type=float, default=10.0)
+    parser.add_argument("--pinecone-jitter-ms", type=float, default=5.0)
+    parser.add_argument("--pinecone-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--startup-timeout", type=float, default=600.0)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="bench-fraud-")
+    env = {
+        "FRAUD_VECTOR_STORE": args.store,
+        "FRAUD_STORE_PATH": os.path.join(workdir, "fraud-index"),
+        "PRESCORE_ENABLED": "0" if args.no_prescore else "1",
+    }
+    mock = None
+    if args.store == "pinecone":
+        mock = start_server("pinecone", latency_ms=args.pinecone_latency_ms, jitter_ms=args.pinecone_jitter_ms,
+                            error_rate=args.pinecone_error_rate)
+        env.update(PINECONE_HOST=f"http://127.0.0.1:{mock.server_address[1]}", PINECONE_API_KEY="bench")
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    app = start_app(port, env)
+    try:
+        wait_for_http(f"{base_url}/readyz", args.startup_timeout, app)
+        load = HTTPLoad(base_url, args.concurrency)
+        metrics = {}
+        # Untimed history gives /score neighbours to find, then the measured phases
+        load.run("POST", "/ingest", transactions(args.history, args.seed, "hist", fraud_rate=0.1), "history")
+        metrics.update(load.run("POST", "/ingest", transactions(args.requests, args.seed + 1, "ingest", 0.1),
+                                "ingest"))
+        metrics.update(load.run("POST", "/score", transactions(args.requests, args.seed + 2, "score"), "score"))
+        status, cache, _ = load.request("GET", "/cache/stats")
+        if status == 200 and isinstance(cache, dict):
+            metrics["embed_cache_hit_rate"] = cache["hit_rate"]
+    finally:
+        app.terminate()
+        app.wait(timeout=60)
+        if mock is not None:
+            mock.shutdown()
+
+    print_metrics(metrics)
+    config = {k: v for k, v in vars(args).items() if k != "startup_timeout"}
+    path = save_results("fraud", metrics, config, higher_is_better=[
+        "ingest_throughput_per_s", "score_throughput_per_s", "embed_cache_hit_rate",
+    ])
+    print(f"\nSaved {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Time MediChat ingestion and question answering over the bundled sample PDFs.
+
+    python benchmarks/bench_medichat.py --queries 50 --llm-latency-ms 200 --tokens-per-s 60
+
+Runs the same pipeline as the Streamlit app, in process and from a scratch
+directory so the FAISS index and page-text cache start cold:
+
+- extraction: page text only, through the PDF process pool
+- ingest: ``DocumentIndex.sync`` (extract, split, embed, index, save)
+- query: embed + hybrid search, context building, and a streamed answer
+  from the mock LLM (time to first token and total)
+"""
+import argparse
+import asyncio
+import glob
+import os
+import shutil
+import sys
+import tempfile
+
+from common import ROOT, latency_summary, print_metrics, save_results, timed
+from mock_servers import start_server
+
+APP_DIR = os.path.join(ROOT, "rag_chat_text_parser_medical")
+SAMPLE_PDFS = sorted(glob.glob(os.path.join(APP_DIR, "sample_data", "medical_history_*.pdf")))
+QUESTIONS = [
+    "What medications is the patient currently taking?",
+    "Summarize the patient's surgical history.",
+    "Are there any known drug allergies?",
+    "What were the most recent blood pressure readings?",
+    "List all chronic conditions and when they were diagnosed.",
+    "What follow-up appointments were recommended?",
+    "Has the patient been hospitalized before, and why?",
+    "What do the latest lab results show for HbA1c and cholesterol?",
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=40)
+    parser.add_argument("--rerank", action="store_true", help="Rescore hybrid results with the cross-encoder")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    parser.add_argument("--tokens-per-s", type=float, default=0.0, help="Mock LLM streaming speed (0 = instant)")
+    parser.add_argument("--completion-tokens", type=int, default=128)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not SAMPLE_PDFS:
+        sys.exit(f"No sample PDFs found under {APP_DIR}/sample_data")
+
+    # The app resolves index_store/ relative to the working directory
+    workdir = tempfile.mkdtemp(prefix="bench-medichat-")
+    os.chdir(workdir)
+    sys.path.insert(0, APP_DIR)
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    from app.chat_utils import astream_chat_model, get_chat_model, iter_async
+    from app.config import CONTEXT_TOKEN_BUDGET, INDEX_DIR, PDF_CACHE_DIR
+    from app.context_utils import build_context
+    from app.embedding_utils import get_embeddings
+    from app.pdf_utils import get_pdf_executor, iter_pdf_pages, split_pages
+    from app.retrieval_utils import hybrid_search
+    from app.vectorstore_utils import DocumentIndex, document_hash
+
+    files = {}
+    for path in SAMPLE_PDFS:
+        with open(path, "rb") as f:
+            files[os.path.basename(path)] = f.read()
+    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200, length_function=len)
+    executor = get_pdf_executor()
+
+    # Model load and pool start-up are one-off costs, kept out of the timings
+    embeddings = get_embeddings()
+    embeddings.embed_documents(["warmup"])
+    list(iter_pdf_pages(files[next(iter(files))], executor))
+    shutil.rmtree(PDF_CACHE_DIR, ignore_errors=True)
+
+    metrics = {"documents": len(files)}
+    page_counts, extract_ms = {}, 0.0
+    for name, data in files.items():
+        pages, elapsed = timed(lambda: list(iter_pdf_pages(data, executor)))
+        page_counts[name] = len(pages)
+        extract_ms += elapsed
+    pages_total = sum(page_counts.values())
+    shutil.rmtree(PDF_CACHE_DIR, ignore_errors=True)
+
+    def load_chunks(data):
+        return lambda: split_pages(iter_pdf_pages(data, executor), text_splitter, 1000)
+
+    document_index = DocumentIndex(INDEX_DIR, embeddings)
+    documents = {document_hash(data): (name, load_chunks(data)) for name, data in files.items()}
+    _, ingest_ms = timed(document_index.sync, "bench", documents)
+    metrics.update(
+        pages=pages_total,
+        chunks=len(document_index.vectorstore.index_to_docstore_id) if document_index.vectorstore else 0,
+        extract_ms_per_page=extract_ms / pages_total if pages_total else 0.0,
+        ingest_ms_total=ingest_ms,
+        ingest_ms_per_page=ingest_ms / pages_total if pages_total else 0.0,
+        ingest_pages_per_s=pages_total / (ingest_ms / 1000) if ingest_ms else 0.0,
+    )
+
+    async def lookup_and_search(question):
+        # Same steps as the app: the query vector (used for the answer cache) alongside hybrid search
+        _, result = await asyncio.gather(
+            asyncio.to_thread(embeddings.embed_query, question),
+            asyncio.to_thread(hybrid_search, document_index, question, rerank=args.rerank),
+        )
+        return result
+
+    loop = asyncio.new_event_loop()
+
+    def retrieve(question):
+        return loop.run_until_complete(lookup_and_search(question))
+
+    mock = start_server("llm", latency_ms=args.llm_latency_ms, tokens_per_s=args.tokens_per_s,
+                        completion_tokens=args.completion_tokens)
+    chat_model = get_chat_model("bench", base_url=f"http://127.0.0.1:{mock.server_address[1]}/v1")
+    retrieval, context_build, ttft, total = [], [], [], []
+    try:
+        for i in range(args.queries):
+            question = QUESTIONS[i % len(QUESTIONS)]
+            if i >= len(QUESTIONS):
+                question = f"{question} (follow-up {i // len(QUESTIONS)})"
+            (docs, _), elapsed = timed(retrieve, question)
+            retrieval.append(elapsed)
+            (context, _), elapsed = timed(build_context, docs, CONTEXT_TOKEN_BUDGET)
+            context_build.append(elapsed)
+            prompt = f"Medical Documents:\n{context}\n\nUser Question: {question}\n\nAnswer:"
+            stats = {}
+            for _ in iter_async(astream_chat_model(chat_model, prompt, stats), loop):
+                pass
+            ttft.append(retrieval[-1] + context_build[-1] + stats["ttft_ms"])
+            total.append(retrieval[-1] + context_build[-1] + stats["total_ms"])
+    finally:
+        mock.shutdown()
+        executor.shutdown()
+        loop.close()
+
+    metrics.update(latency_summary(retrieval, "retrieval"))
+    metrics.update(latency_summary(context_build, "context"))
+    metrics.update(latency_summary(ttft, "query_ttft"))
+    metrics.update(latency_summary(total, "query_total"))
+    print_metrics(metrics)
+    config = {**vars(args), "pages_per_document": page_counts}
+    path = save_results("medichat", metrics, config, higher_is_better=["ingest_pages_per_s"])
+    print(f"\nSaved {path}")
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
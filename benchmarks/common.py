@@ -0,0 +1,153 @@
+"""Shared helpers: load generation, percentiles and result files."""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+import http.client
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(q * len(sorted_values) / 100)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(samples_ms: Iterable[float], prefix: str) -> Dict[str, float]:
+    """``{prefix}_p50_ms`` ... ``{prefix}_max_ms`` and the mean, for a set of latencies."""
+    values = sorted(samples_ms)
+    summary = {f"{prefix}_{name}_ms": percentile(values, q) for name, q in (("p50", 50), ("p90", 90), ("p99", 99))}
+    summary[f"{prefix}_mean_ms"] = sum(values) / len(values) if values else 0.0
+    summary[f"{prefix}_max_ms"] = values[-1] if values else 0.0
+    return summary
+
+
+class HTTPLoad:
+    """Closed-loop load: ``concurrency`` threads, each on its own keep-alive connection."""
+
+    def __init__(self, base_url: str, concurrency: int = 8, timeout: float = 60.0):
+        url = urlparse(base_url)
+        self.host, self.port = url.hostname, url.port or 80
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if getattr(self._local, "connection", None) is None:
+            self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return self._local.connection
+
+    def request(self, method: str, path: str, body=None):
+        """Return ``(status, parsed JSON body or None, latency ms)``; status 0 on a transport error."""
+        data = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if data is not None else {}
+        start = time.perf_counter()
+        try:
+            connection = self._connection()
+            connection.request(method, path, body=data, headers=headers)
+            response = connection.getresponse()
+            raw = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self._local.connection = None
+            return 0, None, (time.perf_counter() - start) * 1000
+        latency = (time.perf_counter() - start) * 1000
+        try:
+            parsed = json.loads(raw) if raw else None
+        except ValueError:
+            parsed = None
+        return status, parsed, latency
+
+    def run(self, method: str, path: str, bodies: List[dict], prefix: str) -> Dict[str, float]:
+        """Send every body, ``concurrency`` at a time; return throughput, error rate and latency percentiles."""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            results = list(pool.map(lambda body: self.request(method, path, body), bodies))
+        wall = time.perf_counter() - start
+        ok = [latency for status, _, latency in results if 200 <= status < 300]
+        return {
+            f"{prefix}_requests": len(results),
+            f"{prefix}_throughput_per_s": len(ok) / wall if wall else 0.0,
+            f"{prefix}_error_rate": 1 - len(ok) / len(results) if results else 0.0,
+            **latency_summary(ok, prefix),
+        }
+
+
+def wait_for_http(url: str, timeout: float = 300.0, process: Optional[subprocess.Popen] = None):
+    """Poll ``url`` until it answers 200, failing early if ``process`` exits."""
+    parsed = urlparse(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before {url} was ready")
+        try:
+            connection = http.client.HTTPConnection(parsed.hostname, parsed.port, timeout=5)
+            connection.request("GET", parsed.path or "/")
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"{url} not ready after {timeout:.0f}s")
+
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                               capture_output=True, text=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def save_results(name: str, metrics: Dict[str, float], config: dict, higher_is_better: Iterable[str] = (),
+                 out_dir: str = RESULTS_DIR) -> str:
+    """Write ``{name}-{commit}-{timestamp}.json`` and return its path.
+
+    ``higher_is_better`` lists the metrics where an increase is an
+    improvement (throughput); every other metric is a cost (latency, errors).
+    """
+    commit = git_commit()
+    stamp = time.strftime("%Y%m%dT%H%M%S")
+    record = {
+        "benchmark": name,
+        "commit": commit,
+        "timestamp": stamp,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": config,
+        "metrics": metrics,
+        "higher_is_better": sorted(higher_is_better),
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"{name}-{commit}-{stamp}.json")
+    with open(path, "w") as f:
+        json.dump(record, f, indent=2)
+    return path
+
+
+def print_metrics(metrics: Dict[str, float]):
+    width = max(map(len, metrics), default=0)
+    for name, value in metrics.items():
+        print(f"{name:<{width}}  {value:,.3f}" if isinstance(value, float) else f"{name:<{width}}  {value}")
+
+
+def timed(fn: Callable, *args, **kwargs):
+    """Return ``(result, elapsed ms)``."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
@@ -0,0 +1,82 @@
+"""Compare benchmark results between two commits.
+
+    python benchmarks/compare.py baseline/ benchmarks/results/ --threshold 10
+    python benchmarks/compare.py fraud-abc123-....json fraud-def456-....json
+
+Each side is a result file or a directory, from which the newest result of
+every benchmark is taken. Latencies (``*_ms``), error rates, failed runs and
+the metrics a benchmark lists as ``higher_is_better`` are checked; any that
+moved the wrong way by more than ``--threshold`` percent is a regression and
+the exit code is 1. Other metrics (counts) are shown for context.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+
+def load(path: str) -> dict:
+    """``{benchmark: result}`` from one file, or the newest result per benchmark in a directory."""
+    files = sorted(glob.glob(os.path.join(path, "*.json"))) if os.path.isdir(path) else [path]
+    results = {}
+    for file in files:
+        with open(file) as f:
+            result = json.load(f)
+        current = results.get(result["benchmark"])
+        if current is None or result["timestamp"] >= current["timestamp"]:
+            results[result["benchmark"]] = result
+    return results
+
+
+def gated(name: str, higher_is_better) -> bool:
+    return (name in higher_is_better or name.endswith("_ms") or name.endswith("error_rate")
+            or name.endswith("failed_runs"))
+
+
+def compare(base: dict, head: dict, threshold: float):
+    """Yield ``(metric, base, head, change %, regressed)`` for metrics present on both sides."""
+    higher_is_better = set(head.get("higher_is_better", ())) | set(base.get("higher_is_better", ()))
+    for name, new in head["metrics"].items():
+        old = base["metrics"].get(name)
+        if not isinstance(old, (int, float)) or not isinstance(new, (int, float)):
+            continue
+        change = (new - old) / abs(old) * 100 if old else (0.0 if new == old else float("inf"))
+        if not gated(name, higher_is_better):
+            regressed = False
+        elif name in higher_is_better:
+            regressed = -change > threshold
+        else:
+            # Error rates and failed runs usually start at zero, so any new cost from zero counts
+            regressed = change > threshold
+        yield name, old, new, change, regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base", help="Baseline result file or directory")
+    parser.add_argument("head", help="Candidate result file or directory")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed change in percent")
+    args = parser.parse_args()
+
+    base, head = load(args.base), load(args.head)
+    regressions = 0
+    for benchmark in sorted(set(base) & set(head)):
+        print(f"\n{benchmark}: {base[benchmark]['commit']} -> {head[benchmark]['commit']}")
+        if base[benchmark].get("config") != head[benchmark].get("config"):
+            print("  warning: benchmark config differs between runs")
+        rows = list(compare(base[benchmark], head[benchmark], args.threshold))
+        width = max((len(row[0]) for row in rows), default=0)
+        for name, old, new, change, regressed in rows:
+            regressions += regressed
+            flag = "  REGRESSION" if regressed else ""
+            print(f"  {name:<{width}}  {old:>14,.3f}  {new:>14,.3f}  {change:+8.1f}%{flag}")
+    for benchmark in sorted(set(base) ^ set(head)):
+        print(f"\n{benchmark}: only in {'base' if benchmark in base else 'head'}, not compared")
+
+    print(f"\n{regressions} regression(s) beyond {args.threshold:g}%")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
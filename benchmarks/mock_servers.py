@@ -0,0 +1,286 @@
+"""Local stand-ins for the remote services the benchmarks would otherwise hit.
+
+    python benchmarks/mock_servers.py llm --port 8001 --latency-ms 300 --tokens-per-s 80
+    python benchmarks/mock_servers.py pinecone --port 8002 --latency-ms 20 --error-rate 0.01
+
+``llm`` is an OpenAI-compatible ``/chat/completions`` endpoint (JSON or SSE),
+usable for the Euri API, CrewAI and LangChain alike. ``pinecone`` serves the
+Pinecone data plane (upsert, query, fetch, delete, describe_index_stats)
+with exact cosine search in memory. Both inject latency and errors.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency_ms = 0.0
+    jitter_ms = 0.0
+    error_rate = 0.0
+    error_status = 503
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _inject(self) -> bool:
+        """Sleep for the configured latency; send an error and return True if one is injected."""
+        delay = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        time.sleep(max(delay, 0.0) / 1000)
+        if random.random() < self.error_rate:
+            headers = {"Retry-After": "1"} if self.error_status == 429 else None
+            self._send_json(self.error_status, {"error": {"message": "injected failure", "code": self.error_status}},
+                            headers)
+            return True
+        return False
+
+
+class MockLLMHandler(_MockHandler):
+    """OpenAI-compatible chat completions.
+
+    ``reply`` is ``echo`` (repeat the last user question) or ``final_answer``
+    (a ReAct ``Final Answer:`` block, which agent frameworks accept as a
+    finished step). Replies are padded to ``completion_tokens`` words.
+    """
+
+    tokens_per_s = 0.0
+    completion_tokens = 64
+    reply = "echo"
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+        request = self._read_json()
+        if self._inject():
+            return
+
+        messages = request.get("messages") or [{}]
+        prompt = " ".join(str(m.get("content") or "") for m in messages)
+        tokens = self._reply_tokens(str(messages[-1].get("content") or ""))
+        model = request.get("model", "mock")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        usage = {"prompt_tokens": len(prompt.split()), "completion_tokens": len(tokens),
+                 "total_tokens": len(prompt.split()) + len(tokens)}
+
+        if not request.get("stream"):
+            if self.tokens_per_s:
+                time.sleep(len(tokens) / self.tokens_per_s)
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": " ".join(tokens)}}],
+                "usage": usage,
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        for i, token in enumerate(tokens):
+            if self.tokens_per_s:
+                time.sleep(1 / self.tokens_per_s)
+            self._send_event(completion_id, model, {"content": token if i == 0 else " " + token}, None)
+        self._send_event(completion_id, model, {}, "stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _reply_tokens(self, question):
+        if self.reply == "final_answer":
+            head = ["Thought:", "I", "now", "know", "the", "final", "answer\nFinal", "Answer:"]
+        else:
+            question = question.rsplit("User Question:", 1)[-1].split("Answer:", 1)[0]
+            head = ["Mock", "answer", "to:"] + question.split()[:32]
+        filler = ["lorem", "ipsum", "dolor", "sit", "amet"]
+        padding = max(self.completion_tokens - len(head), 0)
+        return head + [filler[i % len(filler)] for i in range(padding)]
+
+    def _send_event(self, completion_id, model, delta, finish_reason):
+        body = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "finish_reason": finish_reason, "delta": delta}],
+        }
+        self.wfile.write(f"data: {json.dumps(body)}\n\n".encode())
+        self.wfile.flush()
+
+
+class MockPineconeHandler(_MockHandler):
+    """Pinecone data plane over an in-memory namespace -> {id: (unit vector, metadata)} map."""
+
+    namespaces = None
+    lock = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/describe_index_stats":
+            if not self._inject():
+                self._send_json(200, self._stats())
+        elif url.path == "/vectors/fetch":
+            if not self._inject():
+                query = parse_qs(url.query)
+                self._send_json(200, self._fetch(query.get("ids", []), query.get("namespace", [""])[0]))
+        else:
+            self._send_json(404, {"message": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        routes = {
+            "/vectors/upsert": self._upsert,
+            "/query": self._query,
+            "/vectors/delete": self._delete,
+            "/describe_index_stats": lambda body: self._stats(),
+        }
+        route = routes.get(urlparse(self.path).path)
+        if route is None:
+            self._send_json(404, {"message": f"unknown path {self.path}"})
+            return
+        body = self._read_json()
+        if not self._inject():
+            self._send_json(200, route(body))
+
+    def _namespace(self, name):
+        return self.namespaces.setdefault(name or "", {})
+
+    def _upsert(self, body):
+        import numpy as np
+
+        vectors = body.get("vectors", [])
+        with self.lock:
+            namespace = self._namespace(body.get("namespace"))
+            for v in vectors:
+                values = np.asarray(v["values"], dtype=np.float32)
+                namespace[v["id"]] = (values / max(float(np.linalg.norm(values)), 1e-12), v.get("metadata") or {})
+        return {"upsertedCount": len(vectors)}
+
+    def _query(self, body):
+        import numpy as np
+
+        with self.lock:
+            items = list(self._namespace(body.get("namespace")).items())
+        top_k = int(body.get("topK", 10))
+        if not items or "vector" not in body:
+            return {"matches": [], "namespace": body.get("namespace", "")}
+        query = np.asarray(body["vector"], dtype=np.float32)
+        query /= max(float(np.linalg.norm(query)), 1e-12)
+        scores = np.stack([vector for _, (vector, _) in items]) @ query
+        best = np.argsort(-scores)[:top_k]
+        matches = []
+        for i in best:
+            vector_id, (vector, metadata) = items[int(i)]
+            match = {"id": vector_id, "score": float(scores[i]), "values": []}
+            if body.get("includeMetadata"):
+                match["metadata"] = metadata
+            if body.get("includeValues"):
+                match["values"] = vector.tolist()
+            matches.append(match)
+        return {"matches": matches, "namespace": body.get("namespace", ""), "usage": {"readUnits": 5}}
+
+    def _fetch(self, ids, namespace):
+        with self.lock:
+            stored = self._namespace(namespace)
+            found = {i: stored[i] for i in ids if i in stored}
+        return {
+            "vectors": {i: {"id": i, "values": v.tolist(), "metadata": m} for i, (v, m) in found.items()},
+            "namespace": namespace,
+        }
+
+    def _delete(self, body):
+        with self.lock:
+            namespace = self._namespace(body.get("namespace"))
+            if body.get("deleteAll"):
+                namespace.clear()
+            for vector_id in body.get("ids", []):
+                namespace.pop(vector_id, None)
+        return {}
+
+    def _stats(self):
+        with self.lock:
+            counts = {name: len(vectors) for name, vectors in self.namespaces.items()}
+            dimension = next((len(v) for vectors in self.namespaces.values() for v, _ in vectors.values()), 0)
+        return {
+            "namespaces": {name: {"vectorCount": count} for name, count in counts.items()},
+            "dimension": dimension,
+            "indexFullness": 0.0,
+            "totalVectorCount": sum(counts.values()),
+        }
+
+
+HANDLERS = {"llm": MockLLMHandler, "pinecone": MockPineconeHandler}
+
+
+def start_server(kind: str, port: int = 0, **options) -> ThreadingHTTPServer:
+    """Serve a mock in a background thread; ``server.server_address[1]`` is the bound port.
+
+    ``options`` override handler attributes: ``latency_ms``, ``jitter_ms``,
+    ``error_rate``, ``error_status``, and for ``llm`` also ``tokens_per_s``,
+    ``completion_tokens`` and ``reply``.
+    """
+    base = HANDLERS[kind]
+    unknown = [name for name in options if not hasattr(base, name)]
+    if unknown:
+        raise ValueError(f"Unknown {kind} mock options: {', '.join(unknown)}")
+    if kind == "pinecone":
+        options = {**options, "namespaces": {}, "lock": threading.Lock()}
+    handler = type(f"Configured{base.__name__}", (base,), options)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("kind", choices=sorted(HANDLERS))
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--tokens-per-s", type=float, default=0.0, help="llm: streaming speed (0 = instant)")
+    parser.add_argument("--completion-tokens", type=int, default=64, help="llm: words per reply")
+    parser.add_argument("--reply", choices=["echo", "final_answer"], default="echo", help="llm: reply shape")
+    args = parser.parse_args()
+
+    options = {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "error_rate": args.error_rate,
+               "error_status": args.error_status}
+    if args.kind == "llm":
+        options.update(tokens_per_s=args.tokens_per_s, completion_tokens=args.completion_tokens, reply=args.reply)
+    server = start_server(args.kind, args.port, **options)
+    suffix = "/v1" if args.kind == "llm" else ""
+    print(f"Mock {args.kind} on http://127.0.0.1:{server.server_address[1]}{suffix}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
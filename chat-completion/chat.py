@@ -1,26 +1,89 @@
-import requests
-
-def generate_completion():
-    url = "https://api.euron.one/api/v1/euri/chat/completions"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer abkjbkjfdf"
-    }
-    payload = {
-        "messages": [
-            {
-                "role": "user",
-                "content": "How to do multithreading using GIL in python"
-            }
-        ],
-        "model": "gpt-4.1-nano",
-        "max_tokens": 1000,
-        "temperature": 0.7
-    }
-
-    response = requests.post(url, headers=headers, json=payload)
-    data = response.json()
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+
+from client import DEFAULT_MODEL, DEFAULT_URL, AsyncChatClient, ChatClient, iter_prompts
+
+DEFAULT_PROMPT = "How to do multithreading using GIL in python"
+
+
+def generate_completion(prompt=DEFAULT_PROMPT, client=None, **params):
+    """Print and return the full completion response for one prompt."""
+    own_client = client is None
+    client = client or ChatClient()
+    try:
+        data = client.complete(prompt, **params)
+    finally:
+        if own_client:
+            client.close()
     print(data)
+    return data
+
+
+def stream_completion(prompt=DEFAULT_PROMPT, client=None, **params):
+    """Print the completion as it streams and return the full text."""
+    own_client = client is None
+    client = client or ChatClient()
+    parts = []
+    try:
+        for content in client.stream(prompt, **params):
+            parts.append(content)
+            print(content, end="", flush=True)
+    finally:
+        if own_client:
+            client.close()
+    print()
+    return "".join(parts)
+
+
+async def batch_completion(prompts_file, out=None, concurrency=8, url=DEFAULT_URL, **params):
+    """
+    Complete every prompt in ``prompts_file`` with bounded concurrency.
+
+    Each JSONL result is written and flushed as soon as it completes, with
+    the prompt's ``index``, so an interrupted run keeps the work already done.
+    """
+    total = errors = 0
+    with (open(out, "w", encoding="utf-8") if out else contextlib.nullcontext(sys.stdout)) as f:
+        async with AsyncChatClient(url=url, pool_size=concurrency) as client:
+            async for index, prompt, result in client.complete_many(iter_prompts(prompts_file), concurrency,
+                                                                   **params):
+                total += 1
+                errors += "error" in result
+                f.write(json.dumps({"index": index, "prompt": prompt, "response": result}) + "\n")
+                f.flush()
+    print(f"{total - errors}/{total} prompts completed", file=sys.stderr)
+    return total, errors
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate chat completions with the Euri API.")
+    parser.add_argument("prompt", nargs="?", default=DEFAULT_PROMPT, help="Prompt for a single completion")
+    parser.add_argument("--stream", action="store_true", help="Stream the completion as it is generated")
+    parser.add_argument("--prompts-file", help="Batch mode: one prompt per line, or JSONL with 'prompt'/'messages'")
+    parser.add_argument("--out", help="Batch mode: write JSONL results here instead of stdout")
+    parser.add_argument("--concurrency", type=int, default=8, help="Batch mode: requests in flight at once")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Chat completions endpoint")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--max-tokens", type=int, default=1000)
+    parser.add_argument("--temperature", type=float, default=0.7)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    params = {"model": args.model, "max_tokens": args.max_tokens, "temperature": args.temperature}
+    if args.prompts_file:
+        asyncio.run(batch_completion(args.prompts_file, args.out, args.concurrency, args.url, **params))
+        return
+    with ChatClient(url=args.url) as client:
+        if args.stream:
+            stream_completion(args.prompt, client, **params)
+        else:
+            generate_completion(args.prompt, client, **params)
+
 
 if __name__ == "__main__":
-  generate_completion()
+    main()
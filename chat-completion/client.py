@@ -0,0 +1,310 @@
+"""
+client.py - Reusable client for the Euri chat completions endpoint.
+
+ChatClient keeps one pooled keep-alive session for sync calls, AsyncChatClient
+shares an httpx connection pool across coroutines. Both retry 429 and 5xx
+responses with exponential backoff and can stream tokens over SSE.
+"""
+import asyncio
+import json
+import os
+import random
+import time
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+DEFAULT_URL = "https://api.euron.one/api/v1/euri/chat/completions"
+DEFAULT_MODEL = "gpt-4.1-nano"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+Messages = Union[str, List[Dict[str, str]]]
+
+
+class ChatCompletionError(RuntimeError):
+    """Raised when a request fails after all retries."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+def _messages(prompt: Messages) -> List[Dict[str, str]]:
+    return [{"role": "user", "content": prompt}] if isinstance(prompt, str) else prompt
+
+
+def _backoff(attempt: int, base: float, cap: float, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry ``attempt``: Retry-After if the server sent one, else jittered exponential."""
+    if retry_after:
+        try:
+            return min(float(retry_after), cap)
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+_DONE = object()
+
+
+def _sse_event(line: str):
+    """Content delta of one OpenAI-style event stream line, ``_DONE`` at the end, else None."""
+    if not line or not line.startswith("data:"):
+        return None
+    data = line[5:].strip()
+    if data == "[DONE]":
+        return _DONE
+    choices = json.loads(data).get("choices") or [{}]
+    return (choices[0].get("delta") or {}).get("content") or None
+
+
+def content_of(response: dict) -> str:
+    """Text of the first choice of a completion response."""
+    return response["choices"][0]["message"]["content"]
+
+
+class _ClientConfig:
+    """Settings and payload building shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        url: str = DEFAULT_URL,
+        model: str = DEFAULT_MODEL,
+        timeout: float = 60.0,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        pool_size: int = 10,
+    ):
+        self.url = url
+        self.model = model
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.pool_size = pool_size
+        self.headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key or os.getenv('EURI_API_KEY', '')}",
+        }
+
+    def payload(self, prompt: Messages, stream: bool = False, **params) -> dict:
+        return {
+            "messages": _messages(prompt),
+            "model": params.pop("model", self.model),
+            "max_tokens": params.pop("max_tokens", 1000),
+            "temperature": params.pop("temperature", 0.7),
+            **({"stream": True} if stream else {}),
+            **params,
+        }
+
+
+class ChatClient(_ClientConfig):
+    """
+    Synchronous client with a pooled keep-alive session.
+
+    Args:
+        api_key: Bearer token; defaults to the EURI_API_KEY environment variable
+        url: Chat completions endpoint
+        model: Default model for requests
+        timeout: Connect and read timeout in seconds
+        max_retries: Retries for 429, 5xx and connection errors
+        backoff: Base delay in seconds, doubled on every retry
+        max_backoff: Longest delay between retries, in seconds
+        pool_size: Connections kept alive in the session pool
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _post(self, payload: dict, stream: bool = False) -> requests.Response:
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(self.url, json=payload, timeout=self.timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == self.max_retries:
+                    raise ChatCompletionError(f"Request failed: {exc}") from exc
+                time.sleep(_backoff(attempt, self.backoff, self.max_backoff))
+                continue
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+                time.sleep(_backoff(attempt, self.backoff, self.max_backoff, retry_after))
+                continue
+            if response.status_code >= 400:
+                raise ChatCompletionError(f"HTTP {response.status_code}: {response.text[:500]}", response.status_code)
+            return response
+        raise AssertionError("unreachable")
+
+    def complete(self, prompt: Messages, **params) -> dict:
+        """Return the full completion response for a prompt or message list."""
+        return self._post(self.payload(prompt, **params)).json()
+
+    def stream(self, prompt: Messages, **params) -> Iterator[str]:
+        """Yield content deltas as the server streams them."""
+        response = self._post(self.payload(prompt, stream=True, **params), stream=True)
+        with response:
+            for line in response.iter_lines(decode_unicode=True):
+                content = _sse_event(line)
+                if content is _DONE:
+                    return
+                if content:
+                    yield content
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncChatClient(_ClientConfig):
+    """
+    asyncio client over one shared httpx connection pool.
+
+    Takes the same arguments as ChatClient; ``pool_size`` also bounds the
+    connections open at once. Requires ``httpx``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        if httpx is None:
+            raise ImportError("AsyncChatClient requires httpx: pip install httpx")
+        super().__init__(*args, **kwargs)
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+        )
+
+    async def _send(self, payload: dict, stream: bool = False):
+        for attempt in range(self.max_retries + 1):
+            try:
+                request = self.client.build_request("POST", self.url, json=payload)
+                response = await self.client.send(request, stream=stream)
+            except httpx.TransportError as exc:
+                if attempt == self.max_retries:
+                    raise ChatCompletionError(f"Request failed: {exc}") from exc
+                await asyncio.sleep(_backoff(attempt, self.backoff, self.max_backoff))
+                continue
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                retry_after = response.headers.get("Retry-After")
+                await response.aclose()
+                await asyncio.sleep(_backoff(attempt, self.backoff, self.max_backoff, retry_after))
+                continue
+            if response.status_code >= 400:
+                body = (await response.aread()).decode("utf-8", "replace")
+                await response.aclose()
+                raise ChatCompletionError(f"HTTP {response.status_code}: {body[:500]}", response.status_code)
+            return response
+        raise AssertionError("unreachable")
+
+    async def complete(self, prompt: Messages, **params) -> dict:
+        response = await self._send(self.payload(prompt, **params))
+        return response.json()
+
+    async def stream(self, prompt: Messages, **params) -> AsyncIterator[str]:
+        response = await self._send(self.payload(prompt, stream=True, **params), stream=True)
+        try:
+            async for line in response.aiter_lines():
+                content = _sse_event(line)
+                if content is _DONE:
+                    return
+                if content:
+                    yield content
+        finally:
+            await response.aclose()
+
+    async def complete_many(
+        self, prompts: Iterable[Messages], concurrency: int = 8, **params
+    ) -> AsyncIterator[Tuple[int, Messages, dict]]:
+        """
+        Complete prompts on ``concurrency`` workers, yielding ``(index, prompt, result)`` as each finishes.
+
+        Prompts are taken from the iterable only as workers free up, so a
+        large batch is never held in memory. Results arrive in completion
+        order; ``index`` is the prompt's position in the input. A prompt that
+        fails for any reason yields ``{"error": ..., "status": ...}`` instead
+        of raising.
+        """
+        todo = asyncio.Queue(maxsize=concurrency)
+        done = asyncio.Queue(maxsize=concurrency)
+
+        async def stop_workers():
+            for _ in range(concurrency):
+                await todo.put(None)
+
+        async def feed():
+            # Not on cancellation: the workers are being cancelled too
+            try:
+                for item in enumerate(prompts):
+                    await todo.put(item)
+            except Exception:
+                await stop_workers()
+                raise
+            await stop_workers()
+
+        async def work():
+            while (item := await todo.get()) is not None:
+                index, prompt = item
+                try:
+                    result = await self.complete(prompt, **params)
+                except ChatCompletionError as exc:
+                    result = {"error": str(exc), "status": exc.status}
+                except Exception as exc:
+                    result = {"error": f"{type(exc).__name__}: {exc}", "status": None}
+                await done.put((index, prompt, result))
+            await done.put(None)
+
+        feeder = asyncio.create_task(feed())
+        workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+        try:
+            running = concurrency
+            while running:
+                item = await done.get()
+                if item is None:
+                    running -= 1
+                else:
+                    yield item
+            # Re-raise a failure reading the prompts, after everything read so far
+            await feeder
+        finally:
+            for task in [feeder, *workers]:
+                task.cancel()
+            await asyncio.gather(feeder, *workers, return_exceptions=True)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+def iter_prompts(path: str) -> Iterator[Messages]:
+    """Prompts from a file, read lazily: one per line, or JSONL with a ``prompt`` or ``messages`` field."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                record = json.loads(line)
+                yield record.get("messages") or record["prompt"]
+            else:
+                yield line
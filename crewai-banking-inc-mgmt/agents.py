@@ -1,14 +1,45 @@
+import threading
+from typing import List, Optional
 from crewai import Agent
 from crewai.llm import LLM
-from config import OPENAI_API_KEY, MODEL
-
-
-def get_llm():
-    """Initialize and return the LLM instance."""
-    return LLM(
-        model=MODEL,
-        api_key=OPENAI_API_KEY,
-    )
+from crewai.tools import BaseTool
+from config import (
+    CREW_VERBOSE,
+    LLM_CACHE_MODE,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_S,
+    LLM_CACHE_MAX_ENTRIES,
+)
+from llm_cache import CachedLLM, ResponseCache
+from routing import get_router
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide LLM response cache."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(LLM_CACHE_PATH, LLM_CACHE_TTL_S, LLM_CACHE_MAX_ENTRIES)
+        return _response_cache
+
+
+def get_llm(agent: Optional[str] = None):
+    """
+    Return the LLM for an agent, routed to its model tier.
+
+    Args:
+        agent: Task name the agent works on (a key of AGENT_TIERS)
+
+    Returns:
+        The routed LLM, wrapped in the response cache unless LLM_CACHE_MODE is off
+    """
+    llm = get_router().llm_for(agent)
+    if LLM_CACHE_MODE == "off":
+        return llm
+    return CachedLLM(llm, get_response_cache(), LLM_CACHE_MODE)
 
 
 def create_triage_lead(llm: LLM) -> Agent:
@@ -22,7 +53,7 @@ def create_triage_lead(llm: LLM) -> Agent:
             "You ensure regulatory compliance and customer trust are maintained."
         ),
         llm=llm,
-        verbose=True,
+        verbose=CREW_VERBOSE,
     )
 
 
@@ -37,11 +68,11 @@ def create_support_analyst(llm: LLM) -> Agent:
             "You infer transaction types, merchant categories, and time windows from sparse reports."
         ),
         llm=llm,
-        verbose=True,
+        verbose=CREW_VERBOSE,
     )
 
 
-def create_sre_infra(llm: LLM) -> Agent:
+def create_sre_infra(llm: LLM, tools: Optional[List[BaseTool]] = None) -> Agent:
     """Create the Banking Infrastructure & Security Analyst agent."""
     return Agent(
         role="Banking Infrastructure & Security Analyst",
@@ -52,11 +83,12 @@ def create_sre_infra(llm: LLM) -> Agent:
             "You propose safe mitigations that don't compromise security or compliance."
         ),
         llm=llm,
-        verbose=True,
+        tools=tools or [],
+        verbose=CREW_VERBOSE,
     )
 
 
-def create_backend_analyst(llm: LLM) -> Agent:
+def create_backend_analyst(llm: LLM, tools: Optional[List[BaseTool]] = None) -> Agent:
     """Create the Banking Backend & Financial Data Analyst agent."""
     return Agent(
         role="Banking Backend & Financial Data Analyst",
@@ -67,7 +99,8 @@ def create_backend_analyst(llm: LLM) -> Agent:
             "You ensure regulatory compliance in all fixes."
         ),
         llm=llm,
-        verbose=True,
+        tools=tools or [],
+        verbose=CREW_VERBOSE,
     )
 
 
@@ -82,7 +115,7 @@ def create_qa_lead(llm: LLM) -> Agent:
             "You write crisp reproduction steps and acceptance criteria for banking scenarios."
         ),
         llm=llm,
-        verbose=True,
+        verbose=CREW_VERBOSE,
     )
 
 
@@ -97,7 +130,7 @@ def create_tech_lead(llm: LLM) -> Agent:
             "You coordinate between transaction processing, fraud, and security teams."
         ),
         llm=llm,
-        verbose=True,
+        verbose=CREW_VERBOSE,
     )
 
 
@@ -112,5 +145,5 @@ def create_comms_manager(llm: LLM) -> Agent:
             "You ensure all communications comply with banking regulations and privacy laws."
         ),
         llm=llm,
-        verbose=True,
+        verbose=CREW_VERBOSE,
     )
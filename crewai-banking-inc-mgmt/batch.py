@@ -0,0 +1,159 @@
+"""
+batch.py - Batch and streaming incident processing for large complaint volumes.
+
+Complaints are grouped into incident buckets by keyword signature before any
+agent runs, and one crew runs per bucket, so LLM cost follows the number of
+distinct incidents rather than the number of complaints.
+"""
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from complaints import format_complaints
+
+STOPWORDS = frozenset(
+    "a about after again all am an and any are as at be been before being but by can could did do does "
+    "during for from had has have having i if in into is it its just me my no not of on or our so some still "
+    "than that the their them then there this to too very was we were what when which while who why "
+    "will with without would you your".split()
+)
+
+
+def _stem(word: str) -> str:
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[: -len(suffix)]
+    return word
+
+
+def signature(complaint: str) -> frozenset:
+    """Keyword signature of a complaint: stemmed, lowercased, stopwords removed."""
+    words = re.findall(r"[a-z0-9]+", complaint.lower())
+    return frozenset(_stem(w) for w in words if w not in STOPWORDS and len(w) > 2)
+
+
+def cluster_complaints(complaints: Iterable[str], threshold: float = 0.25) -> List[Dict]:
+    """
+    Group complaints into incident buckets with single-pass leader clustering.
+
+    A complaint joins the bucket whose leading keywords it overlaps most
+    (Jaccard similarity at least ``threshold``), otherwise it starts a new
+    bucket. An inverted index from keyword to bucket keeps this linear.
+
+    Returns:
+        List[Dict]: Buckets with ``complaints`` and ``keywords``, largest first
+    """
+    buckets: List[Dict] = []
+    by_keyword: Dict[str, set] = {}
+    for complaint in complaints:
+        sig = signature(complaint)
+        candidates = set().union(*(by_keyword.get(word, ()) for word in sig)) if sig else set()
+        best, best_score = None, 0.0
+        for index in candidates:
+            leading = buckets[index]["leading"]
+            score = len(sig & leading) / len(sig | leading)
+            if score > best_score:
+                best, best_score = index, score
+        if best is None or best_score < threshold:
+            best = len(buckets)
+            buckets.append({"complaints": [], "terms": Counter(), "leading": sig})
+        bucket = buckets[best]
+        bucket["complaints"].append(complaint)
+        bucket["terms"].update(sig)
+        bucket["leading"] = frozenset(w for w, _ in bucket["terms"].most_common(max(len(sig), 6)))
+        for word in sig:
+            by_keyword.setdefault(word, set()).add(best)
+
+    buckets.sort(key=lambda b: len(b["complaints"]), reverse=True)
+    return [
+        {"complaints": b["complaints"], "keywords": [w for w, _ in b["terms"].most_common(5)]}
+        for b in buckets
+    ]
+
+
+def bucket_complaint_text(bucket: Dict, max_examples: int = 10) -> str:
+    """Complaint text for one bucket: a few representative complaints plus the volume."""
+    examples = list(dict.fromkeys(bucket["complaints"]))[:max_examples]
+    text = format_complaints(examples)
+    total = len(bucket["complaints"])
+    if total > len(examples):
+        text += f"\n(+{total - len(examples)} similar complaints; {total} total in this incident bucket)"
+    return text
+
+
+def run_buckets(
+    buckets: List[Dict],
+    run_crew: Callable[[str], str],
+    workers: int = 4,
+    max_examples: int = 10,
+) -> List[Dict]:
+    """Run one crew per bucket in a bounded worker pool; failures are recorded, not raised."""
+
+    def run(bucket):
+        start = time.perf_counter()
+        try:
+            report, error = str(run_crew(bucket_complaint_text(bucket, max_examples))), None
+        except Exception as exc:
+            report, error = None, f"{type(exc).__name__}: {exc}"
+        return {**bucket, "report": report, "error": error, "seconds": time.perf_counter() - start}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="incident-bucket") as pool:
+        return list(pool.map(run, buckets))
+
+
+def merge_reports(results: List[Dict]) -> str:
+    """Consolidate per-bucket crew reports into one incident report."""
+    total = sum(len(r["complaints"]) for r in results)
+    lines = [
+        "# Consolidated Incident Report",
+        "",
+        f"{total} complaints grouped into {len(results)} incident buckets.",
+        "",
+        "| # | Complaints | Keywords | Status |",
+        "|---|-----------|----------|--------|",
+    ]
+    for i, result in enumerate(results, 1):
+        status = "failed" if result["error"] else f"ok ({result['seconds']:.0f}s)"
+        lines.append(f"| {i} | {len(result['complaints'])} | {', '.join(result['keywords'])} | {status} |")
+    for i, result in enumerate(results, 1):
+        lines += [
+            "",
+            f"## Incident bucket {i}: {', '.join(result['keywords'])}",
+            "",
+            bucket_complaint_text(result, max_examples=5),
+            "",
+            result["report"] if result["report"] is not None else f"**Crew run failed:** {result['error']}",
+        ]
+    return "\n".join(lines)
+
+
+def iter_windows(complaints: Iterable[str], window_size: int, window_seconds: float) -> Iterator[List[str]]:
+    """
+    Group a complaint stream into windows of ``window_size`` complaints.
+
+    A window is also closed once ``window_seconds`` have passed since it
+    opened, checked as each complaint arrives.
+    """
+    window: List[str] = []
+    opened = time.monotonic()
+    for complaint in complaints:
+        if not window:
+            opened = time.monotonic()
+        window.append(complaint)
+        if len(window) >= window_size or time.monotonic() - opened >= window_seconds:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
+def process_complaints(
+    complaints: Iterable[str],
+    run_crew: Callable[[str], str],
+    workers: int = 4,
+    threshold: float = 0.25,
+) -> str:
+    """Cluster complaints, run one crew per bucket and return the merged report."""
+    return merge_reports(run_buckets(cluster_complaints(complaints, threshold), run_crew, workers))
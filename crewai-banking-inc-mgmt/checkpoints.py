@@ -0,0 +1,73 @@
+"""
+checkpoints.py - Persist task outputs so crew runs can resume.
+
+A checkpoint is keyed by task name and a fingerprint of everything the task
+sees: its prompt, its agent and model, the outputs of its upstream tasks,
+the digest budget its output is compressed to and, for agents with tools,
+the tool data. Changing any of these therefore re-runs the task and
+everything downstream, while unchanged tasks are loaded from disk.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import List, Optional
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+
+from config import UPSTREAM_DIGEST_TOKENS
+from tools import get_toolbox
+
+
+def task_fingerprint(task: Task, upstream: List[TaskOutput]) -> str:
+    """Hash of a task's prompt, agent, model, upstream outputs, digest budget and tool data."""
+    agent = task.agent
+    parts = [
+        task.description,
+        task.expected_output,
+        agent.role,
+        agent.goal,
+        agent.backstory,
+        str(getattr(agent.llm, "model", "")),
+        *(output.raw for output in upstream),
+        f"digest={UPSTREAM_DIGEST_TOKENS}",
+        get_toolbox().data_fingerprint if agent.tools else "",
+    ]
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class CheckpointStore:
+    """One JSON file per task output under ``path``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, name: str, fingerprint: str) -> str:
+        return os.path.join(self.path, f"{name}-{fingerprint[:16]}.json")
+
+    def load(self, task: Task, name: str, fingerprint: str) -> Optional[TaskOutput]:
+        """Return the checkpointed output of ``name`` for this fingerprint, if any."""
+        path = self._file(name, fingerprint)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            record = json.load(f)
+        if record.get("fingerprint") != fingerprint:
+            return None
+        return TaskOutput(description=task.description, agent=task.agent.role, raw=record["raw"])
+
+    def save(self, name: str, fingerprint: str, output: TaskOutput):
+        path = self._file(name, fingerprint)
+        record = {"task": name, "fingerprint": fingerprint, "raw": output.raw, "created": time.time()}
+        with self._lock:
+            with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(record, f, indent=2)
+            os.replace(f"{path}.tmp", path)
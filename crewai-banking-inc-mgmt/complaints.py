@@ -1,3 +1,7 @@
+import csv
+import json
+from typing import Iterable, Iterator, List
+
 COMPLAINTS = [
     "Card transaction declined despite having sufficient balance",
     "Unauthorized transactions detected but credit not reversed for 2 weeks",
@@ -7,3 +11,40 @@ COMPLAINTS = [
 ]
 
 COMPLAINT_TEXT = "\n".join([f"- {c}" for c in COMPLAINTS])
+
+
+def format_complaints(complaints: List[str]) -> str:
+    """Render complaints as the bullet list used in task prompts."""
+    return "\n".join([f"- {c}" for c in complaints])
+
+
+def _parse_line(line: str) -> str:
+    line = line.strip()
+    if line.startswith("{"):
+        record = json.loads(line)
+        return str(record.get("complaint") or record.get("text") or "").strip()
+    return line
+
+
+def iter_complaints(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield complaints from plain-text or JSON-lines input, one per line.
+
+    JSON lines use their ``complaint`` or ``text`` field; blank lines are skipped.
+    """
+    for line in lines:
+        complaint = _parse_line(line)
+        if complaint:
+            yield complaint
+
+
+def load_complaints(path: str) -> List[str]:
+    """Load complaints from a .txt, .jsonl or .csv (``complaint`` or ``text`` column) file."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            return [
+                (row.get("complaint") or row.get("text") or "").strip()
+                for row in csv.DictReader(f)
+                if (row.get("complaint") or row.get("text") or "").strip()
+            ]
+        return list(iter_complaints(f))
@@ -6,6 +6,95 @@ load_dotenv()
 # API Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "your-api-key-here")
 MODEL = "gpt-4o-mini"
+# OpenAI-compatible endpoint override, e.g. a local mock server
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
+
+
+def _optional_int(name):
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+# Model tiers: each agent is routed to one. A tier that times out falls back
+# to its ``fallback`` tier; ``concurrency`` caps its in-flight calls. The fast
+# tier defaults to a cheaper model; completions are uncapped unless
+# MAX_TOKENS_<TIER> is set.
+MODEL_TIERS = {
+    "fast": {
+        "model": os.getenv("MODEL_FAST", "gpt-4.1-nano"),
+        "max_tokens": _optional_int("MAX_TOKENS_FAST"),
+        "timeout_s": float(os.getenv("TIMEOUT_FAST_S", "30")),
+        "concurrency": int(os.getenv("CONCURRENCY_FAST", "8")),
+        "fallback": "standard",
+    },
+    "standard": {
+        "model": os.getenv("MODEL_STANDARD", MODEL),
+        "max_tokens": _optional_int("MAX_TOKENS_STANDARD"),
+        "timeout_s": float(os.getenv("TIMEOUT_STANDARD_S", "60")),
+        "concurrency": int(os.getenv("CONCURRENCY_STANDARD", "4")),
+        "fallback": "fast",
+    },
+    "strong": {
+        "model": os.getenv("MODEL_STRONG", MODEL),
+        "max_tokens": _optional_int("MAX_TOKENS_STRONG"),
+        "timeout_s": float(os.getenv("TIMEOUT_STRONG_S", "120")),
+        "concurrency": int(os.getenv("CONCURRENCY_STRONG", "2")),
+        "fallback": "standard",
+    },
+}
+
+# Tier per agent, keyed by task name; override with e.g. AGENT_TIERS="qa=standard,plan=strong"
+AGENT_TIERS = {
+    "context": "fast",
+    "support": "standard",
+    "sre": "standard",
+    "backend": "standard",
+    "qa": "fast",
+    "comms": "fast",
+    "plan": "strong",
+}
+AGENT_TIERS.update(
+    item.split("=", 1) for item in os.getenv("AGENT_TIERS", "").replace(" ", "").split(",") if "=" in item
+)
+
+# USD per 1M (input, output) tokens, for the per-agent cost report
+MODEL_PRICES_PER_1M = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+}
+
+# Rate-limit retries per call, with exponential backoff from LLM_BACKOFF_S
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "4"))
+LLM_BACKOFF_S = float(os.getenv("LLM_BACKOFF_S", "1.0"))
+
+# Agent and crew verbose logging (off by default: it prints every step)
+CREW_VERBOSE = os.getenv("CREW_VERBOSE", "false").lower() in ("1", "true", "yes")
+
+# LLM response cache: off | read_write | record | replay
+LLM_CACHE_MODE = os.getenv("LLM_CACHE_MODE", "off")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache.sqlite")
+LLM_CACHE_TTL_S = float(os.getenv("LLM_CACHE_TTL_S", "0"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+
+# Dependency-graph mode: how many independent tasks may run at once
+MAX_TASK_CONCURRENCY = int(os.getenv("MAX_TASK_CONCURRENCY", "4"))
+
+# Context compression: token budgets for the context task's ORG_CONTEXT digest
+# and for each upstream output handed downstream (0 passes outputs through in full)
+ORG_CONTEXT_TOKEN_BUDGET = int(os.getenv("ORG_CONTEXT_TOKEN_BUDGET", "400"))
+UPSTREAM_DIGEST_TOKENS = int(os.getenv("UPSTREAM_DIGEST_TOKENS", "400"))
+
+# Task output checkpoints for --resume and --rerun
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", ".checkpoints")
+
+# Investigation tools backed by local stand-ins (logs, metrics, SQLite)
+TOOLS_DATA_DIR = os.getenv("TOOLS_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_data"))
+TOOLS_DB_PATH = os.getenv("TOOLS_DB_PATH", os.path.join(TOOLS_DATA_DIR, "banking.sqlite"))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+TOOL_CACHE_SIZE = int(os.getenv("TOOL_CACHE_SIZE", "256"))
+TOOL_WORKERS = int(os.getenv("TOOL_WORKERS", "4"))
 
 # Organization Context
 ORG_CONTEXT = {
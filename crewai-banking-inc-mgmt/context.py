@@ -0,0 +1,152 @@
+"""
+context.py - Token-budgeted context for crew tasks.
+
+The context task's ORG_CONTEXT is rendered compactly instead of as indented
+JSON, and upstream outputs are reduced to extractive digests before they are
+handed downstream, so prompts stop growing with the transcript.
+"""
+import re
+from typing import Dict, List, Optional
+
+from crewai import Task
+
+from config import MODEL, ORG_CONTEXT
+
+try:
+    from litellm import token_counter
+except ImportError:
+    token_counter = None
+
+_HEADING_RE = re.compile(r"^(#+\s|[A-Z]\)|\*\*[^*]+\*\*:?$|[^a-z]{3,60}:$)")
+_ITEM_RE = re.compile(r"^([-*•]|\d+[.)])\s")
+_SIGNAL_RE = re.compile(r"\b(P[0-2]|root cause|confidence|mitigat\w*|rollback|severity|owner)\b", re.I)
+
+
+def count_tokens(text: str, model: str = MODEL) -> int:
+    """Tokens of ``text`` for ``model`` via litellm (CrewAI's LLM layer), else ~4 characters per token."""
+    if token_counter is not None:
+        try:
+            return token_counter(model=model, text=text)
+        except Exception:
+            pass
+    return (len(text) + 3) // 4
+
+
+def _clip(text: str, budget: int) -> str:
+    """The longest word prefix of ``text`` that fits ``budget`` tokens with a trailing "…"."""
+    if count_tokens(text) <= budget:
+        return text
+    words = text.split(" ")
+    low, high = 0, len(words) - 1
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_tokens(" ".join(words[:middle]) + " …") <= budget:
+            low = middle
+        else:
+            high = middle - 1
+    return " ".join(words[:low]) + " …"
+
+
+def _compact(value) -> str:
+    if isinstance(value, dict):
+        return " | ".join(_compact(v) for v in value.values())
+    if isinstance(value, list):
+        return "; ".join(_compact(v) for v in value)
+    return str(value)
+
+
+def _render_section(name: str, value) -> List[str]:
+    if isinstance(value, dict):
+        return [f"{name}: " + "; ".join(f"{k} {_compact(v)}" for k, v in value.items())]
+    if isinstance(value, list):
+        return [f"{name}:"] + [f"- {_compact(item)}" for item in value]
+    return [f"{name}: {value}"]
+
+
+def org_digest(budget: int = 400, sections: Optional[List[str]] = None) -> str:
+    """
+    Compact rendering of ORG_CONTEXT within ``budget`` tokens.
+
+    ``sections`` limits it to some top-level keys (dotted names select one
+    subkey); by default every section is rendered. Whole lines are kept
+    until the budget runs out.
+    """
+    lines = []
+    for section in sections or list(ORG_CONTEXT):
+        key, _, subkey = section.partition(".")
+        value = ORG_CONTEXT[key][subkey] if subkey else ORG_CONTEXT[key]
+        lines += _render_section(section, value)
+    kept, used = [], 0
+    for line in lines:
+        cost = count_tokens(line) + 1
+        if used + cost > budget:
+            if budget - used > 8:
+                kept.append(_clip(line, budget - used - 1))
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept)
+
+
+def _line_priority(line: str) -> int:
+    if _HEADING_RE.match(line):
+        return 3
+    if _SIGNAL_RE.search(line):
+        return 2
+    if _ITEM_RE.match(line):
+        return 1
+    return 0
+
+
+def digest_output(text: str, budget: int, max_line_tokens: int = 60) -> str:
+    """
+    Extractive digest of a task output within ``budget`` tokens.
+
+    Blank and repeated lines are dropped. If the rest still does not fit,
+    headings, then lines carrying priorities, causes or mitigations, then list
+    items are kept first, in their original order. ``budget <= 0`` disables it.
+    """
+    if budget <= 0:
+        return text
+    lines = list(dict.fromkeys(" ".join(line.split()) for line in text.splitlines()))
+    lines = [line for line in lines if line]
+    if count_tokens("\n".join(lines)) <= budget:
+        return "\n".join(lines)
+    lines = [_clip(line, max_line_tokens) for line in lines]
+    keep, used = set(), 0
+    for i in sorted(range(len(lines)), key=lambda i: (-_line_priority(lines[i]), i)):
+        cost = count_tokens(lines[i]) + 1
+        if used + cost <= budget:
+            keep.add(i)
+            used += cost
+    return "\n".join(lines[i] for i in sorted(keep))
+
+
+def prompt_token_report(tasks: Dict[str, Task], dependencies: Dict[str, List[str]]) -> Dict[str, Dict[str, int]]:
+    """
+    Estimate prompt tokens per task after a run.
+
+    ``instructions`` covers the agent's role, goal and backstory plus the task
+    description; ``context`` covers the upstream outputs the task received.
+    """
+    report = {}
+    for name, task in tasks.items():
+        agent = task.agent
+        instructions = count_tokens(
+            f"{agent.role}\n{agent.goal}\n{agent.backstory}\n{task.description}\n{task.expected_output}"
+        )
+        context = sum(
+            count_tokens(tasks[u].output.raw) for u in dependencies[name] if tasks[u].output is not None
+        )
+        report[name] = {"instructions": instructions, "context": context, "total": instructions + context}
+    return report
+
+
+def format_token_report(report: Dict[str, Dict[str, int]]) -> str:
+    """Render a prompt token report as a table."""
+    lines = [f"{'task':<10} {'instructions':>12} {'context':>8} {'total':>8}"]
+    for name, row in report.items():
+        lines.append(f"{name:<10} {row['instructions']:>12} {row['context']:>8} {row['total']:>8}")
+    total = sum(row["total"] for row in report.values())
+    lines.append(f"{'all':<10} {'':>12} {'':>8} {total:>8}")
+    return "\n".join(lines)
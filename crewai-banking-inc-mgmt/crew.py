@@ -1,4 +1,7 @@
-from crewai import Crew, Process
+import time
+from typing import Dict, List, Optional
+from crewai import Crew, Process, Task
+from crewai.tasks.task_output import TaskOutput
 from agents import (
     get_llm,
     create_triage_lead,
@@ -18,40 +21,173 @@ from tasks import (
     create_task5_comms,
     create_task6_plan,
 )
+from config import CREW_VERBOSE, MAX_TASK_CONCURRENCY, UPSTREAM_DIGEST_TOKENS
+from complaints import COMPLAINT_TEXT
+from context import digest_output, prompt_token_report
+from checkpoints import CheckpointStore, task_fingerprint
+from dag import format_context, run_dag, topological_order
+from tools import backend_tools, sre_tools
+from tracing import get_tracer
 
+# Upstream tasks each task needs. The SRE, backend, QA and comms analyses only
+# depend on triage and support, so they can run side by side.
+TASK_DEPENDENCIES: Dict[str, List[str]] = {
+    "context": [],
+    "support": ["context"],
+    "sre": ["context", "support"],
+    "backend": ["context", "support"],
+    "qa": ["context", "support"],
+    "comms": ["context", "support"],
+    "plan": ["context", "support", "sre", "backend", "qa", "comms"],
+}
 
-def create_crew() -> Crew:
+
+def _task_callback(name: str, digest_tokens: Optional[int]):
+    """Close the task's trace span and, for tasks with downstream consumers, digest the output."""
+
+    def callback(output: TaskOutput):
+        get_tracer().task_finished(name)
+        if digest_tokens is not None:
+            output.raw = digest_output(output.raw, digest_tokens)
+
+    return callback
+
+
+def create_task_graph(complaint_text: str = COMPLAINT_TEXT) -> Dict[str, Task]:
+    """
+    Create all agents and tasks, keyed by task name.
+
+    Task ``context`` is left unset, so the sequential crew keeps handing
+    each task every earlier output; the dependency-graph runner passes only
+    the TASK_DEPENDENCIES outputs itself. Every task with a downstream
+    consumer digests its output to UPSTREAM_DIGEST_TOKENS before that
+    consumer reads it.
+
+    Args:
+        complaint_text: Complaints to analyze, formatted as a bullet list
+
+    Returns:
+        Dict[str, Task]: Tasks in sequential order
+    """
+    # Create agents, each with the LLM of its model tier
+    triage_lead = create_triage_lead(get_llm("context"))
+    support_analyst = create_support_analyst(get_llm("support"))
+    sre_infra = create_sre_infra(get_llm("sre"), sre_tools("sre"))
+    backend_analyst = create_backend_analyst(get_llm("backend"), backend_tools("backend"))
+    qa_lead = create_qa_lead(get_llm("qa"))
+    tech_lead = create_tech_lead(get_llm("plan"))
+    comms_manager = create_comms_manager(get_llm("comms"))
+    
+    # Create tasks
+    tasks = {
+        "context": create_task0_context(triage_lead),
+        "support": create_task1_support(support_analyst, complaint_text),
+        "sre": create_task2_sre(sre_infra),
+        "backend": create_task3_backend(backend_analyst),
+        "qa": create_task4_qa(qa_lead),
+        "comms": create_task5_comms(comms_manager),
+        "plan": create_task6_plan(tech_lead),
+    }
+    consumed = {u for upstream in TASK_DEPENDENCIES.values() for u in upstream}
+    for name, task in tasks.items():
+        task.callback = _task_callback(name, UPSTREAM_DIGEST_TOKENS if name in consumed else None)
+    return tasks
+
+
+def create_crew(complaint_text: str = COMPLAINT_TEXT) -> Crew:
     """
     Create and return a configured CrewAI instance with all agents and tasks.
     
     Returns:
         Crew: Configured crew with sequential process
     """
-    # Initialize LLM
-    llm = get_llm()
-    
-    # Create agents
-    triage_lead = create_triage_lead(llm)
-    support_analyst = create_support_analyst(llm)
-    sre_infra = create_sre_infra(llm)
-    backend_analyst = create_backend_analyst(llm)
-    qa_lead = create_qa_lead(llm)
-    tech_lead = create_tech_lead(llm)
-    comms_manager = create_comms_manager(llm)
-    
-    # Create tasks
-    task0 = create_task0_context(triage_lead)
-    task1 = create_task1_support(support_analyst)
-    task2 = create_task2_sre(sre_infra)
-    task3 = create_task3_backend(backend_analyst)
-    task4 = create_task4_qa(qa_lead)
-    task5 = create_task5_comms(comms_manager)
-    task6 = create_task6_plan(tech_lead)
+    tasks = create_task_graph(complaint_text)
     
     # Create and return crew
     return Crew(
-        agents=[triage_lead, support_analyst, sre_infra, backend_analyst, qa_lead, comms_manager, tech_lead],
-        tasks=[task0, task1, task2, task3, task4, task5, task6],
+        agents=[task.agent for task in tasks.values()],
+        tasks=list(tasks.values()),
         process=Process.sequential,
-        verbose=True,
+        verbose=CREW_VERBOSE,
     )
+
+
+def run_crew_sequential(complaint_text: str = COMPLAINT_TEXT, token_report: Optional[dict] = None) -> str:
+    """
+    Run the crew sequentially.
+
+    Args:
+        complaint_text: Complaints to analyze, formatted as a bullet list
+        token_report: If given, filled with estimated prompt tokens per task
+
+    Returns:
+        str: Final action plan
+    """
+    crew = create_crew(complaint_text)
+    get_tracer().begin_sequence()
+    result = crew.kickoff()
+    if token_report is not None:
+        # A sequential crew hands every task all of the earlier outputs
+        names = list(TASK_DEPENDENCIES)
+        tasks = dict(zip(names, crew.tasks))
+        token_report.update(prompt_token_report(tasks, {name: names[:i] for i, name in enumerate(names)}))
+    return result.raw
+
+
+def run_crew_dag(
+    max_concurrency: int = MAX_TASK_CONCURRENCY,
+    complaint_text: str = COMPLAINT_TEXT,
+    token_report: Optional[dict] = None,
+    checkpoints: Optional[CheckpointStore] = None,
+) -> str:
+    """
+    Run the crew as a dependency graph instead of a fixed sequence.
+
+    With ``checkpoints``, tasks whose inputs are unchanged since an earlier
+    run are loaded instead of re-run.
+    
+    Returns:
+        str: Final action plan
+    """
+    tasks = create_task_graph(complaint_text)
+    outputs = run_dag(tasks, TASK_DEPENDENCIES, max_concurrency, checkpoints)
+    if token_report is not None:
+        token_report.update(prompt_token_report(tasks, TASK_DEPENDENCIES))
+    return outputs["plan"].raw
+
+
+def rerun_task(name: str, checkpoints: CheckpointStore, complaint_text: str = COMPLAINT_TEXT) -> str:
+    """
+    Re-run a single task against the checkpointed outputs of its upstream tasks.
+
+    Upstream tasks are never run; a missing upstream checkpoint raises
+    ValueError. The new output is checkpointed.
+
+    Returns:
+        str: Output of the task
+    """
+    if name not in TASK_DEPENDENCIES:
+        raise ValueError(f"Unknown task '{name}'")
+    ancestors, stack = set(), list(TASK_DEPENDENCIES[name])
+    while stack:
+        upstream = stack.pop()
+        if upstream not in ancestors:
+            ancestors.add(upstream)
+            stack.extend(TASK_DEPENDENCIES[upstream])
+
+    tasks = create_task_graph(complaint_text)
+    outputs = {}
+    for upstream in topological_order(TASK_DEPENDENCIES):
+        if upstream not in ancestors:
+            continue
+        inputs = [outputs[u] for u in TASK_DEPENDENCIES[upstream]]
+        saved = checkpoints.load(tasks[upstream], upstream, task_fingerprint(tasks[upstream], inputs))
+        if saved is None:
+            raise ValueError(f"No checkpoint for upstream task '{upstream}'; run with --resume first")
+        tasks[upstream].output = outputs[upstream] = saved
+
+    task = tasks[name]
+    get_tracer().task_started(time.perf_counter())
+    output = task.execute_sync(context=format_context(outputs, TASK_DEPENDENCIES[name]))
+    checkpoints.save(name, task_fingerprint(task, [outputs[u] for u in TASK_DEPENDENCIES[name]]), output)
+    return output.raw
@@ -0,0 +1,143 @@
+"""
+llm_cache.py - Content-addressed cache for agent LLM responses.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from crewai.llms.base_llm import BaseLLM
+
+from tracing import get_tracer
+
+CACHE_MODES = ("off", "read_write", "record", "replay")
+SAMPLING_PARAMS = ("temperature", "top_p", "max_tokens", "max_completion_tokens", "seed", "response_format")
+
+
+class CacheMissError(RuntimeError):
+    """Raised in replay mode when a prompt has no recorded response."""
+
+
+class ResponseCache:
+    """
+    SQLite-backed response store.
+
+    Entries older than ``ttl_seconds`` (``0`` keeps them forever) are ignored,
+    and the least recently used entries are evicted beyond ``max_entries``.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 0, max_entries: int = 10000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT, response TEXT, created REAL, accessed REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._db.commit()
+
+    @staticmethod
+    def key(payload: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl_seconds and time.time() - row[1] > self.ttl_seconds):
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, now, now),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+
+class CachedLLM(BaseLLM):
+    """
+    Wrap an LLM so identical calls are answered from a ResponseCache.
+
+    The key covers the model, the messages, the sampling parameters, stop
+    words and tool schemas. Modes:
+        read_write - serve hits, call the model and store on misses
+        record     - always call the model and overwrite the stored response
+        replay     - serve hits only; a miss raises CacheMissError
+    """
+
+    def __init__(self, llm: BaseLLM, cache: ResponseCache, mode: str = "read_write"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode '{mode}'; choose from {', '.join(CACHE_MODES)}")
+        self.llm = llm
+        super().__init__(model=llm.model, temperature=getattr(llm, "temperature", None))
+        self.cache = cache
+        self.mode = mode
+
+    @property
+    def stop(self):
+        return self.llm.stop
+
+    @stop.setter
+    def stop(self, value):
+        self.llm.stop = value
+
+    def cache_key(self, messages: Union[str, List[Dict[str, str]]], tools: Optional[List[dict]] = None) -> str:
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        payload = {
+            "model": self.llm.model,
+            "messages": messages,
+            "stop": self.stop,
+            "tools": tools,
+            **{name: getattr(self.llm, name, None) for name in SAMPLING_PARAMS},
+        }
+        return ResponseCache.key(payload)
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        if self.mode == "off":
+            return self.llm.call(messages, tools=tools, callbacks=callbacks,
+                                 available_functions=available_functions, **kwargs)
+        key = self.cache_key(messages, tools)
+        if self.mode != "record":
+            start = time.perf_counter()
+            cached = self.cache.get(key)
+            if cached is not None:
+                get_tracer().record(self.llm.model, "llm", start, time.perf_counter(),
+                                    getattr(self.llm, "agent", None), cached=True)
+                return cached
+            if self.mode == "replay":
+                raise CacheMissError(f"No recorded response for prompt {key[:12]} (model {self.llm.model})")
+        response = self.llm.call(messages, tools=tools, callbacks=callbacks,
+                                 available_functions=available_functions, **kwargs)
+        if isinstance(response, str):
+            self.cache.put(key, self.llm.model, response)
+        return response
+
+    def supports_function_calling(self) -> bool:
+        return self.llm.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.llm.get_context_window_size()
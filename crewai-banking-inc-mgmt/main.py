@@ -1,19 +1,129 @@
 """
 Main entry point for the CrewAI incident management system.
 """
-from crew import create_crew
+import argparse
+import os
+import sys
 
+from batch import iter_windows, process_complaints
+from complaints import COMPLAINT_TEXT, iter_complaints, load_complaints
+from checkpoints import CheckpointStore
+from config import CHECKPOINT_DIR, MAX_TASK_CONCURRENCY
+from context import format_token_report
+from crew import TASK_DEPENDENCIES, rerun_task, run_crew_dag, run_crew_sequential
+from routing import get_router
+from tools import get_toolbox
+from tracing import get_tracer
 
-def main():
-    """Execute the incident analysis crew."""
-    crew = create_crew()
-    result = crew.kickoff()
-    
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the banking incident analysis crew.")
+    parser.add_argument(
+        "--mode",
+        choices=["sequential", "dag"],
+        default="sequential",
+        help="Run tasks one after another, or as a dependency graph with independent tasks in parallel",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=MAX_TASK_CONCURRENCY,
+        help="Maximum tasks running at once in dag mode",
+    )
+    parser.add_argument(
+        "--complaints-file",
+        help="Batch mode: read complaints (.txt, .jsonl or .csv) from this file, or '-' to stream from stdin",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Incident buckets processed at once in batch mode")
+    parser.add_argument(
+        "--cluster-threshold",
+        type=float,
+        default=0.25,
+        help="Keyword overlap needed for a complaint to join an existing incident bucket",
+    )
+    parser.add_argument("--window-size", type=int, default=1000, help="Complaints per window when streaming")
+    parser.add_argument("--window-seconds", type=float, default=300, help="Maximum window age when streaming")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Checkpoint every task's output and reuse checkpoints whose inputs are unchanged",
+    )
+    parser.add_argument(
+        "--rerun",
+        choices=list(TASK_DEPENDENCIES),
+        help="Re-run only this task against the checkpointed outputs of its upstream tasks",
+    )
+    parser.add_argument("--checkpoint-dir", default=CHECKPOINT_DIR, help="Where task checkpoints are stored")
+    parser.add_argument("--trace-json", help="Write the run's trace spans and per-task summary to this JSON file")
+    parser.add_argument("--chrome-trace", help="Write the run's trace in Chrome trace format to this file")
+    return parser.parse_args()
+
+
+def print_report(title, result):
     print("\n" + "=" * 80)
-    print("FINAL INCIDENT + ENGINEERING REPORT")
+    print(title)
     print("=" * 80 + "\n")
     print(result)
 
 
+def window_path(path, window):
+    """``trace.json`` -> ``trace-3.json`` for window 3 of a stream."""
+    if not path:
+        return None
+    root, ext = os.path.splitext(path)
+    return f"{root}-{window}{ext}"
+
+
+def report_trace(tracer, trace_json=None, chrome_trace=None, title="RUN TRACE SUMMARY"):
+    print_report(title, tracer.format_summary())
+    if trace_json:
+        tracer.export_json(trace_json)
+    if chrome_trace:
+        tracer.export_chrome_trace(chrome_trace)
+
+
+def main():
+    """Execute the incident analysis crew."""
+    args = parse_args()
+
+    checkpoints = CheckpointStore(args.checkpoint_dir) if args.resume or args.rerun else None
+
+    def run_crew(complaint_text, token_report=None):
+        if checkpoints is not None:
+            concurrency = args.max_concurrency if args.mode == "dag" else 1
+            return run_crew_dag(concurrency, complaint_text, token_report, checkpoints)
+        if args.mode == "dag":
+            return run_crew_dag(args.max_concurrency, complaint_text, token_report)
+        return run_crew_sequential(complaint_text, token_report)
+
+    if args.rerun:
+        print_report(f"RE-RUN OF TASK '{args.rerun}'", rerun_task(args.rerun, checkpoints))
+    elif args.complaints_file == "-":
+        windows = iter_windows(iter_complaints(sys.stdin), args.window_size, args.window_seconds)
+        for n, window in enumerate(windows, 1):
+            report = process_complaints(window, run_crew, args.workers, args.cluster_threshold)
+            print_report(f"CONSOLIDATED REPORT ({len(window)} complaints)", report)
+            # One trace per window, so a long-running stream does not keep every span
+            report_trace(get_tracer().drain(), window_path(args.trace_json, n),
+                         window_path(args.chrome_trace, n), f"RUN TRACE SUMMARY (window {n})")
+        return
+    elif args.complaints_file:
+        complaints = load_complaints(args.complaints_file)
+        report = process_complaints(complaints, run_crew, args.workers, args.cluster_threshold)
+        print_report("CONSOLIDATED INCIDENT REPORT", report)
+    else:
+        token_report = {}
+        result = run_crew(COMPLAINT_TEXT, token_report)
+
+        print("\n" + "=" * 80)
+        print("FINAL INCIDENT + ENGINEERING REPORT")
+        print("=" * 80 + "\n")
+        print(result)
+        print_report("ESTIMATED PROMPT TOKENS PER TASK", format_token_report(token_report))
+        print_report("TOOL CALL LATENCY", get_toolbox().latency_report())
+        print_report("LLM LATENCY AND COST PER AGENT", get_router().report())
+
+    report_trace(get_tracer(), args.trace_json, args.chrome_trace)
+
 if __name__ == "__main__":
     main()
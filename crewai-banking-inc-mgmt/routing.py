@@ -0,0 +1,262 @@
+"""
+routing.py - Per-agent model tiers with bounded concurrency and fallback.
+
+Each agent is routed to a tier (fast, standard, strong) from AGENT_TIERS.
+A tier has its own model, completion cap, timeout and concurrency limit.
+Rate-limited calls back off and hold back the whole tier until the cooldown
+passes, and calls that time out are retried on the tier's fallback. Latency,
+queue time, tokens and cost are recorded per agent.
+"""
+import queue
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from crewai.llm import LLM
+from crewai.llms.base_llm import BaseLLM
+
+from config import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    MODEL_TIERS,
+    AGENT_TIERS,
+    MODEL_PRICES_PER_1M,
+    LLM_MAX_RETRIES,
+    LLM_BACKOFF_S,
+)
+from context import count_tokens
+from tracing import get_tracer
+
+DEFAULT_TIER = "standard"
+
+
+@dataclass
+class Tier:
+    name: str
+    model: str
+    max_tokens: Optional[int] = None
+    timeout_s: float = 60
+    concurrency: int = 4
+    fallback: Optional[str] = None
+
+
+def _is_timeout(exc: Exception) -> bool:
+    return isinstance(exc, TimeoutError) or "timeout" in type(exc).__name__.lower()
+
+
+def _is_rate_limit(exc: Exception) -> bool:
+    return getattr(exc, "status_code", None) == 429 or "ratelimit" in type(exc).__name__.lower()
+
+
+def _message_tokens(messages, model: str) -> int:
+    if isinstance(messages, str):
+        return count_tokens(messages, model)
+    return sum(count_tokens(str(m.get("content") or ""), model) for m in messages)
+
+
+class TierPool:
+    """One tier's LLM clients, one per concurrency slot, and its rate-limit cooldown.
+
+    A call checks a client out for its whole duration, so per-call state such
+    as stop words is never shared between concurrent callers.
+    """
+
+    def __init__(self, tier: Tier, api_key: str, base_url: Optional[str] = None):
+        self.tier = tier
+        self._clients = queue.Queue()
+        for _ in range(tier.concurrency):
+            self._clients.put(LLM(model=tier.model, api_key=api_key, base_url=base_url,
+                                  max_tokens=tier.max_tokens, timeout=tier.timeout_s))
+        # Read-only reference for capability queries (function calling, context window)
+        self.llm = self._clients.queue[0]
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def client(self):
+        """Hold one slot and its LLM client; blocks while all slots are busy."""
+        llm = self._clients.get()
+        try:
+            yield llm
+        finally:
+            self._clients.put(llm)
+
+    def cool_down(self, seconds: float):
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + seconds)
+
+    def wait_for_cooldown(self):
+        while True:
+            with self._lock:
+                remaining = self._cooldown_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+
+class ModelRouter:
+    """Route agents to tier pools and account latency and cost per agent."""
+
+    def __init__(
+        self,
+        tiers: Dict[str, Tier],
+        agent_tiers: Dict[str, str],
+        api_key: str,
+        prices: Dict[str, tuple],
+        max_retries: int = 4,
+        backoff_s: float = 1.0,
+        base_url: Optional[str] = None,
+    ):
+        for tier in tiers.values():
+            if tier.fallback is not None and tier.fallback not in tiers:
+                raise ValueError(f"Tier '{tier.name}' falls back to unknown tier '{tier.fallback}'")
+        self.pools = {name: TierPool(tier, api_key, base_url) for name, tier in tiers.items()}
+        self.agent_tiers = agent_tiers
+        self.prices = prices
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.stats: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def tier_for(self, agent: Optional[str]) -> str:
+        tier = self.agent_tiers.get(agent, DEFAULT_TIER)
+        if tier not in self.pools:
+            raise ValueError(f"Agent '{agent}' is routed to unknown tier '{tier}'")
+        return tier
+
+    def llm_for(self, agent: Optional[str]) -> "RoutedLLM":
+        return RoutedLLM(self, agent or "default", self.tier_for(agent))
+
+    def complete(self, agent: str, tier: str, messages, stop=None, **kwargs):
+        """Call ``tier`` for ``agent``, falling back along the tier chain on timeouts."""
+        tried = set()
+        while True:
+            tried.add(tier)
+            try:
+                return self._call_tier(agent, self.pools[tier], messages, stop, **kwargs)
+            except Exception as exc:
+                fallback = self.pools[tier].tier.fallback
+                if not _is_timeout(exc) or fallback is None or fallback in tried:
+                    raise
+                self._record(agent, tier, fallback=True)
+                tier = fallback
+
+    def _call_tier(self, agent: str, pool: TierPool, messages, stop, **kwargs):
+        for attempt in range(self.max_retries + 1):
+            queued = time.perf_counter()
+            pool.wait_for_cooldown()
+            with pool.client() as llm:
+                started = time.perf_counter()
+                llm.stop = list(stop or [])
+                try:
+                    response = llm.call(messages, **kwargs)
+                except Exception as exc:
+                    if not _is_rate_limit(exc) or attempt == self.max_retries:
+                        raise
+                    pool.cool_down(self.backoff_s * 2 ** attempt * (1 + random.random()))
+                    self._record(agent, pool.tier.name, rate_limited=True)
+                    continue
+            finished = time.perf_counter()
+            prompt_tokens = _message_tokens(messages, pool.tier.model)
+            completion_tokens = count_tokens(response, pool.tier.model) if isinstance(response, str) else 0
+            self._record(
+                agent,
+                pool.tier.name,
+                latency_ms=(finished - started) * 1000,
+                queue_ms=(started - queued) * 1000,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
+            get_tracer().record(
+                pool.tier.model, "llm", started, finished, agent, tier=pool.tier.name,
+                queue_ms=(started - queued) * 1000, attempt=attempt,
+                prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+            )
+            return response
+
+    def _record(self, agent: str, tier: str, latency_ms: float = 0.0, queue_ms: float = 0.0,
+                prompt_tokens: int = 0, completion_tokens: int = 0, fallback: bool = False,
+                rate_limited: bool = False):
+        input_price, output_price = self.prices.get(self.pools[tier].tier.model, (0.0, 0.0))
+        with self._lock:
+            row = self.stats.setdefault(agent, {
+                "tiers": Counter(), "calls": 0, "fallbacks": 0, "rate_limited": 0, "latency_ms": 0.0,
+                "queue_ms": 0.0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0,
+            })
+            row["fallbacks"] += fallback
+            row["rate_limited"] += rate_limited
+            if fallback or rate_limited:
+                return
+            row["tiers"][tier] += 1
+            row["calls"] += 1
+            row["latency_ms"] += latency_ms
+            row["queue_ms"] += queue_ms
+            row["prompt_tokens"] += prompt_tokens
+            row["completion_tokens"] += completion_tokens
+            row["cost_usd"] += (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+    def report(self) -> str:
+        """Per-agent table of tiers used, calls, latency, queue time, estimated tokens and cost."""
+        with self._lock:
+            stats = {agent: dict(row) for agent, row in self.stats.items()}
+        if not stats:
+            return "No routed LLM calls."
+        lines = [
+            f"{'agent':<10} {'tiers':<18} {'calls':>5} {'fallbk':>6} {'429s':>4} {'latency s':>9} "
+            f"{'queue s':>7} {'in tok':>7} {'out tok':>7} {'cost $':>8}"
+        ]
+        for agent, row in stats.items():
+            tiers = ",".join(f"{t}x{n}" for t, n in row["tiers"].items())
+            lines.append(
+                f"{agent:<10} {tiers:<18} {row['calls']:>5} {row['fallbacks']:>6} {row['rate_limited']:>4} "
+                f"{row['latency_ms'] / 1000:>9.1f} {row['queue_ms'] / 1000:>7.1f} {row['prompt_tokens']:>7} "
+                f"{row['completion_tokens']:>7} {row['cost_usd']:>8.4f}"
+            )
+        total = sum(row["cost_usd"] for row in stats.values())
+        lines.append(f"{'all':<10} {'':<18} {sum(r['calls'] for r in stats.values()):>5} {'':>6} {'':>4} "
+                     f"{'':>9} {'':>7} {'':>7} {'':>7} {total:>8.4f}")
+        return "\n".join(lines)
+
+
+class RoutedLLM(BaseLLM):
+    """LLM handed to one agent; every call goes through the router under that agent's name."""
+
+    def __init__(self, router: ModelRouter, agent: str, tier: str):
+        pool = router.pools[tier]
+        super().__init__(model=pool.tier.model, temperature=getattr(pool.llm, "temperature", None))
+        self.router = router
+        self.agent = agent
+        self.tier = tier
+        self.max_tokens = pool.tier.max_tokens
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        return self.router.complete(self.agent, self.tier, messages, stop=self.stop, tools=tools,
+                                    callbacks=callbacks, available_functions=available_functions, **kwargs)
+
+    def supports_function_calling(self) -> bool:
+        return self.router.pools[self.tier].llm.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.router.pools[self.tier].llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.router.pools[self.tier].llm.get_context_window_size()
+
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_router() -> ModelRouter:
+    """Return the process-wide router, so tier limits hold across crews run in parallel."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            tiers = {name: Tier(name=name, **spec) for name, spec in MODEL_TIERS.items()}
+            _router = ModelRouter(tiers, AGENT_TIERS, OPENAI_API_KEY, MODEL_PRICES_PER_1M,
+                                  LLM_MAX_RETRIES, LLM_BACKOFF_S, OPENAI_BASE_URL)
+        return _router
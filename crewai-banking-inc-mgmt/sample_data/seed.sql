@@ -0,0 +1,510 @@
+-- Local stand-in for the core banking database used by the db_query tool.
+CREATE TABLE accounts (account_id TEXT PRIMARY KEY, segment TEXT NOT NULL, balance REAL NOT NULL, apr REAL NOT NULL, apr_notified_at TEXT);
+CREATE TABLE transactions (txn_id TEXT PRIMARY KEY, account_id TEXT NOT NULL REFERENCES accounts(account_id), created_at TEXT NOT NULL, amount REAL NOT NULL, channel TEXT NOT NULL, status TEXT NOT NULL, decline_reason TEXT, fraud_score REAL, idempotency_key TEXT);
+CREATE TABLE disputes (dispute_id TEXT PRIMARY KEY, txn_id TEXT NOT NULL REFERENCES transactions(txn_id), opened_at TEXT NOT NULL, state TEXT NOT NULL, reversed_at TEXT);
+CREATE INDEX transactions_account ON transactions (account_id);
+CREATE INDEX transactions_status ON transactions (status);
+CREATE INDEX disputes_state ON disputes (state);
+
+INSERT INTO accounts VALUES ('acc_0001', 'retail', 2413.00, 18.9, '2026-01-07');
+INSERT INTO accounts VALUES ('acc_0002', 'retail', 16515.00, 18.9, '2026-01-14');
+INSERT INTO accounts VALUES ('acc_0003', 'business', 9584.00, 21.4, '2026-01-11');
+INSERT INTO accounts VALUES ('acc_0004', 'retail', 18396.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0005', 'business', 15057.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0006', 'business', 6837.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0007', 'retail', 17945.00, 21.4, '2026-01-10');
+INSERT INTO accounts VALUES ('acc_0008', 'business', 7879.00, 18.9, '2026-01-02');
+INSERT INTO accounts VALUES ('acc_0009', 'premium', 9969.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0010', 'premium', 19921.00, 21.4, '2026-01-03');
+INSERT INTO accounts VALUES ('acc_0011', 'retail', 2507.00, 18.9, '2026-01-01');
+INSERT INTO accounts VALUES ('acc_0012', 'business', 19670.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0013', 'premium', 18875.00, 18.9, '2026-01-08');
+INSERT INTO accounts VALUES ('acc_0014', 'retail', 756.00, 18.9, '2026-01-12');
+INSERT INTO accounts VALUES ('acc_0015', 'business', 4474.00, 21.4, '2026-01-01');
+INSERT INTO accounts VALUES ('acc_0016', 'retail', 9663.00, 21.4, '2026-01-01');
+INSERT INTO accounts VALUES ('acc_0017', 'retail', 8328.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0018', 'premium', 12576.00, 18.9, '2026-01-01');
+INSERT INTO accounts VALUES ('acc_0019', 'retail', 15559.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0020', 'retail', 481.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0021', 'retail', 17874.00, 21.4, '2026-01-06');
+INSERT INTO accounts VALUES ('acc_0022', 'retail', 7874.00, 21.4, '2026-01-06');
+INSERT INTO accounts VALUES ('acc_0023', 'retail', 3485.00, 18.9, '2026-01-09');
+INSERT INTO accounts VALUES ('acc_0024', 'premium', 11091.00, 21.4, '2026-01-06');
+INSERT INTO accounts VALUES ('acc_0025', 'retail', 15058.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0026', 'retail', 17692.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0027', 'business', 2987.00, 18.9, '2026-01-07');
+INSERT INTO accounts VALUES ('acc_0028', 'retail', 8575.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0029', 'business', 14402.00, 18.9, '2026-01-03');
+INSERT INTO accounts VALUES ('acc_0030', 'premium', 12859.00, 18.9, '2026-01-12');
+INSERT INTO accounts VALUES ('acc_0031', 'retail', 3056.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0032', 'business', 19420.00, 18.9, '2026-01-10');
+INSERT INTO accounts VALUES ('acc_0033', 'retail', 12866.00, 21.4, '2026-01-10');
+INSERT INTO accounts VALUES ('acc_0034', 'business', 2242.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0035', 'retail', 4710.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0036', 'business', 9010.00, 21.4, '2026-01-11');
+INSERT INTO accounts VALUES ('acc_0037', 'retail', 8403.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0038', 'business', 5726.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0039', 'premium', 11267.00, 21.4, '2026-01-02');
+INSERT INTO accounts VALUES ('acc_0040', 'premium', 7463.00, 18.9, '2026-01-01');
+INSERT INTO accounts VALUES ('acc_0041', 'premium', 11045.00, 21.4, '2026-01-13');
+INSERT INTO accounts VALUES ('acc_0042', 'retail', 2430.00, 18.9, '2026-01-14');
+INSERT INTO accounts VALUES ('acc_0043', 'business', 19284.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0044', 'retail', 4757.00, 21.4, '2026-01-03');
+INSERT INTO accounts VALUES ('acc_0045', 'retail', 12600.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0046', 'business', 7365.00, 18.9, '2026-01-10');
+INSERT INTO accounts VALUES ('acc_0047', 'retail', 8842.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0048', 'premium', 17816.00, 18.9, '2026-01-06');
+INSERT INTO accounts VALUES ('acc_0049', 'business', 8295.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0050', 'business', 3702.00, 18.9, NULL);
+INSERT INTO accounts VALUES ('acc_0051', 'premium', 12527.00, 18.9, '2026-01-03');
+INSERT INTO accounts VALUES ('acc_0052', 'retail', 7226.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0053', 'business', 15509.00, 21.4, '2026-01-04');
+INSERT INTO accounts VALUES ('acc_0054', 'retail', 12417.00, 21.4, '2026-01-01');
+INSERT INTO accounts VALUES ('acc_0055', 'retail', 15535.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0056', 'premium', 18246.00, 21.4, '2026-01-02');
+INSERT INTO accounts VALUES ('acc_0057', 'retail', 15941.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0058', 'premium', 14476.00, 18.9, '2026-01-04');
+INSERT INTO accounts VALUES ('acc_0059', 'retail', 8769.00, 21.4, NULL);
+INSERT INTO accounts VALUES ('acc_0060', 'premium', 18229.00, 18.9, '2026-01-04');
+
+INSERT INTO transactions VALUES ('txn_200000', 'acc_0056', '2026-01-15T08:00:00Z', 883.48, 'mobile', 'DECLINED', 'fraud_model_score', 0.94, 'idem_0');
+INSERT INTO transactions VALUES ('txn_200001', 'acc_0033', '2026-01-15T08:00:45Z', 890.40, 'web', 'DECLINED', 'fraud_model_score', 0.82, 'idem_1');
+INSERT INTO transactions VALUES ('txn_200002', 'acc_0030', '2026-01-15T08:01:30Z', 808.93, 'web', 'DECLINED', 'gateway_timeout', 0.5, 'idem_2');
+INSERT INTO transactions VALUES ('txn_200003', 'acc_0043', '2026-01-15T08:02:15Z', 813.46, 'mobile', 'DECLINED', 'fraud_model_score', 0.87, 'idem_3');
+INSERT INTO transactions VALUES ('txn_200004', 'acc_0012', '2026-01-15T08:03:00Z', 526.01, 'mobile', 'DECLINED', 'gateway_timeout', 0.98, 'idem_4');
+INSERT INTO transactions VALUES ('txn_200005', 'acc_0042', '2026-01-15T08:03:45Z', 244.98, 'pos', 'APPROVED', NULL, 0.7, NULL);
+INSERT INTO transactions VALUES ('txn_200006', 'acc_0025', '2026-01-15T08:04:30Z', 827.41, 'mobile', 'APPROVED', NULL, 0.18, 'idem_6');
+INSERT INTO transactions VALUES ('txn_200007', 'acc_0012', '2026-01-15T08:05:15Z', 721.29, 'mobile', 'APPROVED', NULL, 0.4, 'idem_7');
+INSERT INTO transactions VALUES ('txn_200008', 'acc_0014', '2026-01-15T08:06:00Z', 875.04, 'atm', 'APPROVED', NULL, 0.79, 'idem_8');
+INSERT INTO transactions VALUES ('txn_200009', 'acc_0048', '2026-01-15T08:06:45Z', 326.74, 'web', 'APPROVED', NULL, 0.18, 'idem_9');
+INSERT INTO transactions VALUES ('txn_200010', 'acc_0001', '2026-01-15T08:07:30Z', 373.61, 'web', 'APPROVED', NULL, 0.43, 'idem_10');
+INSERT INTO transactions VALUES ('txn_200011', 'acc_0044', '2026-01-15T08:08:15Z', 222.79, 'web', 'DECLINED', 'fraud_model_score', 0.96, 'idem_11');
+INSERT INTO transactions VALUES ('txn_200012', 'acc_0051', '2026-01-15T08:09:00Z', 472.34, 'web', 'APPROVED', NULL, 0.49, 'idem_12');
+INSERT INTO transactions VALUES ('txn_200013', 'acc_0012', '2026-01-15T08:09:45Z', 356.52, 'mobile', 'APPROVED', NULL, 0.76, NULL);
+INSERT INTO transactions VALUES ('txn_200014', 'acc_0054', '2026-01-15T08:10:30Z', 5.19, 'atm', 'APPROVED', NULL, 0.77, 'idem_14');
+INSERT INTO transactions VALUES ('txn_200015', 'acc_0025', '2026-01-15T08:11:15Z', 145.33, 'web', 'APPROVED', NULL, 0.5, 'idem_15');
+INSERT INTO transactions VALUES ('txn_200016', 'acc_0059', '2026-01-15T08:12:00Z', 145.66, 'web', 'APPROVED', NULL, 0.31, 'idem_16');
+INSERT INTO transactions VALUES ('txn_200017', 'acc_0015', '2026-01-15T08:12:45Z', 437.21, 'mobile', 'APPROVED', NULL, 0.79, 'idem_17');
+INSERT INTO transactions VALUES ('txn_200018', 'acc_0057', '2026-01-15T08:13:30Z', 588.84, 'web', 'APPROVED', NULL, 0.48, 'idem_18');
+INSERT INTO transactions VALUES ('txn_200019', 'acc_0046', '2026-01-15T08:14:15Z', 422.12, 'mobile', 'APPROVED', NULL, 0.79, 'idem_19');
+INSERT INTO transactions VALUES ('txn_200020', 'acc_0058', '2026-01-15T08:15:00Z', 301.09, 'atm', 'APPROVED', NULL, 0.79, 'idem_20');
+INSERT INTO transactions VALUES ('txn_200021', 'acc_0005', '2026-01-15T08:15:45Z', 547.48, 'atm', 'APPROVED', NULL, 0.21, 'idem_21');
+INSERT INTO transactions VALUES ('txn_200022', 'acc_0008', '2026-01-15T08:16:30Z', 461.31, 'pos', 'APPROVED', NULL, 0.66, 'idem_22');
+INSERT INTO transactions VALUES ('txn_200023', 'acc_0058', '2026-01-15T08:17:15Z', 539.71, 'web', 'APPROVED', NULL, 0.6, 'idem_23');
+INSERT INTO transactions VALUES ('txn_200024', 'acc_0025', '2026-01-15T08:18:00Z', 190.88, 'atm', 'APPROVED', NULL, 0.61, 'idem_24');
+INSERT INTO transactions VALUES ('txn_200025', 'acc_0017', '2026-01-15T08:18:45Z', 698.09, 'mobile', 'APPROVED', NULL, 0.44, 'idem_25');
+INSERT INTO transactions VALUES ('txn_200026', 'acc_0052', '2026-01-15T08:19:30Z', 14.56, 'pos', 'APPROVED', NULL, 0.49, 'idem_26');
+INSERT INTO transactions VALUES ('txn_200027', 'acc_0057', '2026-01-15T08:20:15Z', 189.59, 'atm', 'APPROVED', NULL, 0.77, 'idem_27');
+INSERT INTO transactions VALUES ('txn_200028', 'acc_0014', '2026-01-15T08:21:00Z', 560.52, 'pos', 'APPROVED', NULL, 0.27, 'idem_28');
+INSERT INTO transactions VALUES ('txn_200029', 'acc_0048', '2026-01-15T08:21:45Z', 730.46, 'pos', 'APPROVED', NULL, 0.79, 'idem_29');
+INSERT INTO transactions VALUES ('txn_200030', 'acc_0015', '2026-01-15T08:22:30Z', 660.27, 'atm', 'APPROVED', NULL, 0.77, 'idem_30');
+INSERT INTO transactions VALUES ('txn_200031', 'acc_0040', '2026-01-15T08:23:15Z', 435.82, 'mobile', 'DECLINED', 'gateway_timeout', 0.53, 'idem_31');
+INSERT INTO transactions VALUES ('txn_200032', 'acc_0035', '2026-01-15T08:24:00Z', 369.44, 'pos', 'APPROVED', NULL, 0.48, 'idem_32');
+INSERT INTO transactions VALUES ('txn_200033', 'acc_0044', '2026-01-15T08:24:45Z', 697.99, 'web', 'APPROVED', NULL, 0.79, 'idem_33');
+INSERT INTO transactions VALUES ('txn_200034', 'acc_0019', '2026-01-15T08:25:30Z', 860.70, 'web', 'APPROVED', NULL, 0.16, 'idem_34');
+INSERT INTO transactions VALUES ('txn_200035', 'acc_0013', '2026-01-15T08:26:15Z', 383.98, 'atm', 'APPROVED', NULL, 0.71, 'idem_35');
+INSERT INTO transactions VALUES ('txn_200036', 'acc_0030', '2026-01-15T08:27:00Z', 875.85, 'mobile', 'APPROVED', NULL, 0.2, 'idem_36');
+INSERT INTO transactions VALUES ('txn_200037', 'acc_0047', '2026-01-15T08:27:45Z', 579.34, 'mobile', 'APPROVED', NULL, 0.06, 'idem_37');
+INSERT INTO transactions VALUES ('txn_200038', 'acc_0001', '2026-01-15T08:28:30Z', 182.29, 'web', 'DECLINED', 'fraud_model_score', 0.84, 'idem_38');
+INSERT INTO transactions VALUES ('txn_200039', 'acc_0002', '2026-01-15T08:29:15Z', 29.14, 'mobile', 'APPROVED', NULL, 0.72, 'idem_39');
+INSERT INTO transactions VALUES ('txn_200040', 'acc_0022', '2026-01-15T08:30:00Z', 80.66, 'atm', 'APPROVED', NULL, 0.79, 'idem_40');
+INSERT INTO transactions VALUES ('txn_200041', 'acc_0017', '2026-01-15T08:30:45Z', 346.07, 'mobile', 'APPROVED', NULL, 0.44, 'idem_41');
+INSERT INTO transactions VALUES ('txn_200042', 'acc_0004', '2026-01-15T08:31:30Z', 718.33, 'web', 'APPROVED', NULL, 0.3, 'idem_42');
+INSERT INTO transactions VALUES ('txn_200043', 'acc_0032', '2026-01-15T08:32:15Z', 149.24, 'mobile', 'APPROVED', NULL, 0.74, 'idem_43');
+INSERT INTO transactions VALUES ('txn_200044', 'acc_0019', '2026-01-15T08:33:00Z', 739.02, 'web', 'APPROVED', NULL, 0.79, 'idem_44');
+INSERT INTO transactions VALUES ('txn_200045', 'acc_0005', '2026-01-15T08:33:45Z', 605.19, 'web', 'APPROVED', NULL, 0.12, 'idem_45');
+INSERT INTO transactions VALUES ('txn_200046', 'acc_0053', '2026-01-15T08:34:30Z', 241.79, 'mobile', 'APPROVED', NULL, 0.48, 'idem_46');
+INSERT INTO transactions VALUES ('txn_200047', 'acc_0001', '2026-01-15T08:35:15Z', 202.74, 'web', 'APPROVED', NULL, 0.49, 'idem_47');
+INSERT INTO transactions VALUES ('txn_200048', 'acc_0017', '2026-01-15T08:36:00Z', 518.54, 'atm', 'DECLINED', 'gateway_timeout', 0.65, 'idem_48');
+INSERT INTO transactions VALUES ('txn_200049', 'acc_0015', '2026-01-15T08:36:45Z', 530.37, 'web', 'APPROVED', NULL, 0.08, 'idem_49');
+INSERT INTO transactions VALUES ('txn_200050', 'acc_0058', '2026-01-15T08:37:30Z', 193.26, 'atm', 'APPROVED', NULL, 0.7, 'idem_50');
+INSERT INTO transactions VALUES ('txn_200051', 'acc_0004', '2026-01-15T08:38:15Z', 236.59, 'atm', 'APPROVED', NULL, 0.79, 'idem_51');
+INSERT INTO transactions VALUES ('txn_200052', 'acc_0051', '2026-01-15T08:39:00Z', 829.39, 'pos', 'APPROVED', NULL, 0.72, 'idem_52');
+INSERT INTO transactions VALUES ('txn_200053', 'acc_0039', '2026-01-15T08:39:45Z', 328.11, 'atm', 'APPROVED', NULL, 0.73, 'idem_53');
+INSERT INTO transactions VALUES ('txn_200054', 'acc_0057', '2026-01-15T08:40:30Z', 256.59, 'mobile', 'DECLINED', 'fraud_model_score', 0.84, 'idem_54');
+INSERT INTO transactions VALUES ('txn_200055', 'acc_0034', '2026-01-15T08:41:15Z', 895.46, 'pos', 'APPROVED', NULL, 0.16, 'idem_55');
+INSERT INTO transactions VALUES ('txn_200056', 'acc_0005', '2026-01-15T08:42:00Z', 643.49, 'pos', 'APPROVED', NULL, 0.78, 'idem_56');
+INSERT INTO transactions VALUES ('txn_200057', 'acc_0015', '2026-01-15T08:42:45Z', 465.40, 'pos', 'APPROVED', NULL, 0.29, 'idem_57');
+INSERT INTO transactions VALUES ('txn_200058', 'acc_0035', '2026-01-15T08:43:30Z', 462.99, 'atm', 'APPROVED', NULL, 0.44, 'idem_58');
+INSERT INTO transactions VALUES ('txn_200059', 'acc_0041', '2026-01-15T08:44:15Z', 290.17, 'mobile', 'APPROVED', NULL, 0.15, 'idem_59');
+INSERT INTO transactions VALUES ('txn_200060', 'acc_0005', '2026-01-15T08:45:00Z', 482.87, 'mobile', 'APPROVED', NULL, 0.79, 'idem_60');
+INSERT INTO transactions VALUES ('txn_200061', 'acc_0050', '2026-01-15T08:45:45Z', 353.55, 'mobile', 'APPROVED', NULL, 0.11, 'idem_61');
+INSERT INTO transactions VALUES ('txn_200062', 'acc_0046', '2026-01-15T08:46:30Z', 758.06, 'mobile', 'DUPLICATE', NULL, 0.71, NULL);
+INSERT INTO transactions VALUES ('txn_200063', 'acc_0007', '2026-01-15T08:47:15Z', 721.09, 'atm', 'APPROVED', NULL, 0.77, 'idem_63');
+INSERT INTO transactions VALUES ('txn_200064', 'acc_0011', '2026-01-15T08:48:00Z', 250.22, 'pos', 'APPROVED', NULL, 0.55, 'idem_64');
+INSERT INTO transactions VALUES ('txn_200065', 'acc_0008', '2026-01-15T08:48:45Z', 253.58, 'mobile', 'APPROVED', NULL, 0.45, 'idem_65');
+INSERT INTO transactions VALUES ('txn_200066', 'acc_0025', '2026-01-15T08:49:30Z', 489.28, 'web', 'DECLINED', 'fraud_model_score', 0.98, 'idem_66');
+INSERT INTO transactions VALUES ('txn_200067', 'acc_0046', '2026-01-15T08:50:15Z', 211.93, 'web', 'APPROVED', NULL, 0.32, 'idem_67');
+INSERT INTO transactions VALUES ('txn_200068', 'acc_0056', '2026-01-15T08:51:00Z', 837.65, 'atm', 'APPROVED', NULL, 0.79, 'idem_68');
+INSERT INTO transactions VALUES ('txn_200069', 'acc_0053', '2026-01-15T08:51:45Z', 717.19, 'atm', 'APPROVED', NULL, 0.08, 'idem_69');
+INSERT INTO transactions VALUES ('txn_200070', 'acc_0044', '2026-01-15T08:52:30Z', 197.84, 'pos', 'APPROVED', NULL, 0.74, 'idem_70');
+INSERT INTO transactions VALUES ('txn_200071', 'acc_0051', '2026-01-15T08:53:15Z', 786.32, 'mobile', 'DECLINED', 'fraud_model_score', 0.85, 'idem_71');
+INSERT INTO transactions VALUES ('txn_200072', 'acc_0055', '2026-01-15T08:54:00Z', 330.34, 'atm', 'APPROVED', NULL, 0.79, 'idem_72');
+INSERT INTO transactions VALUES ('txn_200073', 'acc_0019', '2026-01-15T08:54:45Z', 117.29, 'mobile', 'APPROVED', NULL, 0.63, 'idem_73');
+INSERT INTO transactions VALUES ('txn_200074', 'acc_0057', '2026-01-15T08:55:30Z', 585.96, 'web', 'APPROVED', NULL, 0.44, 'idem_74');
+INSERT INTO transactions VALUES ('txn_200075', 'acc_0057', '2026-01-15T08:56:15Z', 750.21, 'web', 'APPROVED', NULL, 0.66, 'idem_75');
+INSERT INTO transactions VALUES ('txn_200076', 'acc_0025', '2026-01-15T08:57:00Z', 452.39, 'web', 'APPROVED', NULL, 0.29, 'idem_76');
+INSERT INTO transactions VALUES ('txn_200077', 'acc_0004', '2026-01-15T08:57:45Z', 358.22, 'atm', 'APPROVED', NULL, 0.72, 'idem_77');
+INSERT INTO transactions VALUES ('txn_200078', 'acc_0048', '2026-01-15T08:58:30Z', 899.86, 'mobile', 'APPROVED', NULL, 0.18, 'idem_78');
+INSERT INTO transactions VALUES ('txn_200079', 'acc_0022', '2026-01-15T08:59:15Z', 486.59, 'web', 'APPROVED', NULL, 0.79, 'idem_79');
+INSERT INTO transactions VALUES ('txn_200080', 'acc_0008', '2026-01-15T09:00:00Z', 339.03, 'mobile', 'APPROVED', NULL, 0.39, 'idem_80');
+INSERT INTO transactions VALUES ('txn_200081', 'acc_0048', '2026-01-15T09:00:45Z', 58.25, 'pos', 'APPROVED', NULL, 0.12, 'idem_81');
+INSERT INTO transactions VALUES ('txn_200082', 'acc_0025', '2026-01-15T09:01:30Z', 322.81, 'pos', 'APPROVED', NULL, 0.34, 'idem_82');
+INSERT INTO transactions VALUES ('txn_200083', 'acc_0048', '2026-01-15T09:02:15Z', 899.45, 'mobile', 'APPROVED', NULL, 0.37, 'idem_83');
+INSERT INTO transactions VALUES ('txn_200084', 'acc_0005', '2026-01-15T09:03:00Z', 500.57, 'pos', 'APPROVED', NULL, 0.79, 'idem_84');
+INSERT INTO transactions VALUES ('txn_200085', 'acc_0035', '2026-01-15T09:03:45Z', 376.84, 'mobile', 'DECLINED', 'fraud_model_score', 0.85, 'idem_85');
+INSERT INTO transactions VALUES ('txn_200086', 'acc_0037', '2026-01-15T09:04:30Z', 447.03, 'web', 'APPROVED', NULL, 0.58, 'idem_86');
+INSERT INTO transactions VALUES ('txn_200087', 'acc_0053', '2026-01-15T09:05:15Z', 532.95, 'atm', 'APPROVED', NULL, 0.14, 'idem_87');
+INSERT INTO transactions VALUES ('txn_200088', 'acc_0004', '2026-01-15T09:06:00Z', 229.46, 'pos', 'DECLINED', 'gateway_timeout', 0.8, 'idem_88');
+INSERT INTO transactions VALUES ('txn_200089', 'acc_0005', '2026-01-15T09:06:45Z', 431.25, 'atm', 'DUPLICATE', NULL, 0.65, NULL);
+INSERT INTO transactions VALUES ('txn_200090', 'acc_0012', '2026-01-15T09:07:30Z', 508.69, 'mobile', 'APPROVED', NULL, 0.36, 'idem_90');
+INSERT INTO transactions VALUES ('txn_200091', 'acc_0054', '2026-01-15T09:08:15Z', 579.21, 'web', 'APPROVED', NULL, 0.18, 'idem_91');
+INSERT INTO transactions VALUES ('txn_200092', 'acc_0037', '2026-01-15T09:09:00Z', 375.06, 'mobile', 'DECLINED', 'fraud_model_score', 0.97, 'idem_92');
+INSERT INTO transactions VALUES ('txn_200093', 'acc_0058', '2026-01-15T09:09:45Z', 736.91, 'web', 'APPROVED', NULL, 0.07, 'idem_93');
+INSERT INTO transactions VALUES ('txn_200094', 'acc_0010', '2026-01-15T09:10:30Z', 161.80, 'pos', 'APPROVED', NULL, 0.79, 'idem_94');
+INSERT INTO transactions VALUES ('txn_200095', 'acc_0017', '2026-01-15T09:11:15Z', 623.35, 'web', 'APPROVED', NULL, 0.45, 'idem_95');
+INSERT INTO transactions VALUES ('txn_200096', 'acc_0006', '2026-01-15T09:12:00Z', 797.00, 'atm', 'APPROVED', NULL, 0.53, 'idem_96');
+INSERT INTO transactions VALUES ('txn_200097', 'acc_0035', '2026-01-15T09:12:45Z', 266.29, 'web', 'APPROVED', NULL, 0.21, 'idem_97');
+INSERT INTO transactions VALUES ('txn_200098', 'acc_0038', '2026-01-15T09:13:30Z', 743.92, 'mobile', 'APPROVED', NULL, 0.21, 'idem_98');
+INSERT INTO transactions VALUES ('txn_200099', 'acc_0018', '2026-01-15T09:14:15Z', 861.54, 'mobile', 'APPROVED', NULL, 0.72, 'idem_99');
+INSERT INTO transactions VALUES ('txn_200100', 'acc_0056', '2026-01-15T09:15:00Z', 76.71, 'pos', 'APPROVED', NULL, 0.05, 'idem_100');
+INSERT INTO transactions VALUES ('txn_200101', 'acc_0041', '2026-01-15T09:15:45Z', 226.69, 'atm', 'DUPLICATE', NULL, 0.48, NULL);
+INSERT INTO transactions VALUES ('txn_200102', 'acc_0015', '2026-01-15T09:16:30Z', 170.52, 'atm', 'APPROVED', NULL, 0.73, 'idem_102');
+INSERT INTO transactions VALUES ('txn_200103', 'acc_0014', '2026-01-15T09:17:15Z', 461.10, 'web', 'APPROVED', NULL, 0.33, 'idem_103');
+INSERT INTO transactions VALUES ('txn_200104', 'acc_0012', '2026-01-15T09:18:00Z', 432.61, 'pos', 'APPROVED', NULL, 0.35, 'idem_104');
+INSERT INTO transactions VALUES ('txn_200105', 'acc_0018', '2026-01-15T09:18:45Z', 487.66, 'web', 'APPROVED', NULL, 0.61, 'idem_105');
+INSERT INTO transactions VALUES ('txn_200106', 'acc_0015', '2026-01-15T09:19:30Z', 80.45, 'pos', 'APPROVED', NULL, 0.53, 'idem_106');
+INSERT INTO transactions VALUES ('txn_200107', 'acc_0028', '2026-01-15T09:20:15Z', 348.45, 'pos', 'APPROVED', NULL, 0.43, 'idem_107');
+INSERT INTO transactions VALUES ('txn_200108', 'acc_0036', '2026-01-15T09:21:00Z', 11.05, 'pos', 'APPROVED', NULL, 0.49, 'idem_108');
+INSERT INTO transactions VALUES ('txn_200109', 'acc_0026', '2026-01-15T09:21:45Z', 447.79, 'atm', 'APPROVED', NULL, 0.64, 'idem_109');
+INSERT INTO transactions VALUES ('txn_200110', 'acc_0048', '2026-01-15T09:22:30Z', 757.00, 'web', 'DUPLICATE', NULL, 0.66, NULL);
+INSERT INTO transactions VALUES ('txn_200111', 'acc_0021', '2026-01-15T09:23:15Z', 609.73, 'web', 'APPROVED', NULL, 0.69, 'idem_111');
+INSERT INTO transactions VALUES ('txn_200112', 'acc_0026', '2026-01-15T09:24:00Z', 671.23, 'atm', 'APPROVED', NULL, 0.79, 'idem_112');
+INSERT INTO transactions VALUES ('txn_200113', 'acc_0002', '2026-01-15T09:24:45Z', 636.41, 'pos', 'DECLINED', 'gateway_timeout', 0.89, 'idem_113');
+INSERT INTO transactions VALUES ('txn_200114', 'acc_0002', '2026-01-15T09:25:30Z', 363.70, 'atm', 'APPROVED', NULL, 0.31, 'idem_114');
+INSERT INTO transactions VALUES ('txn_200115', 'acc_0025', '2026-01-15T09:26:15Z', 629.77, 'atm', 'APPROVED', NULL, 0.5, 'idem_115');
+INSERT INTO transactions VALUES ('txn_200116', 'acc_0041', '2026-01-15T09:27:00Z', 556.01, 'atm', 'DECLINED', 'fraud_model_score', 0.82, 'idem_116');
+INSERT INTO transactions VALUES ('txn_200117', 'acc_0045', '2026-01-15T09:27:45Z', 391.02, 'mobile', 'APPROVED', NULL, 0.32, 'idem_117');
+INSERT INTO transactions VALUES ('txn_200118', 'acc_0010', '2026-01-15T09:28:30Z', 323.29, 'web', 'APPROVED', NULL, 0.11, 'idem_118');
+INSERT INTO transactions VALUES ('txn_200119', 'acc_0059', '2026-01-15T09:29:15Z', 114.18, 'mobile', 'DECLINED', 'fraud_model_score', 0.94, 'idem_119');
+INSERT INTO transactions VALUES ('txn_200120', 'acc_0003', '2026-01-15T09:30:00Z', 771.63, 'pos', 'APPROVED', NULL, 0.19, 'idem_120');
+INSERT INTO transactions VALUES ('txn_200121', 'acc_0012', '2026-01-15T09:30:45Z', 616.16, 'atm', 'APPROVED', NULL, 0.64, 'idem_121');
+INSERT INTO transactions VALUES ('txn_200122', 'acc_0046', '2026-01-15T09:31:30Z', 716.80, 'web', 'DECLINED', 'fraud_model_score', 0.83, NULL);
+INSERT INTO transactions VALUES ('txn_200123', 'acc_0039', '2026-01-15T09:32:15Z', 371.86, 'web', 'DECLINED', 'gateway_timeout', 0.2, 'idem_123');
+INSERT INTO transactions VALUES ('txn_200124', 'acc_0026', '2026-01-15T09:33:00Z', 423.32, 'pos', 'APPROVED', NULL, 0.79, 'idem_124');
+INSERT INTO transactions VALUES ('txn_200125', 'acc_0046', '2026-01-15T09:33:45Z', 184.21, 'web', 'APPROVED', NULL, 0.79, 'idem_125');
+INSERT INTO transactions VALUES ('txn_200126', 'acc_0042', '2026-01-15T09:34:30Z', 65.57, 'mobile', 'APPROVED', NULL, 0.79, 'idem_126');
+INSERT INTO transactions VALUES ('txn_200127', 'acc_0001', '2026-01-15T09:35:15Z', 467.56, 'mobile', 'APPROVED', NULL, 0.56, 'idem_127');
+INSERT INTO transactions VALUES ('txn_200128', 'acc_0010', '2026-01-15T09:36:00Z', 885.06, 'web', 'APPROVED', NULL, 0.37, 'idem_128');
+INSERT INTO transactions VALUES ('txn_200129', 'acc_0042', '2026-01-15T09:36:45Z', 9.64, 'mobile', 'APPROVED', NULL, 0.7, 'idem_129');
+INSERT INTO transactions VALUES ('txn_200130', 'acc_0013', '2026-01-15T09:37:30Z', 588.48, 'pos', 'APPROVED', NULL, 0.39, 'idem_130');
+INSERT INTO transactions VALUES ('txn_200131', 'acc_0040', '2026-01-15T09:38:15Z', 170.40, 'pos', 'APPROVED', NULL, 0.5, 'idem_131');
+INSERT INTO transactions VALUES ('txn_200132', 'acc_0043', '2026-01-15T09:39:00Z', 812.78, 'mobile', 'APPROVED', NULL, 0.79, 'idem_132');
+INSERT INTO transactions VALUES ('txn_200133', 'acc_0049', '2026-01-15T09:39:45Z', 578.33, 'atm', 'APPROVED', NULL, 0.7, 'idem_133');
+INSERT INTO transactions VALUES ('txn_200134', 'acc_0032', '2026-01-15T09:40:30Z', 286.10, 'pos', 'DUPLICATE', NULL, 0.86, NULL);
+INSERT INTO transactions VALUES ('txn_200135', 'acc_0049', '2026-01-15T09:41:15Z', 89.73, 'pos', 'APPROVED', NULL, 0.76, 'idem_135');
+INSERT INTO transactions VALUES ('txn_200136', 'acc_0060', '2026-01-15T09:42:00Z', 9.11, 'web', 'APPROVED', NULL, 0.6, 'idem_136');
+INSERT INTO transactions VALUES ('txn_200137', 'acc_0056', '2026-01-15T09:42:45Z', 450.56, 'atm', 'DECLINED', 'gateway_timeout', 0.31, 'idem_137');
+INSERT INTO transactions VALUES ('txn_200138', 'acc_0054', '2026-01-15T09:43:30Z', 744.38, 'web', 'DECLINED', 'fraud_model_score', 0.88, NULL);
+INSERT INTO transactions VALUES ('txn_200139', 'acc_0033', '2026-01-15T09:44:15Z', 517.67, 'pos', 'DECLINED', 'fraud_model_score', 0.95, 'idem_139');
+INSERT INTO transactions VALUES ('txn_200140', 'acc_0018', '2026-01-15T09:45:00Z', 472.82, 'atm', 'APPROVED', NULL, 0.7, 'idem_140');
+INSERT INTO transactions VALUES ('txn_200141', 'acc_0008', '2026-01-15T09:45:45Z', 52.95, 'web', 'APPROVED', NULL, 0.79, 'idem_141');
+INSERT INTO transactions VALUES ('txn_200142', 'acc_0056', '2026-01-15T09:46:30Z', 558.94, 'web', 'APPROVED', NULL, 0.33, 'idem_142');
+INSERT INTO transactions VALUES ('txn_200143', 'acc_0017', '2026-01-15T09:47:15Z', 839.64, 'mobile', 'APPROVED', NULL, 0.79, 'idem_143');
+INSERT INTO transactions VALUES ('txn_200144', 'acc_0051', '2026-01-15T09:48:00Z', 40.27, 'pos', 'APPROVED', NULL, 0.07, 'idem_144');
+INSERT INTO transactions VALUES ('txn_200145', 'acc_0019', '2026-01-15T09:48:45Z', 356.77, 'web', 'APPROVED', NULL, 0.79, 'idem_145');
+INSERT INTO transactions VALUES ('txn_200146', 'acc_0042', '2026-01-15T09:49:30Z', 195.64, 'atm', 'APPROVED', NULL, 0.66, 'idem_146');
+INSERT INTO transactions VALUES ('txn_200147', 'acc_0031', '2026-01-15T09:50:15Z', 883.28, 'atm', 'APPROVED', NULL, 0.2, 'idem_147');
+INSERT INTO transactions VALUES ('txn_200148', 'acc_0040', '2026-01-15T09:51:00Z', 314.98, 'mobile', 'APPROVED', NULL, 0.11, 'idem_148');
+INSERT INTO transactions VALUES ('txn_200149', 'acc_0029', '2026-01-15T09:51:45Z', 222.12, 'pos', 'APPROVED', NULL, 0.55, 'idem_149');
+INSERT INTO transactions VALUES ('txn_200150', 'acc_0048', '2026-01-15T09:52:30Z', 397.29, 'pos', 'APPROVED', NULL, 0.79, 'idem_150');
+INSERT INTO transactions VALUES ('txn_200151', 'acc_0017', '2026-01-15T09:53:15Z', 169.66, 'mobile', 'APPROVED', NULL, 0.55, 'idem_151');
+INSERT INTO transactions VALUES ('txn_200152', 'acc_0009', '2026-01-15T09:54:00Z', 486.60, 'pos', 'APPROVED', NULL, 0.43, 'idem_152');
+INSERT INTO transactions VALUES ('txn_200153', 'acc_0032', '2026-01-15T09:54:45Z', 785.75, 'atm', 'APPROVED', NULL, 0.58, 'idem_153');
+INSERT INTO transactions VALUES ('txn_200154', 'acc_0008', '2026-01-15T09:55:30Z', 148.63, 'atm', 'APPROVED', NULL, 0.79, 'idem_154');
+INSERT INTO transactions VALUES ('txn_200155', 'acc_0021', '2026-01-15T09:56:15Z', 793.03, 'atm', 'APPROVED', NULL, 0.41, 'idem_155');
+INSERT INTO transactions VALUES ('txn_200156', 'acc_0041', '2026-01-15T09:57:00Z', 383.72, 'atm', 'APPROVED', NULL, 0.17, 'idem_156');
+INSERT INTO transactions VALUES ('txn_200157', 'acc_0056', '2026-01-15T09:57:45Z', 685.85, 'web', 'APPROVED', NULL, 0.79, 'idem_157');
+INSERT INTO transactions VALUES ('txn_200158', 'acc_0046', '2026-01-15T09:58:30Z', 255.90, 'mobile', 'APPROVED', NULL, 0.62, 'idem_158');
+INSERT INTO transactions VALUES ('txn_200159', 'acc_0033', '2026-01-15T09:59:15Z', 524.84, 'mobile', 'APPROVED', NULL, 0.25, 'idem_159');
+INSERT INTO transactions VALUES ('txn_200160', 'acc_0019', '2026-01-15T10:00:00Z', 108.24, 'mobile', 'APPROVED', NULL, 0.27, 'idem_160');
+INSERT INTO transactions VALUES ('txn_200161', 'acc_0018', '2026-01-15T10:00:45Z', 325.72, 'mobile', 'APPROVED', NULL, 0.79, 'idem_161');
+INSERT INTO transactions VALUES ('txn_200162', 'acc_0035', '2026-01-15T10:01:30Z', 849.23, 'mobile', 'APPROVED', NULL, 0.38, 'idem_162');
+INSERT INTO transactions VALUES ('txn_200163', 'acc_0015', '2026-01-15T10:02:15Z', 109.26, 'mobile', 'APPROVED', NULL, 0.79, 'idem_163');
+INSERT INTO transactions VALUES ('txn_200164', 'acc_0021', '2026-01-15T10:03:00Z', 696.49, 'pos', 'APPROVED', NULL, 0.79, 'idem_164');
+INSERT INTO transactions VALUES ('txn_200165', 'acc_0045', '2026-01-15T10:03:45Z', 439.14, 'atm', 'APPROVED', NULL, 0.08, 'idem_165');
+INSERT INTO transactions VALUES ('txn_200166', 'acc_0002', '2026-01-15T10:04:30Z', 32.06, 'pos', 'APPROVED', NULL, 0.45, 'idem_166');
+INSERT INTO transactions VALUES ('txn_200167', 'acc_0047', '2026-01-15T10:05:15Z', 379.70, 'web', 'APPROVED', NULL, 0.66, 'idem_167');
+INSERT INTO transactions VALUES ('txn_200168', 'acc_0010', '2026-01-15T10:06:00Z', 171.20, 'web', 'APPROVED', NULL, 0.79, 'idem_168');
+INSERT INTO transactions VALUES ('txn_200169', 'acc_0052', '2026-01-15T10:06:45Z', 132.20, 'atm', 'DUPLICATE', NULL, 0.6, NULL);
+INSERT INTO transactions VALUES ('txn_200170', 'acc_0027', '2026-01-15T10:07:30Z', 479.69, 'mobile', 'APPROVED', NULL, 0.59, 'idem_170');
+INSERT INTO transactions VALUES ('txn_200171', 'acc_0060', '2026-01-15T10:08:15Z', 779.00, 'web', 'APPROVED', NULL, 0.27, 'idem_171');
+INSERT INTO transactions VALUES ('txn_200172', 'acc_0054', '2026-01-15T10:09:00Z', 493.75, 'pos', 'APPROVED', NULL, 0.39, 'idem_172');
+INSERT INTO transactions VALUES ('txn_200173', 'acc_0043', '2026-01-15T10:09:45Z', 859.06, 'pos', 'APPROVED', NULL, 0.5, NULL);
+INSERT INTO transactions VALUES ('txn_200174', 'acc_0060', '2026-01-15T10:10:30Z', 190.25, 'mobile', 'APPROVED', NULL, 0.27, NULL);
+INSERT INTO transactions VALUES ('txn_200175', 'acc_0022', '2026-01-15T10:11:15Z', 669.10, 'pos', 'APPROVED', NULL, 0.78, 'idem_175');
+INSERT INTO transactions VALUES ('txn_200176', 'acc_0029', '2026-01-15T10:12:00Z', 255.87, 'web', 'APPROVED', NULL, 0.12, 'idem_176');
+INSERT INTO transactions VALUES ('txn_200177', 'acc_0007', '2026-01-15T10:12:45Z', 728.65, 'pos', 'APPROVED', NULL, 0.46, 'idem_177');
+INSERT INTO transactions VALUES ('txn_200178', 'acc_0055', '2026-01-15T10:13:30Z', 757.82, 'web', 'APPROVED', NULL, 0.6, 'idem_178');
+INSERT INTO transactions VALUES ('txn_200179', 'acc_0003', '2026-01-15T10:14:15Z', 348.06, 'mobile', 'APPROVED', NULL, 0.79, 'idem_179');
+INSERT INTO transactions VALUES ('txn_200180', 'acc_0026', '2026-01-15T10:15:00Z', 177.29, 'web', 'APPROVED', NULL, 0.75, 'idem_180');
+INSERT INTO transactions VALUES ('txn_200181', 'acc_0058', '2026-01-15T10:15:45Z', 483.00, 'web', 'APPROVED', NULL, 0.67, 'idem_181');
+INSERT INTO transactions VALUES ('txn_200182', 'acc_0035', '2026-01-15T10:16:30Z', 708.36, 'atm', 'APPROVED', NULL, 0.14, 'idem_182');
+INSERT INTO transactions VALUES ('txn_200183', 'acc_0015', '2026-01-15T10:17:15Z', 43.51, 'pos', 'APPROVED', NULL, 0.3, 'idem_183');
+INSERT INTO transactions VALUES ('txn_200184', 'acc_0005', '2026-01-15T10:18:00Z', 63.69, 'web', 'APPROVED', NULL, 0.45, 'idem_184');
+INSERT INTO transactions VALUES ('txn_200185', 'acc_0033', '2026-01-15T10:18:45Z', 701.62, 'atm', 'APPROVED', NULL, 0.79, 'idem_185');
+INSERT INTO transactions VALUES ('txn_200186', 'acc_0052', '2026-01-15T10:19:30Z', 463.37, 'mobile', 'APPROVED', NULL, 0.68, 'idem_186');
+INSERT INTO transactions VALUES ('txn_200187', 'acc_0010', '2026-01-15T10:20:15Z', 73.61, 'pos', 'APPROVED', NULL, 0.79, 'idem_187');
+INSERT INTO transactions VALUES ('txn_200188', 'acc_0038', '2026-01-15T10:21:00Z', 741.05, 'mobile', 'DECLINED', 'gateway_timeout', 0.69, 'idem_188');
+INSERT INTO transactions VALUES ('txn_200189', 'acc_0038', '2026-01-15T10:21:45Z', 745.34, 'atm', 'DECLINED', 'gateway_timeout', 0.35, 'idem_189');
+INSERT INTO transactions VALUES ('txn_200190', 'acc_0053', '2026-01-15T10:22:30Z', 288.20, 'pos', 'APPROVED', NULL, 0.79, 'idem_190');
+INSERT INTO transactions VALUES ('txn_200191', 'acc_0047', '2026-01-15T10:23:15Z', 446.30, 'web', 'APPROVED', NULL, 0.05, 'idem_191');
+INSERT INTO transactions VALUES ('txn_200192', 'acc_0052', '2026-01-15T10:24:00Z', 394.11, 'web', 'APPROVED', NULL, 0.3, 'idem_192');
+INSERT INTO transactions VALUES ('txn_200193', 'acc_0038', '2026-01-15T10:24:45Z', 330.95, 'pos', 'DECLINED', 'fraud_model_score', 0.87, 'idem_193');
+INSERT INTO transactions VALUES ('txn_200194', 'acc_0037', '2026-01-15T10:25:30Z', 550.25, 'atm', 'APPROVED', NULL, 0.66, 'idem_194');
+INSERT INTO transactions VALUES ('txn_200195', 'acc_0024', '2026-01-15T10:26:15Z', 368.65, 'web', 'APPROVED', NULL, 0.5, 'idem_195');
+INSERT INTO transactions VALUES ('txn_200196', 'acc_0002', '2026-01-15T10:27:00Z', 433.55, 'web', 'APPROVED', NULL, 0.67, 'idem_196');
+INSERT INTO transactions VALUES ('txn_200197', 'acc_0029', '2026-01-15T10:27:45Z', 804.47, 'pos', 'DECLINED', 'fraud_model_score', 0.83, 'idem_197');
+INSERT INTO transactions VALUES ('txn_200198', 'acc_0025', '2026-01-15T10:28:30Z', 562.37, 'atm', 'APPROVED', NULL, 0.79, 'idem_198');
+INSERT INTO transactions VALUES ('txn_200199', 'acc_0031', '2026-01-15T10:29:15Z', 333.93, 'web', 'APPROVED', NULL, 0.72, 'idem_199');
+INSERT INTO transactions VALUES ('txn_200200', 'acc_0030', '2026-01-15T10:30:00Z', 373.11, 'atm', 'APPROVED', NULL, 0.79, 'idem_200');
+INSERT INTO transactions VALUES ('txn_200201', 'acc_0051', '2026-01-15T10:30:45Z', 447.83, 'atm', 'APPROVED', NULL, 0.24, 'idem_201');
+INSERT INTO transactions VALUES ('txn_200202', 'acc_0004', '2026-01-15T10:31:30Z', 354.46, 'pos', 'APPROVED', NULL, 0.7, 'idem_202');
+INSERT INTO transactions VALUES ('txn_200203', 'acc_0020', '2026-01-15T10:32:15Z', 828.29, 'atm', 'DECLINED', 'fraud_model_score', 0.9, 'idem_203');
+INSERT INTO transactions VALUES ('txn_200204', 'acc_0048', '2026-01-15T10:33:00Z', 195.62, 'mobile', 'APPROVED', NULL, 0.15, 'idem_204');
+INSERT INTO transactions VALUES ('txn_200205', 'acc_0046', '2026-01-15T10:33:45Z', 139.43, 'pos', 'APPROVED', NULL, 0.3, 'idem_205');
+INSERT INTO transactions VALUES ('txn_200206', 'acc_0021', '2026-01-15T10:34:30Z', 162.82, 'web', 'APPROVED', NULL, 0.46, 'idem_206');
+INSERT INTO transactions VALUES ('txn_200207', 'acc_0044', '2026-01-15T10:35:15Z', 878.31, 'atm', 'APPROVED', NULL, 0.38, 'idem_207');
+INSERT INTO transactions VALUES ('txn_200208', 'acc_0010', '2026-01-15T10:36:00Z', 796.47, 'mobile', 'DECLINED', 'fraud_model_score', 0.82, 'idem_208');
+INSERT INTO transactions VALUES ('txn_200209', 'acc_0039', '2026-01-15T10:36:45Z', 266.02, 'pos', 'DECLINED', 'gateway_timeout', 0.31, 'idem_209');
+INSERT INTO transactions VALUES ('txn_200210', 'acc_0024', '2026-01-15T10:37:30Z', 121.97, 'atm', 'APPROVED', NULL, 0.41, NULL);
+INSERT INTO transactions VALUES ('txn_200211', 'acc_0013', '2026-01-15T10:38:15Z', 216.02, 'web', 'APPROVED', NULL, 0.69, 'idem_211');
+INSERT INTO transactions VALUES ('txn_200212', 'acc_0059', '2026-01-15T10:39:00Z', 251.29, 'pos', 'APPROVED', NULL, 0.24, 'idem_212');
+INSERT INTO transactions VALUES ('txn_200213', 'acc_0003', '2026-01-15T10:39:45Z', 590.41, 'mobile', 'APPROVED', NULL, 0.59, 'idem_213');
+INSERT INTO transactions VALUES ('txn_200214', 'acc_0020', '2026-01-15T10:40:30Z', 431.46, 'mobile', 'APPROVED', NULL, 0.17, 'idem_214');
+INSERT INTO transactions VALUES ('txn_200215', 'acc_0016', '2026-01-15T10:41:15Z', 674.54, 'web', 'APPROVED', NULL, 0.16, 'idem_215');
+INSERT INTO transactions VALUES ('txn_200216', 'acc_0034', '2026-01-15T10:42:00Z', 820.70, 'atm', 'APPROVED', NULL, 0.28, 'idem_216');
+INSERT INTO transactions VALUES ('txn_200217', 'acc_0001', '2026-01-15T10:42:45Z', 60.84, 'pos', 'APPROVED', NULL, 0.78, 'idem_217');
+INSERT INTO transactions VALUES ('txn_200218', 'acc_0039', '2026-01-15T10:43:30Z', 867.60, 'pos', 'APPROVED', NULL, 0.61, 'idem_218');
+INSERT INTO transactions VALUES ('txn_200219', 'acc_0017', '2026-01-15T10:44:15Z', 781.96, 'pos', 'DUPLICATE', NULL, 0.95, NULL);
+INSERT INTO transactions VALUES ('txn_200220', 'acc_0056', '2026-01-15T10:45:00Z', 222.88, 'mobile', 'APPROVED', NULL, 0.79, 'idem_220');
+INSERT INTO transactions VALUES ('txn_200221', 'acc_0027', '2026-01-15T10:45:45Z', 524.58, 'atm', 'DECLINED', 'fraud_model_score', 0.84, NULL);
+INSERT INTO transactions VALUES ('txn_200222', 'acc_0046', '2026-01-15T10:46:30Z', 178.12, 'pos', 'APPROVED', NULL, 0.38, 'idem_222');
+INSERT INTO transactions VALUES ('txn_200223', 'acc_0015', '2026-01-15T10:47:15Z', 401.45, 'atm', 'DECLINED', 'gateway_timeout', 0.32, 'idem_223');
+INSERT INTO transactions VALUES ('txn_200224', 'acc_0049', '2026-01-15T10:48:00Z', 91.79, 'atm', 'APPROVED', NULL, 0.58, 'idem_224');
+INSERT INTO transactions VALUES ('txn_200225', 'acc_0042', '2026-01-15T10:48:45Z', 340.17, 'atm', 'APPROVED', NULL, 0.39, 'idem_225');
+INSERT INTO transactions VALUES ('txn_200226', 'acc_0002', '2026-01-15T10:49:30Z', 374.28, 'pos', 'APPROVED', NULL, 0.16, 'idem_226');
+INSERT INTO transactions VALUES ('txn_200227', 'acc_0024', '2026-01-15T10:50:15Z', 420.33, 'web', 'DECLINED', 'fraud_model_score', 0.85, 'idem_227');
+INSERT INTO transactions VALUES ('txn_200228', 'acc_0059', '2026-01-15T10:51:00Z', 388.93, 'mobile', 'APPROVED', NULL, 0.71, 'idem_228');
+INSERT INTO transactions VALUES ('txn_200229', 'acc_0044', '2026-01-15T10:51:45Z', 48.63, 'pos', 'DECLINED', 'fraud_model_score', 0.98, 'idem_229');
+INSERT INTO transactions VALUES ('txn_200230', 'acc_0012', '2026-01-15T10:52:30Z', 715.23, 'atm', 'APPROVED', NULL, 0.56, 'idem_230');
+INSERT INTO transactions VALUES ('txn_200231', 'acc_0050', '2026-01-15T10:53:15Z', 180.84, 'atm', 'APPROVED', NULL, 0.52, 'idem_231');
+INSERT INTO transactions VALUES ('txn_200232', 'acc_0047', '2026-01-15T10:54:00Z', 636.14, 'web', 'APPROVED', NULL, 0.55, 'idem_232');
+INSERT INTO transactions VALUES ('txn_200233', 'acc_0040', '2026-01-15T10:54:45Z', 811.99, 'web', 'APPROVED', NULL, 0.33, 'idem_233');
+INSERT INTO transactions VALUES ('txn_200234', 'acc_0009', '2026-01-15T10:55:30Z', 776.46, 'pos', 'APPROVED', NULL, 0.75, 'idem_234');
+INSERT INTO transactions VALUES ('txn_200235', 'acc_0042', '2026-01-15T10:56:15Z', 114.10, 'mobile', 'APPROVED', NULL, 0.79, 'idem_235');
+INSERT INTO transactions VALUES ('txn_200236', 'acc_0010', '2026-01-15T10:57:00Z', 278.08, 'web', 'APPROVED', NULL, 0.7, 'idem_236');
+INSERT INTO transactions VALUES ('txn_200237', 'acc_0040', '2026-01-15T10:57:45Z', 240.56, 'mobile', 'APPROVED', NULL, 0.79, NULL);
+INSERT INTO transactions VALUES ('txn_200238', 'acc_0056', '2026-01-15T10:58:30Z', 191.25, 'atm', 'APPROVED', NULL, 0.7, 'idem_238');
+INSERT INTO transactions VALUES ('txn_200239', 'acc_0022', '2026-01-15T10:59:15Z', 386.08, 'mobile', 'APPROVED', NULL, 0.37, NULL);
+INSERT INTO transactions VALUES ('txn_200240', 'acc_0043', '2026-01-15T11:00:00Z', 290.38, 'mobile', 'DECLINED', 'fraud_model_score', 0.82, 'idem_240');
+INSERT INTO transactions VALUES ('txn_200241', 'acc_0051', '2026-01-15T11:00:45Z', 292.70, 'mobile', 'APPROVED', NULL, 0.79, 'idem_241');
+INSERT INTO transactions VALUES ('txn_200242', 'acc_0006', '2026-01-15T11:01:30Z', 682.70, 'pos', 'APPROVED', NULL, 0.74, 'idem_242');
+INSERT INTO transactions VALUES ('txn_200243', 'acc_0045', '2026-01-15T11:02:15Z', 560.59, 'pos', 'APPROVED', NULL, 0.79, 'idem_243');
+INSERT INTO transactions VALUES ('txn_200244', 'acc_0015', '2026-01-15T11:03:00Z', 292.34, 'web', 'APPROVED', NULL, 0.48, 'idem_244');
+INSERT INTO transactions VALUES ('txn_200245', 'acc_0003', '2026-01-15T11:03:45Z', 234.12, 'web', 'DUPLICATE', NULL, 0.34, NULL);
+INSERT INTO transactions VALUES ('txn_200246', 'acc_0023', '2026-01-15T11:04:30Z', 518.62, 'mobile', 'APPROVED', NULL, 0.79, 'idem_246');
+INSERT INTO transactions VALUES ('txn_200247', 'acc_0046', '2026-01-15T11:05:15Z', 370.51, 'web', 'APPROVED', NULL, 0.77, 'idem_247');
+INSERT INTO transactions VALUES ('txn_200248', 'acc_0059', '2026-01-15T11:06:00Z', 678.51, 'web', 'DUPLICATE', NULL, 0.52, NULL);
+INSERT INTO transactions VALUES ('txn_200249', 'acc_0031', '2026-01-15T11:06:45Z', 523.26, 'web', 'APPROVED', NULL, 0.19, 'idem_249');
+INSERT INTO transactions VALUES ('txn_200250', 'acc_0058', '2026-01-15T11:07:30Z', 101.33, 'atm', 'APPROVED', NULL, 0.28, 'idem_250');
+INSERT INTO transactions VALUES ('txn_200251', 'acc_0038', '2026-01-15T11:08:15Z', 597.27, 'atm', 'APPROVED', NULL, 0.16, 'idem_251');
+INSERT INTO transactions VALUES ('txn_200252', 'acc_0017', '2026-01-15T11:09:00Z', 817.17, 'web', 'APPROVED', NULL, 0.05, 'idem_252');
+INSERT INTO transactions VALUES ('txn_200253', 'acc_0007', '2026-01-15T11:09:45Z', 810.86, 'pos', 'APPROVED', NULL, 0.21, 'idem_253');
+INSERT INTO transactions VALUES ('txn_200254', 'acc_0028', '2026-01-15T11:10:30Z', 198.12, 'web', 'APPROVED', NULL, 0.46, 'idem_254');
+INSERT INTO transactions VALUES ('txn_200255', 'acc_0015', '2026-01-15T11:11:15Z', 664.55, 'pos', 'APPROVED', NULL, 0.53, 'idem_255');
+INSERT INTO transactions VALUES ('txn_200256', 'acc_0054', '2026-01-15T11:12:00Z', 199.20, 'pos', 'APPROVED', NULL, 0.14, 'idem_256');
+INSERT INTO transactions VALUES ('txn_200257', 'acc_0032', '2026-01-15T11:12:45Z', 861.12, 'mobile', 'APPROVED', NULL, 0.23, 'idem_257');
+INSERT INTO transactions VALUES ('txn_200258', 'acc_0057', '2026-01-15T11:13:30Z', 790.82, 'mobile', 'APPROVED', NULL, 0.79, 'idem_258');
+INSERT INTO transactions VALUES ('txn_200259', 'acc_0020', '2026-01-15T11:14:15Z', 650.93, 'web', 'APPROVED', NULL, 0.25, 'idem_259');
+INSERT INTO transactions VALUES ('txn_200260', 'acc_0007', '2026-01-15T11:15:00Z', 496.08, 'web', 'APPROVED', NULL, 0.21, 'idem_260');
+INSERT INTO transactions VALUES ('txn_200261', 'acc_0047', '2026-01-15T11:15:45Z', 825.12, 'mobile', 'APPROVED', NULL, 0.19, 'idem_261');
+INSERT INTO transactions VALUES ('txn_200262', 'acc_0016', '2026-01-15T11:16:30Z', 215.10, 'atm', 'APPROVED', NULL, 0.79, 'idem_262');
+INSERT INTO transactions VALUES ('txn_200263', 'acc_0017', '2026-01-15T11:17:15Z', 5.38, 'pos', 'APPROVED', NULL, 0.13, 'idem_263');
+INSERT INTO transactions VALUES ('txn_200264', 'acc_0027', '2026-01-15T11:18:00Z', 121.96, 'web', 'APPROVED', NULL, 0.28, 'idem_264');
+INSERT INTO transactions VALUES ('txn_200265', 'acc_0029', '2026-01-15T11:18:45Z', 718.62, 'mobile', 'APPROVED', NULL, 0.16, 'idem_265');
+INSERT INTO transactions VALUES ('txn_200266', 'acc_0049', '2026-01-15T11:19:30Z', 402.52, 'pos', 'APPROVED', NULL, 0.25, NULL);
+INSERT INTO transactions VALUES ('txn_200267', 'acc_0052', '2026-01-15T11:20:15Z', 529.95, 'pos', 'APPROVED', NULL, 0.44, 'idem_267');
+INSERT INTO transactions VALUES ('txn_200268', 'acc_0049', '2026-01-15T11:21:00Z', 492.35, 'web', 'APPROVED', NULL, 0.6, 'idem_268');
+INSERT INTO transactions VALUES ('txn_200269', 'acc_0014', '2026-01-15T11:21:45Z', 681.06, 'web', 'APPROVED', NULL, 0.79, 'idem_269');
+INSERT INTO transactions VALUES ('txn_200270', 'acc_0036', '2026-01-15T11:22:30Z', 525.15, 'mobile', 'APPROVED', NULL, 0.59, 'idem_270');
+INSERT INTO transactions VALUES ('txn_200271', 'acc_0001', '2026-01-15T11:23:15Z', 18.33, 'pos', 'APPROVED', NULL, 0.79, 'idem_271');
+INSERT INTO transactions VALUES ('txn_200272', 'acc_0009', '2026-01-15T11:24:00Z', 900.38, 'pos', 'APPROVED', NULL, 0.79, 'idem_272');
+INSERT INTO transactions VALUES ('txn_200273', 'acc_0042', '2026-01-15T11:24:45Z', 407.84, 'mobile', 'APPROVED', NULL, 0.73, 'idem_273');
+INSERT INTO transactions VALUES ('txn_200274', 'acc_0021', '2026-01-15T11:25:30Z', 537.76, 'web', 'APPROVED', NULL, 0.07, 'idem_274');
+INSERT INTO transactions VALUES ('txn_200275', 'acc_0019', '2026-01-15T11:26:15Z', 49.37, 'atm', 'APPROVED', NULL, 0.17, 'idem_275');
+INSERT INTO transactions VALUES ('txn_200276', 'acc_0006', '2026-01-15T11:27:00Z', 753.82, 'mobile', 'APPROVED', NULL, 0.7, 'idem_276');
+INSERT INTO transactions VALUES ('txn_200277', 'acc_0059', '2026-01-15T11:27:45Z', 382.90, 'web', 'APPROVED', NULL, 0.33, 'idem_277');
+INSERT INTO transactions VALUES ('txn_200278', 'acc_0058', '2026-01-15T11:28:30Z', 130.15, 'pos', 'APPROVED', NULL, 0.65, 'idem_278');
+INSERT INTO transactions VALUES ('txn_200279', 'acc_0028', '2026-01-15T11:29:15Z', 238.48, 'web', 'APPROVED', NULL, 0.79, 'idem_279');
+INSERT INTO transactions VALUES ('txn_200280', 'acc_0026', '2026-01-15T11:30:00Z', 536.96, 'atm', 'APPROVED', NULL, 0.66, 'idem_280');
+INSERT INTO transactions VALUES ('txn_200281', 'acc_0017', '2026-01-15T11:30:45Z', 899.25, 'web', 'APPROVED', NULL, 0.6, 'idem_281');
+INSERT INTO transactions VALUES ('txn_200282', 'acc_0010', '2026-01-15T11:31:30Z', 622.66, 'web', 'APPROVED', NULL, 0.77, 'idem_282');
+INSERT INTO transactions VALUES ('txn_200283', 'acc_0016', '2026-01-15T11:32:15Z', 130.71, 'mobile', 'APPROVED', NULL, 0.79, 'idem_283');
+INSERT INTO transactions VALUES ('txn_200284', 'acc_0059', '2026-01-15T11:33:00Z', 813.38, 'pos', 'APPROVED', NULL, 0.08, 'idem_284');
+INSERT INTO transactions VALUES ('txn_200285', 'acc_0007', '2026-01-15T11:33:45Z', 419.38, 'mobile', 'APPROVED', NULL, 0.11, 'idem_285');
+INSERT INTO transactions VALUES ('txn_200286', 'acc_0006', '2026-01-15T11:34:30Z', 21.03, 'web', 'APPROVED', NULL, 0.39, 'idem_286');
+INSERT INTO transactions VALUES ('txn_200287', 'acc_0036', '2026-01-15T11:35:15Z', 204.77, 'mobile', 'APPROVED', NULL, 0.65, 'idem_287');
+INSERT INTO transactions VALUES ('txn_200288', 'acc_0027', '2026-01-15T11:36:00Z', 456.32, 'web', 'DUPLICATE', NULL, 0.82, NULL);
+INSERT INTO transactions VALUES ('txn_200289', 'acc_0007', '2026-01-15T11:36:45Z', 561.84, 'pos', 'APPROVED', NULL, 0.79, 'idem_289');
+INSERT INTO transactions VALUES ('txn_200290', 'acc_0028', '2026-01-15T11:37:30Z', 70.73, 'web', 'APPROVED', NULL, 0.1, 'idem_290');
+INSERT INTO transactions VALUES ('txn_200291', 'acc_0032', '2026-01-15T11:38:15Z', 301.23, 'pos', 'APPROVED', NULL, 0.73, 'idem_291');
+INSERT INTO transactions VALUES ('txn_200292', 'acc_0041', '2026-01-15T11:39:00Z', 662.65, 'mobile', 'DECLINED', 'fraud_model_score', 0.87, 'idem_292');
+INSERT INTO transactions VALUES ('txn_200293', 'acc_0021', '2026-01-15T11:39:45Z', 525.64, 'atm', 'DECLINED', 'fraud_model_score', 0.87, 'idem_293');
+INSERT INTO transactions VALUES ('txn_200294', 'acc_0058', '2026-01-15T11:40:30Z', 530.35, 'web', 'APPROVED', NULL, 0.4, 'idem_294');
+INSERT INTO transactions VALUES ('txn_200295', 'acc_0053', '2026-01-15T11:41:15Z', 881.78, 'web', 'APPROVED', NULL, 0.79, 'idem_295');
+INSERT INTO transactions VALUES ('txn_200296', 'acc_0009', '2026-01-15T11:42:00Z', 834.71, 'mobile', 'DUPLICATE', NULL, 0.56, NULL);
+INSERT INTO transactions VALUES ('txn_200297', 'acc_0040', '2026-01-15T11:42:45Z', 203.51, 'pos', 'DECLINED', 'fraud_model_score', 0.84, 'idem_297');
+INSERT INTO transactions VALUES ('txn_200298', 'acc_0052', '2026-01-15T11:43:30Z', 111.23, 'pos', 'APPROVED', NULL, 0.66, 'idem_298');
+INSERT INTO transactions VALUES ('txn_200299', 'acc_0058', '2026-01-15T11:44:15Z', 200.50, 'pos', 'APPROVED', NULL, 0.55, 'idem_299');
+INSERT INTO transactions VALUES ('txn_200300', 'acc_0036', '2026-01-15T11:45:00Z', 763.83, 'atm', 'APPROVED', NULL, 0.23, 'idem_300');
+INSERT INTO transactions VALUES ('txn_200301', 'acc_0013', '2026-01-15T11:45:45Z', 404.18, 'atm', 'APPROVED', NULL, 0.59, 'idem_301');
+INSERT INTO transactions VALUES ('txn_200302', 'acc_0016', '2026-01-15T11:46:30Z', 704.95, 'mobile', 'APPROVED', NULL, 0.49, 'idem_302');
+INSERT INTO transactions VALUES ('txn_200303', 'acc_0057', '2026-01-15T11:47:15Z', 805.34, 'pos', 'APPROVED', NULL, 0.79, 'idem_303');
+INSERT INTO transactions VALUES ('txn_200304', 'acc_0052', '2026-01-15T11:48:00Z', 867.23, 'web', 'APPROVED', NULL, 0.34, 'idem_304');
+INSERT INTO transactions VALUES ('txn_200305', 'acc_0014', '2026-01-15T11:48:45Z', 494.43, 'mobile', 'APPROVED', NULL, 0.2, 'idem_305');
+INSERT INTO transactions VALUES ('txn_200306', 'acc_0055', '2026-01-15T11:49:30Z', 836.42, 'atm', 'APPROVED', NULL, 0.18, 'idem_306');
+INSERT INTO transactions VALUES ('txn_200307', 'acc_0001', '2026-01-15T11:50:15Z', 450.28, 'pos', 'APPROVED', NULL, 0.3, 'idem_307');
+INSERT INTO transactions VALUES ('txn_200308', 'acc_0051', '2026-01-15T11:51:00Z', 5.12, 'web', 'APPROVED', NULL, 0.46, 'idem_308');
+INSERT INTO transactions VALUES ('txn_200309', 'acc_0030', '2026-01-15T11:51:45Z', 731.53, 'mobile', 'APPROVED', NULL, 0.28, 'idem_309');
+INSERT INTO transactions VALUES ('txn_200310', 'acc_0024', '2026-01-15T11:52:30Z', 592.04, 'mobile', 'APPROVED', NULL, 0.32, 'idem_310');
+INSERT INTO transactions VALUES ('txn_200311', 'acc_0038', '2026-01-15T11:53:15Z', 834.89, 'pos', 'APPROVED', NULL, 0.61, 'idem_311');
+INSERT INTO transactions VALUES ('txn_200312', 'acc_0035', '2026-01-15T11:54:00Z', 478.34, 'atm', 'APPROVED', NULL, 0.79, 'idem_312');
+INSERT INTO transactions VALUES ('txn_200313', 'acc_0037', '2026-01-15T11:54:45Z', 809.99, 'atm', 'APPROVED', NULL, 0.23, 'idem_313');
+INSERT INTO transactions VALUES ('txn_200314', 'acc_0037', '2026-01-15T11:55:30Z', 704.41, 'mobile', 'APPROVED', NULL, 0.79, 'idem_314');
+INSERT INTO transactions VALUES ('txn_200315', 'acc_0022', '2026-01-15T11:56:15Z', 265.90, 'atm', 'APPROVED', NULL, 0.4, 'idem_315');
+INSERT INTO transactions VALUES ('txn_200316', 'acc_0029', '2026-01-15T11:57:00Z', 465.59, 'pos', 'APPROVED', NULL, 0.79, 'idem_316');
+INSERT INTO transactions VALUES ('txn_200317', 'acc_0040', '2026-01-15T11:57:45Z', 184.14, 'web', 'APPROVED', NULL, 0.35, 'idem_317');
+INSERT INTO transactions VALUES ('txn_200318', 'acc_0014', '2026-01-15T11:58:30Z', 143.26, 'pos', 'APPROVED', NULL, 0.69, 'idem_318');
+INSERT INTO transactions VALUES ('txn_200319', 'acc_0047', '2026-01-15T11:59:15Z', 461.61, 'mobile', 'APPROVED', NULL, 0.23, 'idem_319');
+INSERT INTO transactions VALUES ('txn_200320', 'acc_0012', '2026-01-15T12:00:00Z', 461.09, 'mobile', 'APPROVED', NULL, 0.21, 'idem_320');
+INSERT INTO transactions VALUES ('txn_200321', 'acc_0027', '2026-01-15T12:00:45Z', 521.11, 'pos', 'APPROVED', NULL, 0.07, 'idem_321');
+INSERT INTO transactions VALUES ('txn_200322', 'acc_0027', '2026-01-15T12:01:30Z', 248.43, 'atm', 'APPROVED', NULL, 0.18, 'idem_322');
+INSERT INTO transactions VALUES ('txn_200323', 'acc_0057', '2026-01-15T12:02:15Z', 522.01, 'atm', 'APPROVED', NULL, 0.44, 'idem_323');
+INSERT INTO transactions VALUES ('txn_200324', 'acc_0001', '2026-01-15T12:03:00Z', 32.12, 'mobile', 'DECLINED', 'fraud_model_score', 0.89, 'idem_324');
+INSERT INTO transactions VALUES ('txn_200325', 'acc_0032', '2026-01-15T12:03:45Z', 387.12, 'pos', 'APPROVED', NULL, 0.79, 'idem_325');
+INSERT INTO transactions VALUES ('txn_200326', 'acc_0017', '2026-01-15T12:04:30Z', 424.79, 'mobile', 'APPROVED', NULL, 0.06, 'idem_326');
+INSERT INTO transactions VALUES ('txn_200327', 'acc_0007', '2026-01-15T12:05:15Z', 419.84, 'mobile', 'APPROVED', NULL, 0.55, 'idem_327');
+INSERT INTO transactions VALUES ('txn_200328', 'acc_0002', '2026-01-15T12:06:00Z', 123.93, 'pos', 'APPROVED', NULL, 0.46, 'idem_328');
+INSERT INTO transactions VALUES ('txn_200329', 'acc_0003', '2026-01-15T12:06:45Z', 625.53, 'atm', 'APPROVED', NULL, 0.79, 'idem_329');
+INSERT INTO transactions VALUES ('txn_200330', 'acc_0058', '2026-01-15T12:07:30Z', 258.44, 'pos', 'APPROVED', NULL, 0.05, 'idem_330');
+INSERT INTO transactions VALUES ('txn_200331', 'acc_0040', '2026-01-15T12:08:15Z', 58.42, 'atm', 'APPROVED', NULL, 0.33, 'idem_331');
+INSERT INTO transactions VALUES ('txn_200332', 'acc_0059', '2026-01-15T12:09:00Z', 584.84, 'mobile', 'APPROVED', NULL, 0.79, 'idem_332');
+INSERT INTO transactions VALUES ('txn_200333', 'acc_0038', '2026-01-15T12:09:45Z', 154.79, 'pos', 'APPROVED', NULL, 0.79, 'idem_333');
+INSERT INTO transactions VALUES ('txn_200334', 'acc_0019', '2026-01-15T12:10:30Z', 687.01, 'web', 'APPROVED', NULL, 0.79, NULL);
+INSERT INTO transactions VALUES ('txn_200335', 'acc_0051', '2026-01-15T12:11:15Z', 255.03, 'web', 'APPROVED', NULL, 0.79, 'idem_335');
+INSERT INTO transactions VALUES ('txn_200336', 'acc_0015', '2026-01-15T12:12:00Z', 768.90, 'atm', 'APPROVED', NULL, 0.27, 'idem_336');
+INSERT INTO transactions VALUES ('txn_200337', 'acc_0053', '2026-01-15T12:12:45Z', 108.31, 'pos', 'APPROVED', NULL, 0.18, 'idem_337');
+INSERT INTO transactions VALUES ('txn_200338', 'acc_0052', '2026-01-15T12:13:30Z', 464.22, 'atm', 'APPROVED', NULL, 0.41, 'idem_338');
+INSERT INTO transactions VALUES ('txn_200339', 'acc_0032', '2026-01-15T12:14:15Z', 58.15, 'web', 'APPROVED', NULL, 0.07, 'idem_339');
+INSERT INTO transactions VALUES ('txn_200340', 'acc_0044', '2026-01-15T12:15:00Z', 769.08, 'atm', 'APPROVED', NULL, 0.05, 'idem_340');
+INSERT INTO transactions VALUES ('txn_200341', 'acc_0020', '2026-01-15T12:15:45Z', 559.89, 'mobile', 'APPROVED', NULL, 0.2, 'idem_341');
+INSERT INTO transactions VALUES ('txn_200342', 'acc_0033', '2026-01-15T12:16:30Z', 773.18, 'pos', 'APPROVED', NULL, 0.16, 'idem_342');
+INSERT INTO transactions VALUES ('txn_200343', 'acc_0010', '2026-01-15T12:17:15Z', 834.39, 'web', 'APPROVED', NULL, 0.79, 'idem_343');
+INSERT INTO transactions VALUES ('txn_200344', 'acc_0017', '2026-01-15T12:18:00Z', 104.98, 'web', 'APPROVED', NULL, 0.1, 'idem_344');
+INSERT INTO transactions VALUES ('txn_200345', 'acc_0021', '2026-01-15T12:18:45Z', 858.16, 'web', 'APPROVED', NULL, 0.65, 'idem_345');
+INSERT INTO transactions VALUES ('txn_200346', 'acc_0055', '2026-01-15T12:19:30Z', 697.72, 'pos', 'APPROVED', NULL, 0.69, 'idem_346');
+INSERT INTO transactions VALUES ('txn_200347', 'acc_0009', '2026-01-15T12:20:15Z', 634.47, 'web', 'APPROVED', NULL, 0.29, 'idem_347');
+INSERT INTO transactions VALUES ('txn_200348', 'acc_0008', '2026-01-15T12:21:00Z', 211.99, 'atm', 'APPROVED', NULL, 0.71, 'idem_348');
+INSERT INTO transactions VALUES ('txn_200349', 'acc_0019', '2026-01-15T12:21:45Z', 795.86, 'pos', 'APPROVED', NULL, 0.34, 'idem_349');
+INSERT INTO transactions VALUES ('txn_200350', 'acc_0006', '2026-01-15T12:22:30Z', 362.51, 'web', 'APPROVED', NULL, 0.56, 'idem_350');
+INSERT INTO transactions VALUES ('txn_200351', 'acc_0006', '2026-01-15T12:23:15Z', 688.51, 'mobile', 'APPROVED', NULL, 0.12, 'idem_351');
+INSERT INTO transactions VALUES ('txn_200352', 'acc_0027', '2026-01-15T12:24:00Z', 645.57, 'mobile', 'DECLINED', 'gateway_timeout', 0.48, 'idem_352');
+INSERT INTO transactions VALUES ('txn_200353', 'acc_0046', '2026-01-15T12:24:45Z', 360.58, 'atm', 'DECLINED', 'fraud_model_score', 0.85, 'idem_353');
+INSERT INTO transactions VALUES ('txn_200354', 'acc_0019', '2026-01-15T12:25:30Z', 433.36, 'atm', 'APPROVED', NULL, 0.17, 'idem_354');
+INSERT INTO transactions VALUES ('txn_200355', 'acc_0019', '2026-01-15T12:26:15Z', 197.81, 'pos', 'APPROVED', NULL, 0.25, 'idem_355');
+INSERT INTO transactions VALUES ('txn_200356', 'acc_0008', '2026-01-15T12:27:00Z', 465.08, 'pos', 'APPROVED', NULL, 0.64, 'idem_356');
+INSERT INTO transactions VALUES ('txn_200357', 'acc_0007', '2026-01-15T12:27:45Z', 242.64, 'web', 'APPROVED', NULL, 0.29, 'idem_357');
+INSERT INTO transactions VALUES ('txn_200358', 'acc_0057', '2026-01-15T12:28:30Z', 396.43, 'pos', 'APPROVED', NULL, 0.23, NULL);
+INSERT INTO transactions VALUES ('txn_200359', 'acc_0006', '2026-01-15T12:29:15Z', 406.84, 'web', 'APPROVED', NULL, 0.57, 'idem_359');
+INSERT INTO transactions VALUES ('txn_200360', 'acc_0029', '2026-01-15T12:30:00Z', 855.59, 'atm', 'APPROVED', NULL, 0.53, 'idem_360');
+INSERT INTO transactions VALUES ('txn_200361', 'acc_0031', '2026-01-15T12:30:45Z', 631.79, 'web', 'APPROVED', NULL, 0.79, 'idem_361');
+INSERT INTO transactions VALUES ('txn_200362', 'acc_0002', '2026-01-15T12:31:30Z', 428.90, 'mobile', 'APPROVED', NULL, 0.29, 'idem_362');
+INSERT INTO transactions VALUES ('txn_200363', 'acc_0057', '2026-01-15T12:32:15Z', 853.27, 'pos', 'APPROVED', NULL, 0.55, 'idem_363');
+INSERT INTO transactions VALUES ('txn_200364', 'acc_0013', '2026-01-15T12:33:00Z', 719.87, 'mobile', 'APPROVED', NULL, 0.49, 'idem_364');
+INSERT INTO transactions VALUES ('txn_200365', 'acc_0027', '2026-01-15T12:33:45Z', 385.73, 'pos', 'DECLINED', 'fraud_model_score', 0.85, 'idem_365');
+INSERT INTO transactions VALUES ('txn_200366', 'acc_0005', '2026-01-15T12:34:30Z', 320.66, 'mobile', 'APPROVED', NULL, 0.39, 'idem_366');
+INSERT INTO transactions VALUES ('txn_200367', 'acc_0027', '2026-01-15T12:35:15Z', 682.44, 'pos', 'APPROVED', NULL, 0.47, 'idem_367');
+INSERT INTO transactions VALUES ('txn_200368', 'acc_0033', '2026-01-15T12:36:00Z', 560.54, 'atm', 'APPROVED', NULL, 0.28, 'idem_368');
+INSERT INTO transactions VALUES ('txn_200369', 'acc_0029', '2026-01-15T12:36:45Z', 43.63, 'web', 'APPROVED', NULL, 0.35, 'idem_369');
+INSERT INTO transactions VALUES ('txn_200370', 'acc_0020', '2026-01-15T12:37:30Z', 806.10, 'web', 'APPROVED', NULL, 0.79, 'idem_370');
+INSERT INTO transactions VALUES ('txn_200371', 'acc_0035', '2026-01-15T12:38:15Z', 424.68, 'mobile', 'APPROVED', NULL, 0.78, 'idem_371');
+INSERT INTO transactions VALUES ('txn_200372', 'acc_0025', '2026-01-15T12:39:00Z', 161.67, 'atm', 'DECLINED', 'fraud_model_score', 0.93, 'idem_372');
+INSERT INTO transactions VALUES ('txn_200373', 'acc_0028', '2026-01-15T12:39:45Z', 234.15, 'mobile', 'APPROVED', NULL, 0.18, 'idem_373');
+INSERT INTO transactions VALUES ('txn_200374', 'acc_0047', '2026-01-15T12:40:30Z', 290.47, 'pos', 'DECLINED', 'fraud_model_score', 0.97, 'idem_374');
+INSERT INTO transactions VALUES ('txn_200375', 'acc_0011', '2026-01-15T12:41:15Z', 840.97, 'pos', 'APPROVED', NULL, 0.3, 'idem_375');
+INSERT INTO transactions VALUES ('txn_200376', 'acc_0009', '2026-01-15T12:42:00Z', 615.91, 'pos', 'APPROVED', NULL, 0.79, 'idem_376');
+INSERT INTO transactions VALUES ('txn_200377', 'acc_0024', '2026-01-15T12:42:45Z', 693.35, 'web', 'APPROVED', NULL, 0.11, 'idem_377');
+INSERT INTO transactions VALUES ('txn_200378', 'acc_0015', '2026-01-15T12:43:30Z', 639.40, 'mobile', 'APPROVED', NULL, 0.14, 'idem_378');
+INSERT INTO transactions VALUES ('txn_200379', 'acc_0024', '2026-01-15T12:44:15Z', 313.63, 'web', 'DECLINED', 'fraud_model_score', 0.89, 'idem_379');
+INSERT INTO transactions VALUES ('txn_200380', 'acc_0041', '2026-01-15T12:45:00Z', 363.71, 'pos', 'APPROVED', NULL, 0.26, 'idem_380');
+INSERT INTO transactions VALUES ('txn_200381', 'acc_0025', '2026-01-15T12:45:45Z', 89.01, 'mobile', 'APPROVED', NULL, 0.79, 'idem_381');
+INSERT INTO transactions VALUES ('txn_200382', 'acc_0042', '2026-01-15T12:46:30Z', 327.63, 'web', 'APPROVED', NULL, 0.7, 'idem_382');
+INSERT INTO transactions VALUES ('txn_200383', 'acc_0014', '2026-01-15T12:47:15Z', 506.04, 'pos', 'APPROVED', NULL, 0.66, 'idem_383');
+INSERT INTO transactions VALUES ('txn_200384', 'acc_0001', '2026-01-15T12:48:00Z', 716.33, 'atm', 'APPROVED', NULL, 0.26, 'idem_384');
+INSERT INTO transactions VALUES ('txn_200385', 'acc_0029', '2026-01-15T12:48:45Z', 825.93, 'web', 'APPROVED', NULL, 0.77, 'idem_385');
+INSERT INTO transactions VALUES ('txn_200386', 'acc_0059', '2026-01-15T12:49:30Z', 207.39, 'pos', 'APPROVED', NULL, 0.51, 'idem_386');
+INSERT INTO transactions VALUES ('txn_200387', 'acc_0047', '2026-01-15T12:50:15Z', 202.73, 'web', 'APPROVED', NULL, 0.14, 'idem_387');
+INSERT INTO transactions VALUES ('txn_200388', 'acc_0049', '2026-01-15T12:51:00Z', 608.18, 'mobile', 'APPROVED', NULL, 0.74, 'idem_388');
+INSERT INTO transactions VALUES ('txn_200389', 'acc_0042', '2026-01-15T12:51:45Z', 470.36, 'atm', 'APPROVED', NULL, 0.76, 'idem_389');
+INSERT INTO transactions VALUES ('txn_200390', 'acc_0001', '2026-01-15T12:52:30Z', 232.42, 'web', 'APPROVED', NULL, 0.79, 'idem_390');
+INSERT INTO transactions VALUES ('txn_200391', 'acc_0058', '2026-01-15T12:53:15Z', 355.03, 'atm', 'APPROVED', NULL, 0.24, 'idem_391');
+INSERT INTO transactions VALUES ('txn_200392', 'acc_0009', '2026-01-15T12:54:00Z', 222.46, 'mobile', 'APPROVED', NULL, 0.53, 'idem_392');
+INSERT INTO transactions VALUES ('txn_200393', 'acc_0028', '2026-01-15T12:54:45Z', 261.11, 'pos', 'APPROVED', NULL, 0.37, 'idem_393');
+INSERT INTO transactions VALUES ('txn_200394', 'acc_0053', '2026-01-15T12:55:30Z', 746.05, 'atm', 'APPROVED', NULL, 0.39, 'idem_394');
+INSERT INTO transactions VALUES ('txn_200395', 'acc_0012', '2026-01-15T12:56:15Z', 491.63, 'atm', 'APPROVED', NULL, 0.64, 'idem_395');
+INSERT INTO transactions VALUES ('txn_200396', 'acc_0045', '2026-01-15T12:57:00Z', 105.30, 'web', 'APPROVED', NULL, 0.28, 'idem_396');
+INSERT INTO transactions VALUES ('txn_200397', 'acc_0016', '2026-01-15T12:57:45Z', 138.68, 'pos', 'APPROVED', NULL, 0.08, 'idem_397');
+INSERT INTO transactions VALUES ('txn_200398', 'acc_0013', '2026-01-15T12:58:30Z', 686.80, 'web', 'APPROVED', NULL, 0.52, 'idem_398');
+INSERT INTO transactions VALUES ('txn_200399', 'acc_0046', '2026-01-15T12:59:15Z', 356.05, 'mobile', 'APPROVED', NULL, 0.79, 'idem_399');
+
+INSERT INTO disputes VALUES ('dsp_1000', 'txn_200060', '2026-01-06', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1001', 'txn_200262', '2025-12-30', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1002', 'txn_200323', '2025-12-29', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1003', 'txn_200318', '2026-01-11', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1004', 'txn_200155', '2026-01-10', 'REVERSED', '2026-01-12');
+INSERT INTO disputes VALUES ('dsp_1005', 'txn_200391', '2026-01-08', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1006', 'txn_200245', '2026-01-04', 'REVERSED', '2026-01-05');
+INSERT INTO disputes VALUES ('dsp_1007', 'txn_200395', '2026-01-04', 'REVERSED', '2026-01-06');
+INSERT INTO disputes VALUES ('dsp_1008', 'txn_200251', '2026-01-03', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1009', 'txn_200101', '2025-12-30', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1010', 'txn_200060', '2025-12-28', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1011', 'txn_200307', '2025-12-31', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1012', 'txn_200076', '2026-01-11', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1013', 'txn_200286', '2026-01-11', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1014', 'txn_200350', '2026-01-04', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1015', 'txn_200384', '2026-01-12', 'REVERSED', '2026-01-13');
+INSERT INTO disputes VALUES ('dsp_1016', 'txn_200152', '2025-12-28', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1017', 'txn_200138', '2026-01-02', 'REVERSED', '2026-01-06');
+INSERT INTO disputes VALUES ('dsp_1018', 'txn_200279', '2026-01-04', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1019', 'txn_200250', '2026-01-14', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1020', 'txn_200104', '2026-01-09', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1021', 'txn_200217', '2026-01-03', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1022', 'txn_200342', '2026-01-08', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1023', 'txn_200360', '2026-01-12', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1024', 'txn_200064', '2026-01-13', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1025', 'txn_200249', '2026-01-14', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1026', 'txn_200338', '2025-12-31', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1027', 'txn_200014', '2026-01-06', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1028', 'txn_200138', '2026-01-01', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1029', 'txn_200138', '2025-12-29', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1030', 'txn_200378', '2026-01-10', 'REVERSED', '2026-01-12');
+INSERT INTO disputes VALUES ('dsp_1031', 'txn_200075', '2026-01-08', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1032', 'txn_200138', '2026-01-14', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1033', 'txn_200185', '2026-01-10', 'REVERSED', '2026-01-14');
+INSERT INTO disputes VALUES ('dsp_1034', 'txn_200357', '2026-01-14', 'REVERSED', '2026-01-18');
+INSERT INTO disputes VALUES ('dsp_1035', 'txn_200053', '2026-01-13', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1036', 'txn_200374', '2025-12-30', 'REJECTED', NULL);
+INSERT INTO disputes VALUES ('dsp_1037', 'txn_200252', '2026-01-13', 'REVERSED', '2026-01-15');
+INSERT INTO disputes VALUES ('dsp_1038', 'txn_200074', '2025-12-30', 'PENDING_REVIEW', NULL);
+INSERT INTO disputes VALUES ('dsp_1039', 'txn_200257', '2025-12-29', 'REVERSED', '2025-12-31');
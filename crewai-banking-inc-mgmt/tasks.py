@@ -1,8 +1,8 @@
-import json
 from crewai import Task
 from crewai.agent import Agent
-from config import ORG_CONTEXT
+from config import ORG_CONTEXT_TOKEN_BUDGET
 from complaints import COMPLAINT_TEXT
+from context import org_digest
 
 
 def create_task0_context(agent: Agent) -> Task:
@@ -10,7 +10,7 @@ def create_task0_context(agent: Agent) -> Task:
     return Task(
         description=(
             "You are given org/system context and recent release notes.\n\n"
-            f"ORG CONTEXT (memory):\n{json.dumps(ORG_CONTEXT, indent=2)}\n\n"
+            f"ORG CONTEXT (memory):\n{org_digest(ORG_CONTEXT_TOKEN_BUDGET)}\n\n"
             "Summarize the key risk areas implied by recent changes and known incidents.\n"
             "Output:\n"
             "1) 5-8 bullet 'risk hypotheses'\n"
@@ -22,11 +22,11 @@ def create_task0_context(agent: Agent) -> Task:
     )
 
 
-def create_task1_support(agent: Agent) -> Task:
+def create_task1_support(agent: Agent, complaint_text: str = COMPLAINT_TEXT) -> Task:
     """Create support analysis task."""
     return Task(
         description=(
-            f"Analyze the following customer complaints:\n{COMPLAINT_TEXT}\n\n"
+            f"Analyze the following customer complaints:\n{complaint_text}\n\n"
             "Create a structured support summary:\n"
             "- Group into incident buckets\n"
             "- For each bucket: user impact, affected platform (mobile/web), time sensitivity\n"
@@ -44,12 +44,14 @@ def create_task2_sre(agent: Agent) -> Task:
     return Task(
         description=(
             "Investigate infra-level signals for each incident bucket.\n"
-            "Use these tools (call them conceptually; they return mock outputs):\n"
-            "- mock_log_search(query)\n"
-            "- mock_metrics_fetch(metric)\n\n"
+            "Gather evidence with your tools before answering:\n"
+            "- log_search(query): payment-gateway, settlement, rates and mobile-api logs\n"
+            "- metrics_fetch(metric, start, end): e.g. card_decline_rate_pct, settlement_latency_p95_s,\n"
+            "  visa_gateway_error_rate_pct, fraud_flag_rate_pct, mobile_checkout_anr_rate_pct\n"
+            "Batch every lookup you need into ONE run_tools_concurrently call, then answer from its results.\n\n"
             "Output per bucket:\n"
-            "- Key metrics snapshot\n"
-            "- Log evidence\n"
+            "- Key metrics snapshot (cite the metric values)\n"
+            "- Log evidence (quote the log lines)\n"
             "- Likely infra causes\n"
             "- Safe mitigation steps (feature flag, rollback, scaling, CDN config, cache tuning)\n"
             "- Confidence score (0-100) and assumptions"
@@ -64,9 +66,12 @@ def create_task3_backend(agent: Agent) -> Task:
     return Task(
         description=(
             "Investigate backend/data causes for each incident bucket.\n"
-            "Use these tools (conceptually):\n"
-            "- mock_log_search(query)\n"
-            "- mock_db_query(sql)\n\n"
+            "Gather evidence with your tools before answering:\n"
+            "- log_search(query): payment-gateway, settlement, rates and mobile-api logs\n"
+            "- db_query(sql): read-only SELECT over accounts(account_id, segment, balance, apr, apr_notified_at),\n"
+            "  transactions(txn_id, account_id, created_at, amount, channel, status, decline_reason, fraud_score,\n"
+            "  idempotency_key) and disputes(dispute_id, txn_id, opened_at, state, reversed_at)\n"
+            "Batch every lookup you need into ONE run_tools_concurrently call, then answer from its results.\n\n"
             "Output per bucket:\n"
             "- Suspected service/component\n"
             "- Data consistency risks\n"
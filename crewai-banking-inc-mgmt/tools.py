@@ -0,0 +1,359 @@
+"""
+tools.py - Investigation tools for the SRE and backend agents.
+
+Backed by local stand-ins under ``sample_data/``: application logs, a metrics
+time series and a SQLite banking database seeded from ``seed.sql``. Results
+are cached, several lookups can run concurrently from one agent step, and
+every call's latency is recorded.
+"""
+import bisect
+import csv
+import glob
+import hashlib
+import json
+import os
+import queue
+import re
+import sqlite3
+import statistics
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from config import TOOLS_DATA_DIR, TOOLS_DB_PATH, DB_POOL_SIZE, TOOL_CACHE_SIZE, TOOL_WORKERS
+from tracing import get_tracer
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+
+
+def _tokens(text: str) -> set:
+    compound = _TOKEN_RE.findall(text.lower())
+    return set(compound) | {part for token in compound if "_" in token for part in token.split("_")}
+
+
+def _level(line: str) -> str:
+    """Level field of a ``<timestamp> <LEVEL> ...`` log line, ``"-"`` if the line has none."""
+    fields = line.split(" ", 2)
+    return fields[1] if len(fields) > 1 and fields[1].isalpha() and fields[1].isupper() else "-"
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    return f"{value:.6g}" if isinstance(value, float) else str(value)
+
+
+class LogIndex:
+    """Inverted index over ``*.log`` files, one entry per line."""
+
+    def __init__(self, logs_dir: str):
+        self.lines: List[str] = []
+        self.sources: List[str] = []
+        self.postings: Dict[str, List[int]] = {}
+        for path in sorted(glob.glob(os.path.join(logs_dir, "*.log"))):
+            source = os.path.splitext(os.path.basename(path))[0]
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.rstrip("\n")
+                    if not line:
+                        continue
+                    for token in _tokens(line):
+                        self.postings.setdefault(token, []).append(len(self.lines))
+                    self.lines.append(line)
+                    self.sources.append(source)
+
+    def search(self, query: str, limit: int = 20) -> str:
+        terms = _tokens(query)
+        hits = Counter()
+        for term in terms:
+            hits.update(self.postings.get(term, ()))
+        if not hits:
+            return f"No log lines match '{query}'."
+        best = max(hits.values())
+        matches = sorted((i for i, n in hits.items() if n == best), reverse=True)
+        levels = Counter(_level(self.lines[i]) for i in matches)
+        sources = Counter(self.sources[i] for i in matches)
+        header = (
+            f"{len(matches)} lines match {best}/{len(terms)} terms of '{query}' "
+            f"(levels: {dict(levels)}; sources: {dict(sources)}). Most recent {min(limit, len(matches))}:"
+        )
+        return "\n".join([header] + [f"[{self.sources[i]}] {self.lines[i]}" for i in matches[:limit]])
+
+
+class MetricsStore:
+    """In-memory time series loaded from a ``timestamp,metric,value`` CSV."""
+
+    def __init__(self, path: str):
+        self.series: Dict[str, tuple] = {}
+        points: Dict[str, List[tuple]] = {}
+        with open(path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                points.setdefault(row["metric"], []).append((row["timestamp"], float(row["value"])))
+        for metric, rows in points.items():
+            rows.sort()
+            self.series[metric] = ([t for t, _ in rows], [v for _, v in rows])
+
+    def fetch(self, metric: str, start: Optional[str] = None, end: Optional[str] = None, points: int = 12) -> str:
+        if metric not in self.series:
+            return f"Unknown metric '{metric}'. Available: {', '.join(sorted(self.series))}"
+        times, values = self.series[metric]
+        lo = bisect.bisect_left(times, start) if start else 0
+        hi = bisect.bisect_right(times, end) if end else len(times)
+        times, values = times[lo:hi], values[lo:hi]
+        if not values:
+            return f"No '{metric}' samples between {start or 'start'} and {end or 'end'}."
+        ordered = sorted(values)
+        step = max(1, len(values) // max(1, points))
+        sampled = ", ".join(f"{times[i][11:16]}={values[i]:g}" for i in range(0, len(values), step))
+        return (
+            f"{metric} {times[0]} .. {times[-1]} ({len(values)} samples): "
+            f"min {ordered[0]:g}, mean {statistics.fmean(values):.3g}, "
+            f"p95 {ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]:g}, max {ordered[-1]:g}, "
+            f"first {values[0]:g}, last {values[-1]:g}\nSeries: {sampled}"
+        )
+
+
+class SQLitePool:
+    """Fixed-size pool of read-only SQLite connections, seeded on first use."""
+
+    def __init__(self, path: str, seed_sql: str, size: int = 4):
+        if not os.path.exists(path):
+            tmp = f"{path}.tmp"
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            db = sqlite3.connect(tmp)
+            with open(seed_sql, encoding="utf-8") as f:
+                db.executescript(f.read())
+            db.commit()
+            db.close()
+            os.replace(tmp, path)
+        self._pool: queue.Queue = queue.Queue()
+        for _ in range(size):
+            self._pool.put(sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False))
+
+    @contextmanager
+    def connection(self):
+        db = self._pool.get()
+        try:
+            yield db
+        finally:
+            self._pool.put(db)
+
+    def query(self, sql: str, max_rows: int = 50) -> str:
+        if not re.match(r"^\s*(select|with)\b", sql, re.I):
+            return "Only SELECT queries are allowed."
+        try:
+            with self.connection() as db:
+                cursor = db.execute(sql)
+                rows = cursor.fetchmany(max_rows + 1)
+                columns = [c[0] for c in cursor.description]
+        except sqlite3.Error as exc:
+            return f"SQL error: {exc}"
+        lines = [" | ".join(columns)] + [" | ".join(map(_cell, row)) for row in rows[:max_rows]]
+        more = " (truncated)" if len(rows) > max_rows else ""
+        return "\n".join(lines + [f"({min(len(rows), max_rows)} rows{more})"])
+
+    def schema(self) -> str:
+        with self.connection() as db:
+            return "\n".join(row[0] for row in db.execute("SELECT sql FROM sqlite_master WHERE type = 'table'"))
+
+
+def data_fingerprint(paths: List[str]) -> str:
+    """Hash of the contents of ``paths``, for keying results derived from tool data."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class Toolbox:
+    """Shared tool backends with an LRU result cache and per-call latency records."""
+
+    def __init__(self, data_dir: str, db_path: str, pool_size: int = 4, cache_size: int = 256, workers: int = 4):
+        self.logs = LogIndex(os.path.join(data_dir, "logs"))
+        self.metrics = MetricsStore(os.path.join(data_dir, "metrics.csv"))
+        self.db = SQLitePool(db_path, os.path.join(data_dir, "seed.sql"), pool_size)
+        # Everything the tools answer from; the database may have drifted from seed.sql
+        self.data_fingerprint = data_fingerprint(
+            sorted(glob.glob(os.path.join(data_dir, "logs", "*.log")))
+            + [os.path.join(data_dir, "metrics.csv"), db_path]
+        )
+        self.handlers = {
+            "log_search": self.logs.search,
+            "metrics_fetch": self.metrics.fetch,
+            "db_query": self.db.query,
+        }
+        self.cache_size = cache_size
+        # Latest calls only, so a long-running stream of complaints stays bounded
+        self.calls: deque = deque(maxlen=10_000)
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool-call")
+
+    def call(self, tool: str, agent: Optional[str] = None, **args) -> str:
+        if tool not in self.handlers:
+            return f"Unknown tool '{tool}'. Available: {', '.join(self.handlers)}"
+        key = (tool, json.dumps(args, sort_keys=True))
+        start = time.perf_counter()
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+        cached = result is not None
+        if not cached:
+            try:
+                result = self.handlers[tool](**args)
+            except (TypeError, ValueError, KeyError) as exc:
+                result = f"Bad arguments for {tool}: {exc}"
+            except sqlite3.Error as exc:
+                # Not cached: a locked or busy database may answer on retry
+                result = f"{tool} failed: {exc}"
+            else:
+                with self._lock:
+                    self._cache[key] = result
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        end = time.perf_counter()
+        with self._lock:
+            self.calls.append({"tool": tool, "args": args, "cached": cached, "ms": (end - start) * 1000})
+        get_tracer().record(tool, "tool", start, end, agent, cached=cached, args=args)
+        return result
+
+    def call_many(self, calls: List[Dict[str, Any]], agent: Optional[str] = None) -> str:
+        futures = [self._executor.submit(self.call, c["tool"], agent, **c.get("args", {})) for c in calls]
+        return "\n\n".join(
+            f"### {c['tool']}({json.dumps(c.get('args', {}))})\n{f.result()}" for c, f in zip(calls, futures)
+        )
+
+    def latency_report(self) -> str:
+        """Per-tool call count, cache hits and latency percentiles."""
+        with self._lock:
+            calls = list(self.calls)
+        if not calls:
+            return "No tool calls."
+        lines = [f"{'tool':<14} {'calls':>5} {'cached':>6} {'p50 ms':>8} {'max ms':>8} {'total ms':>9}"]
+        for tool in sorted({c["tool"] for c in calls}):
+            ms = sorted(c["ms"] for c in calls if c["tool"] == tool)
+            cached = sum(c["cached"] for c in calls if c["tool"] == tool)
+            lines.append(f"{tool:<14} {len(ms):>5} {cached:>6} {ms[len(ms) // 2]:>8.2f} {ms[-1]:>8.2f} {sum(ms):>9.2f}")
+        return "\n".join(lines)
+
+
+_toolbox = None
+_toolbox_lock = threading.Lock()
+
+
+def get_toolbox() -> Toolbox:
+    """Return the process-wide toolbox, building indexes and the database pool on first use."""
+    global _toolbox
+    with _toolbox_lock:
+        if _toolbox is None:
+            _toolbox = Toolbox(TOOLS_DATA_DIR, TOOLS_DB_PATH, DB_POOL_SIZE, TOOL_CACHE_SIZE, TOOL_WORKERS)
+        return _toolbox
+
+
+class LogSearchInput(BaseModel):
+    query: str = Field(..., description="Keywords, e.g. 'decline fraud_model_score' or 'visa_gateway timeout'")
+    limit: int = Field(20, description="Maximum lines to return")
+
+
+class LogSearchTool(BaseTool):
+    name: str = "log_search"
+    description: str = (
+        "Search payment-gateway, settlement, rates, mobile-api and credit-bureau logs. "
+        "Returns match counts by level and source plus the most recent matching lines."
+    )
+    args_schema: Type[BaseModel] = LogSearchInput
+    agent: Optional[str] = None
+
+    def _run(self, query: str, limit: int = 20) -> str:
+        return get_toolbox().call("log_search", self.agent, query=query, limit=limit)
+
+
+class MetricsFetchInput(BaseModel):
+    metric: str = Field(..., description="Metric name, e.g. 'card_decline_rate_pct'")
+    start: Optional[str] = Field(None, description="ISO-8601 start timestamp")
+    end: Optional[str] = Field(None, description="ISO-8601 end timestamp")
+
+
+class MetricsFetchTool(BaseTool):
+    name: str = "metrics_fetch"
+    description: str = (
+        "Summarize a metric time series (min, mean, p95, max, first, last and a sampled series). "
+        "An unknown metric name lists the available metrics."
+    )
+    args_schema: Type[BaseModel] = MetricsFetchInput
+    agent: Optional[str] = None
+
+    def _run(self, metric: str, start: Optional[str] = None, end: Optional[str] = None) -> str:
+        return get_toolbox().call("metrics_fetch", self.agent, metric=metric, start=start, end=end)
+
+
+class DBQueryInput(BaseModel):
+    sql: str = Field(..., description="A read-only SELECT query")
+
+
+class DBQueryTool(BaseTool):
+    name: str = "db_query"
+    description: str = "Run a read-only SELECT against the core banking database (accounts, transactions, disputes)."
+    args_schema: Type[BaseModel] = DBQueryInput
+    agent: Optional[str] = None
+
+    def _run(self, sql: str) -> str:
+        return get_toolbox().call("db_query", self.agent, sql=sql)
+
+
+class ToolCall(BaseModel):
+    tool: str = Field(..., description="Tool name")
+    args: Dict[str, Any] = Field(default_factory=dict, description="Tool arguments")
+
+
+class MultiToolInput(BaseModel):
+    calls: List[ToolCall] = Field(..., description="Tool calls to run concurrently")
+
+
+class MultiToolCall(BaseTool):
+    name: str = "run_tools_concurrently"
+    description: str = (
+        "Run several tool calls at once and return all results. Prefer this over calling tools one by one, "
+        'e.g. [{"tool": "log_search", "args": {"query": "decline"}}, '
+        '{"tool": "metrics_fetch", "args": {"metric": "card_decline_rate_pct"}}].'
+    )
+    args_schema: Type[BaseModel] = MultiToolInput
+    allowed: List[str] = Field(default_factory=list)
+    agent: Optional[str] = None
+
+    def _run(self, calls: List[Any]) -> str:
+        calls = [c.model_dump() if isinstance(c, BaseModel) else dict(c) for c in calls]
+        refused = [c["tool"] for c in calls if c["tool"] not in self.allowed]
+        if refused:
+            return f"Tools not available to this agent: {', '.join(refused)}. Allowed: {', '.join(self.allowed)}"
+        return get_toolbox().call_many(calls, self.agent)
+
+
+def sre_tools(agent: Optional[str] = None) -> List[BaseTool]:
+    """Tools for the infrastructure analyst: logs and metrics. Calls are traced under ``agent``."""
+    return [
+        LogSearchTool(agent=agent),
+        MetricsFetchTool(agent=agent),
+        MultiToolCall(allowed=["log_search", "metrics_fetch"], agent=agent),
+    ]
+
+
+def backend_tools(agent: Optional[str] = None) -> List[BaseTool]:
+    """Tools for the backend analyst: logs and the banking database. Calls are traced under ``agent``."""
+    return [
+        LogSearchTool(agent=agent),
+        DBQueryTool(agent=agent),
+        MultiToolCall(allowed=["log_search", "db_query"], agent=agent),
+    ]
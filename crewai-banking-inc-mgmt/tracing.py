@@ -0,0 +1,156 @@
+"""
+tracing.py - Spans for tasks, LLM calls and tool calls in a crew run.
+
+Spans are attributed to the agent's task name (the AGENT_TIERS key), so a
+run can be summarized per task: wall time, queue time, LLM calls and tokens,
+and tool time. Traces export as JSON or in Chrome trace format
+(chrome://tracing, ui.perfetto.dev).
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+
+class Tracer:
+    """Thread-safe span recorder."""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, name: str, cat: str, start: float, end: float, agent: Optional[str] = None, **args):
+        """Record a span from ``time.perf_counter()`` timestamps."""
+        span = {
+            "name": name,
+            "cat": cat,
+            "agent": agent,
+            "start_ms": (start - self.t0) * 1000,
+            "duration_ms": (end - start) * 1000,
+            "thread": threading.current_thread().name,
+            "args": args,
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, cat: str, agent: Optional[str] = None, **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, cat, start, time.perf_counter(), agent, **args)
+
+    def begin_sequence(self):
+        """Mark the start of tasks that run back to back on this thread."""
+        self._local.mark = time.perf_counter()
+
+    def task_started(self, queued: float):
+        """Mark the start of a task on this thread that was ready to run at ``queued``."""
+        self._local.start = time.perf_counter()
+        self._local.queued = queued
+
+    def task_finished(self, name: str):
+        """
+        Close the task span running on this thread.
+
+        Tasks started with ``task_started`` are measured from that call; tasks
+        run in sequence start where the previous one on this thread ended.
+        """
+        end = time.perf_counter()
+        start = getattr(self._local, "start", None)
+        queued = getattr(self._local, "queued", None)
+        if start is None:
+            start = queued = getattr(self._local, "mark", self.t0)
+        self.record(name, "task", start, end, name, queue_ms=(start - queued) * 1000)
+        self._local.start = self._local.queued = None
+        self._local.mark = end
+
+    def drain(self) -> "Tracer":
+        """Move the spans recorded so far to a new tracer and keep recording from empty."""
+        drained = Tracer()
+        drained.t0 = self.t0
+        with self._lock:
+            drained.spans, self.spans = self.spans, []
+        return drained
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-task totals: wall and queue time, LLM calls and tokens, tool calls and time."""
+        with self._lock:
+            spans = list(self.spans)
+        rows: Dict[str, Dict[str, float]] = {}
+        for span in spans:
+            row = rows.setdefault(span["agent"] or "-", {
+                "wall_ms": 0.0, "queue_ms": 0.0, "llm_calls": 0, "cache_hits": 0, "llm_ms": 0.0,
+                "prompt_tokens": 0, "completion_tokens": 0, "tool_calls": 0, "tool_ms": 0.0,
+            })
+            if span["cat"] == "task":
+                row["wall_ms"] += span["duration_ms"]
+                row["queue_ms"] += span["args"].get("queue_ms", 0.0)
+            elif span["cat"] == "llm":
+                row["llm_calls"] += 1
+                row["cache_hits"] += bool(span["args"].get("cached"))
+                row["llm_ms"] += span["duration_ms"]
+                row["prompt_tokens"] += span["args"].get("prompt_tokens", 0)
+                row["completion_tokens"] += span["args"].get("completion_tokens", 0)
+            elif span["cat"] == "tool":
+                row["tool_calls"] += 1
+                row["tool_ms"] += span["duration_ms"]
+        return rows
+
+    def format_summary(self) -> str:
+        """Render the per-task summary as a table, slowest task first."""
+        rows = sorted(self.summary().items(), key=lambda item: item[1]["wall_ms"], reverse=True)
+        if not rows:
+            return "No spans recorded."
+        lines = [
+            f"{'task':<10} {'wall s':>7} {'queue s':>7} {'llm':>4} {'hits':>4} {'llm s':>7} "
+            f"{'in tok':>7} {'out tok':>7} {'tools':>5} {'tool s':>7}"
+        ]
+        for name, row in rows:
+            lines.append(
+                f"{name:<10} {row['wall_ms'] / 1000:>7.1f} {row['queue_ms'] / 1000:>7.1f} {row['llm_calls']:>4} "
+                f"{row['cache_hits']:>4} {row['llm_ms'] / 1000:>7.1f} {row['prompt_tokens']:>7} "
+                f"{row['completion_tokens']:>7} {row['tool_calls']:>5} {row['tool_ms'] / 1000:>7.2f}"
+            )
+        return "\n".join(lines)
+
+    def export_json(self, path: str):
+        with self._lock:
+            spans = list(self.spans)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"spans": spans, "summary": self.summary()}, f, indent=2, default=str)
+
+    def export_chrome_trace(self, path: str):
+        """Write complete ("X") events with one track per agent."""
+        with self._lock:
+            spans = list(self.spans)
+        tracks = {agent: i for i, agent in enumerate(dict.fromkeys(s["agent"] or "-" for s in spans), 1)}
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": agent}}
+            for agent, tid in tracks.items()
+        ]
+        for span in spans:
+            events.append({
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "pid": 1,
+                "tid": tracks[span["agent"] or "-"],
+                "ts": span["start_ms"] * 1000,
+                "dur": span["duration_ms"] * 1000,
+                "args": {**span["args"], "thread": span["thread"]},
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+    return _tracer
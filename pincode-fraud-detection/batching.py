@@ -0,0 +1,123 @@
+import asyncio
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+_STOP = float("inf")
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-text encode calls into one batched encode.
+
+    Callers submit one text at a time and get a Future back. ``workers``
+    dedicated inference threads drain a priority queue and flush a batch once
+    it holds ``max_batch_size`` texts or the oldest text has waited
+    ``max_wait_ms``. Lower ``priority`` values are encoded first, so
+    latency-sensitive callers are not stuck behind bulk work. A list
+    submitted with ``submit_batch`` is encoded as one call of its own size.
+    """
+
+    def __init__(self, encode_fn, max_batch_size=32, max_wait_ms=5.0, workers=1):
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"micro-batcher-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, text: str, priority: int = 0) -> Future:
+        future = Future()
+        self._queue.put((priority, next(self._seq), text, future))
+        return future
+
+    def submit_batch(self, texts, priority: int = 0) -> Future:
+        """Encode ``texts`` in one call, not coalesced with or split into other batches."""
+        future = Future()
+        self._queue.put((priority, next(self._seq), list(texts), future))
+        return future
+
+    def encode(self, text: str, priority: int = 0):
+        return self.submit(text, priority).result()
+
+    async def aencode(self, text: str, priority: int = 0):
+        return await asyncio.wrap_future(self.submit(text, priority))
+
+    async def aencode_many(self, texts, priority: int = 0):
+        return await asyncio.gather(*(self.aencode(text, priority) for text in texts))
+
+    async def aencode_batch(self, texts, priority: int = 0):
+        if not texts:
+            return []
+        return await asyncio.wrap_future(self.submit_batch(texts, priority))
+
+    def close(self):
+        for _ in self._threads:
+            self._queue.put((_STOP, next(self._seq), None, None))
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item[0] == _STOP:
+                return
+            if isinstance(item[2], list):
+                self._flush_whole(item)
+                continue
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item[0] == _STOP:
+                    stop = True
+                    break
+                if isinstance(item[2], list):
+                    # Whole batches are encoded on their own; leave it for the next round
+                    self._queue.put(item)
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch):
+        # Drop texts whose caller has already given up (cancelled request)
+        batch = [item for item in batch if item[3].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        texts = [text for _, _, text, _ in batch]
+        try:
+            vectors = self.encode_fn(texts)
+        except Exception as exc:
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, _, _, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+    def _flush_whole(self, item):
+        _, _, texts, future = item
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            vectors = self.encode_fn(texts)
+        except Exception as exc:
+            future.set_exception(exc)
+            return
+        future.set_result(list(vectors))
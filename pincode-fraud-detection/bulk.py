@@ -0,0 +1,49 @@
+import csv
+import json
+
+
+async def iter_lines(byte_stream):
+    """Yield decoded lines from an async byte stream without buffering the whole body."""
+    buffer = b""
+    async for chunk in byte_stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line.decode("utf-8")
+    buffer = buffer.strip()
+    if buffer:
+        yield buffer.decode("utf-8")
+
+
+async def iter_records(byte_stream, fmt="ndjson"):
+    """Yield ``(line_number, record_dict)`` pairs from an NDJSON or CSV stream.
+
+    Lines that cannot be parsed are yielded as ``(line_number, exception)`` so
+    the caller can report them without aborting the upload.
+    """
+    header = None
+    line_number = 0
+    async for line in iter_lines(byte_stream):
+        line_number += 1
+        try:
+            if fmt == "csv":
+                row = next(csv.reader([line]))
+                if header is None:
+                    header = row
+                    continue
+                yield line_number, {key: value for key, value in zip(header, row) if value != ""}
+            else:
+                yield line_number, json.loads(line)
+        except (ValueError, csv.Error) as exc:
+            yield line_number, exc
+
+
+def detect_format(content_type: str) -> str:
+    return "csv" if "csv" in (content_type or "") else "ndjson"
+
+
+def chunked(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -0,0 +1,175 @@
+import hashlib
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """Bounded embedding cache keyed by a hash of model name and text.
+
+    The memory tier evicts least-recently-used entries beyond ``max_entries``.
+    Entries older than ``ttl_seconds`` (``0`` disables expiry) are treated as
+    misses. With ``disk_path`` set, new entries are also kept in a SQLite file
+    capped at ``max_disk_entries`` so they survive restarts.
+
+    ``get`` and ``put`` only touch memory and are safe on the event loop.
+    Disk lookups go through the blocking ``load``, meant for an executor, and
+    disk writes are queued to a writer thread that commits in batches.
+    """
+
+    def __init__(self, model_name: str, max_entries: int = 10000, ttl_seconds: float = 0,
+                 disk_path: str = None, max_disk_entries: int = 1_000_000, flush_interval_s: float = 1.0):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+        self.flush_interval_s = flush_interval_s
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._pending = queue.Queue()
+        self._writer = None
+        if disk_path:
+            self._db = self._connect(disk_path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB, created REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS embeddings_created ON embeddings (created)")
+            self._db.commit()
+            self._writer = threading.Thread(target=self._write_loop, args=(self._connect(disk_path),),
+                                            name="embedding-cache-writer", daemon=True)
+            self._writer.start()
+
+    @staticmethod
+    def _connect(path):
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    @property
+    def disk(self) -> bool:
+        return self._db is not None
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def _expired(self, created):
+        return self.ttl_seconds and time.time() - created > self.ttl_seconds
+
+    def get(self, text: str):
+        """Memory-tier lookup; a miss here may still be on disk (see ``load``)."""
+        key = self.key(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1].tolist()
+            if self._db is None:
+                self.misses += 1
+            return None
+
+    def load(self, texts):
+        """Disk-tier lookup for memory misses; blocking, so run it in an executor.
+
+        Returns one vector or ``None`` per text and promotes hits to memory.
+        """
+        if self._db is None:
+            return [None] * len(texts)
+        keys = [self.key(text) for text in texts]
+        with self._db_lock:
+            rows = [
+                self._db.execute("SELECT vector, created FROM embeddings WHERE key = ?", (key,)).fetchone()
+                for key in keys
+            ]
+        vectors = []
+        with self._lock:
+            for key, row in zip(keys, rows):
+                if row is None or self._expired(row[1]):
+                    self.misses += 1
+                    vectors.append(None)
+                    continue
+                vector = np.frombuffer(row[0], dtype=np.float32)
+                self._remember(key, row[1], vector)
+                self.disk_hits += 1
+                vectors.append(vector.tolist())
+        return vectors
+
+    def put(self, text: str, vector):
+        key = self.key(text)
+        vector = np.asarray(vector, dtype=np.float32)
+        created = time.time()
+        with self._lock:
+            self._remember(key, created, vector)
+        if self._writer is not None:
+            self._pending.put((key, vector.tobytes(), created))
+
+    def _remember(self, key, created, vector):
+        self._entries[key] = (created, vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _write_loop(self, db):
+        """Drain queued puts into one transaction per ``flush_interval_s``."""
+        written = 0
+        while True:
+            rows = [self._pending.get()]
+            deadline = time.monotonic() + self.flush_interval_s
+            while rows[-1] is not None:
+                try:
+                    rows.append(self._pending.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            stop = rows[-1] is None
+            rows = [row for row in rows if row is not None]
+            if rows:
+                db.executemany("INSERT OR REPLACE INTO embeddings (key, vector, created) VALUES (?, ?, ?)", rows)
+                if written // 1000 != (written + len(rows)) // 1000:
+                    self._trim_disk(db)
+                written += len(rows)
+                db.commit()
+            if stop:
+                db.close()
+                return
+
+    def _trim_disk(self, db):
+        if self.ttl_seconds:
+            db.execute("DELETE FROM embeddings WHERE created < ?", (time.time() - self.ttl_seconds,))
+        db.execute(
+            "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY created DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "model": self.model_name,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "disk": self._db is not None,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def close(self):
+        if self._writer is not None:
+            self._pending.put(None)
+            self._writer.join()
+        if self._db is not None:
+            self._db.close()
@@ -0,0 +1,92 @@
+"""Selectable CPU inference backends for the transaction encoder.
+
+    python encoders.py --backend onnx-int8
+
+prints the cosine drift and speed of a backend against fp32 PyTorch.
+"""
+import argparse
+import time
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+# ONNX exports published alongside the model on the Hugging Face Hub
+ONNX_FILES = {
+    "onnx": "onnx/model.onnx",
+    "onnx-int8": "onnx/model_qint8_avx512_vnni.onnx",
+}
+BACKENDS = ("torch", "int8", *ONNX_FILES)
+
+
+def load_encoder(model_name: str, backend: str = "torch") -> SentenceTransformer:
+    """Load ``model_name`` for CPU inference.
+
+    ``torch`` is the fp32 baseline, ``int8`` applies PyTorch dynamic int8
+    quantization to the Linear layers, and ``onnx`` / ``onnx-int8`` run the
+    ONNX Runtime exports (needs ``pip install optimum[onnxruntime]``).
+    """
+    if backend == "torch":
+        return SentenceTransformer(model_name, device="cpu")
+    if backend == "int8":
+        import torch
+
+        model = SentenceTransformer(model_name, device="cpu")
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if backend in ONNX_FILES:
+        return SentenceTransformer(
+            model_name, device="cpu", backend="onnx", model_kwargs={"file_name": ONNX_FILES[backend]}
+        )
+    raise ValueError(f"Unknown encoder backend {backend!r}; choose from {', '.join(BACKENDS)}")
+
+
+def sample_texts(n: int = 256) -> list:
+    rng = np.random.default_rng(0)
+    cities = ["Mumbai", "Delhi", "Bengaluru", "Chennai", "Unknown"]
+    return [
+        f"Transaction from acct_{rng.integers(10_000)} to acct_{rng.integers(10_000)} "
+        f"for amount {rng.uniform(1, 50_000):.2f} at 2026-01-{rng.integers(1, 29):02d}T"
+        f"{rng.integers(24):02d}:{rng.integers(60):02d}:00Z in {rng.choice(cities)}."
+        for _ in range(n)
+    ]
+
+
+def parity_check(encoder, reference, texts) -> dict:
+    """Cosine similarity between ``encoder`` and ``reference`` embeddings of ``texts``."""
+    candidate = encoder.encode(texts, normalize_embeddings=True)
+    baseline = reference.encode(texts, normalize_embeddings=True)
+    cosine = np.sum(candidate * baseline, axis=1)
+    return {
+        "texts": len(texts),
+        "mean_cosine": float(cosine.mean()),
+        "min_cosine": float(cosine.min()),
+        "max_drift": float(1.0 - cosine.min()),
+    }
+
+
+def _ms_per_text(encoder, texts, batch_size):
+    encoder.encode(texts[:batch_size], batch_size=batch_size)
+    start = time.perf_counter()
+    encoder.encode(texts, batch_size=batch_size)
+    return (time.perf_counter() - start) * 1000 / len(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--backend", choices=BACKENDS, required=True)
+    parser.add_argument("--texts", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    texts = sample_texts(args.texts)
+    reference = load_encoder(args.model, "torch")
+    encoder = load_encoder(args.model, args.backend)
+    report = parity_check(encoder, reference, texts)
+    report["fp32_ms_per_text"] = _ms_per_text(reference, texts, args.batch_size)
+    report[f"{args.backend}_ms_per_text"] = _ms_per_text(encoder, texts, args.batch_size)
+    for key, value in report.items():
+        print(f"{key:>24}: {value:.4f}" if isinstance(value, float) else f"{key:>24}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,126 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import pinecone
-from sentence_transformers import SentenceTransformer
 import numpy as np
+import os
+import json
+import asyncio
+import gc
+import threading
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from batching import MicroBatcher
+from bulk import iter_records, detect_format, chunked
+from stores import create_store
+from cache import EmbeddingCache
+from prescore import FeatureScorer
+from encoders import load_encoder
 
-app = FastAPI(title="Fraud Detection API (Pinecone-Based)")
+# Initialize model ("torch" fp32, "int8", "onnx" or "onnx-int8"; see encoders.py)
+MODEL_NAME = "all-MiniLM-L6-v2"
+ENCODER_BACKEND = os.getenv("ENCODER_BACKEND", "torch")
 
-# Initialize model
-model = SentenceTransformer("all-MiniLM-L6-v2")
+# Load the model at import so forked workers share its pages (gunicorn --preload)
+PRELOAD_MODEL = os.getenv("FRAUD_PRELOAD", "0") == "1"
 
-# Initialize Pinecone
-pc = pinecone.Pinecone(api_key="YOUR_PINECONE_API_KEY")
-index = pc.Index("fraud-transactions")
+# Micro-batching: concurrent requests share one model.encode call
+EMBED_MAX_BATCH_SIZE = int(os.getenv("EMBED_MAX_BATCH_SIZE", "32"))
+EMBED_MAX_WAIT_MS = float(os.getenv("EMBED_MAX_WAIT_MS", "5"))
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "1"))
+
+# Encode priorities: /score jumps ahead of queued ingest work
+SCORE_PRIORITY, INGEST_PRIORITY, BULK_PRIORITY = 0, 1, 2
+
+# Embedding cache shared by /score and /ingest (EMBED_CACHE_PATH enables the disk tier)
+EMBED_CACHE_SIZE = int(os.getenv("EMBED_CACHE_SIZE", "10000"))
+EMBED_CACHE_TTL_S = float(os.getenv("EMBED_CACHE_TTL_S", "0"))
+EMBED_CACHE_PATH = os.getenv("EMBED_CACHE_PATH")
+
+# Structured pre-scoring: unambiguous transactions skip the embedding + vector query
+PRESCORE_ENABLED = os.getenv("PRESCORE_ENABLED", "1") == "1"
+PRESCORE_CLEAN_BELOW = float(os.getenv("PRESCORE_CLEAN_BELOW", "0.15"))
+PRESCORE_FRAUD_ABOVE = float(os.getenv("PRESCORE_FRAUD_ABOVE", "0.9"))
+PRESCORE_MIN_STD_RATIO = float(os.getenv("PRESCORE_MIN_STD_RATIO", "0.1"))
+PRESCORE_MIN_STD = float(os.getenv("PRESCORE_MIN_STD", "1.0"))
+
+# Bulk ingestion: encode in large batches, upsert in index-sized chunks
+INGEST_ENCODE_BATCH_SIZE = int(os.getenv("INGEST_ENCODE_BATCH_SIZE", "256"))
+UPSERT_CHUNK_SIZE = int(os.getenv("UPSERT_CHUNK_SIZE", "100"))
+UPSERT_CONCURRENCY = int(os.getenv("UPSERT_CONCURRENCY", "4"))
+
+# Vector store: "pinecone" (default), or in-process "numpy" / "faiss-hnsw" / "faiss-ivf"
+VECTOR_STORE = os.getenv("FRAUD_VECTOR_STORE", "pinecone")
+STORE_PATH = os.getenv("FRAUD_STORE_PATH", "fraud-index")
+PINECONE_API_KEY = os.getenv("PINECONE_API_KEY", "YOUR_PINECONE_API_KEY")
+PINECONE_HOST = os.getenv("PINECONE_HOST", "")
+QUERY_CONCURRENCY = int(os.getenv("QUERY_CONCURRENCY", "8"))
+
+# Queries and upserts get separate pools so ingest spikes cannot starve /score
+query_pool = ThreadPoolExecutor(max_workers=QUERY_CONCURRENCY, thread_name_prefix="query")
+upsert_pool = ThreadPoolExecutor(max_workers=UPSERT_CONCURRENCY, thread_name_prefix="upsert")
+
+# Set up by startup() so import stays fast and health checks answer immediately
+model = None
+store = None
+batcher = None
+embedding_cache = None
+ready = threading.Event()
+startup_error = None
+_model_lock = threading.Lock()
+
+def init_model():
+    global model
+    with _model_lock:
+        if model is None:
+            model = load_encoder(MODEL_NAME, ENCODER_BACKEND)
+    return model
+
+def init_store():
+    if VECTOR_STORE == "pinecone":
+        pc = pinecone.Pinecone(api_key=PINECONE_API_KEY)
+        index = pc.Index("fraud-transactions", host=PINECONE_HOST,
+                         pool_threads=QUERY_CONCURRENCY + UPSERT_CONCURRENCY)
+        return create_store(VECTOR_STORE, index=index)
+    return create_store(VECTOR_STORE, dim=model.get_sentence_embedding_dimension(), path=STORE_PATH)
+
+def startup():
+    """Load the model, prewarm it with a dummy encode, connect the store, then mark ready."""
+    global store, batcher, embedding_cache, startup_error
+    try:
+        init_model()
+        model.encode(["warmup"])
+        store = init_store()
+        embedding_cache = EmbeddingCache(f"{MODEL_NAME}:{ENCODER_BACKEND}", max_entries=EMBED_CACHE_SIZE,
+                                         ttl_seconds=EMBED_CACHE_TTL_S, disk_path=EMBED_CACHE_PATH)
+        batcher = MicroBatcher(get_embeddings, max_batch_size=EMBED_MAX_BATCH_SIZE,
+                               max_wait_ms=EMBED_MAX_WAIT_MS, workers=INFERENCE_WORKERS)
+        ready.set()
+    except Exception as exc:
+        startup_error = f"{type(exc).__name__}: {exc}"
+        raise
+
+@asynccontextmanager
+async def lifespan(app):
+    warmup = asyncio.get_running_loop().run_in_executor(None, startup)
+    yield
+    await asyncio.gather(warmup, return_exceptions=True)
+    if batcher is not None:
+        batcher.close()
+    if store is not None:
+        store.save()
+    if embedding_cache is not None:
+        embedding_cache.close()
+
+if PRELOAD_MODEL:
+    init_model()
+    gc.freeze()
+
+app = FastAPI(title="Fraud Detection API (Pinecone-Based)", lifespan=lifespan)
+
+def require_ready():
+    if not ready.is_set():
+        raise HTTPException(status_code=503, detail=startup_error or "warming up")
 
 class Transaction(BaseModel):
     transaction_id: str
@@ -28,31 +137,174 @@ def serialize_transaction(tx):
         f"for amount {tx.amount} at {tx.timestamp} in {tx.location}."
     )
 
-def get_embedding(text):
-    return model.encode([text])[0].tolist()
+def get_embeddings(texts):
+    return [vector.tolist() for vector in model.encode(texts, batch_size=len(texts))]
+
+feature_scorer = FeatureScorer(clean_below=PRESCORE_CLEAN_BELOW, fraud_above=PRESCORE_FRAUD_ABOVE,
+                               min_std_ratio=PRESCORE_MIN_STD_RATIO, min_std=PRESCORE_MIN_STD)
+
+async def embed(doc, priority):
+    return (await embed_many([doc], priority))[0]
+
+async def embed_many(docs, priority, whole=False):
+    # Memory tier on the loop; the SQLite tier (if any) in a worker thread.
+    # ``whole`` encodes the misses in one model call instead of micro-batches.
+    embeddings = [embedding_cache.get(doc) for doc in docs]
+    misses = [i for i, emb in enumerate(embeddings) if emb is None]
+    if misses and embedding_cache.disk:
+        loaded = await run_in(None, embedding_cache.load, [docs[i] for i in misses])
+        for i, emb in zip(misses, loaded):
+            embeddings[i] = emb
+        misses = [i for i in misses if embeddings[i] is None]
+    texts = [docs[i] for i in misses]
+    encoded = await (batcher.aencode_batch if whole else batcher.aencode_many)(texts, priority)
+    for i, emb in zip(misses, encoded):
+        embedding_cache.put(docs[i], emb)
+        embeddings[i] = emb
+    return embeddings
+
+async def run_in(pool, fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+
+@app.post("/score", dependencies=[Depends(require_ready)])
+async def score_transaction(tx: Transaction):
+    features = feature_scorer.features(tx)
+    feature_scorer.observe(tx)
+    risk = feature_scorer.risk(features)
+    decision = feature_scorer.decide(risk, features) if PRESCORE_ENABLED else None
+    if decision is not None:
+        return {
+            "transaction_id": tx.transaction_id,
+            "fraud_score": risk,
+            "label": decision,
+            "matches": [],
+            "stage": "prescore",
+            "features": features,
+        }
 
-@app.post("/score")
-def score_transaction(tx: Transaction):
     doc = serialize_transaction(tx)
-    emb = get_embedding(doc)
+    emb = await embed(doc, SCORE_PRIORITY)
 
-    results = index.query(vector=emb, top_k=5, include_metadata=True)
-    fraud_score = max([m.score for m in results.matches if m.metadata.get("fraud_flag")], default=0)
+    matches = await run_in(query_pool, store.query, emb, 5)
+    fraud_score = max([m.score for m in matches if m.metadata.get("fraud_flag")], default=0)
 
     return {
         "transaction_id": tx.transaction_id,
         "fraud_score": fraud_score,
         "label": "fraud" if fraud_score > 0.75 else "suspicious" if fraud_score > 0.45 else "clean",
-        "matches": results.matches
+        "matches": matches,
+        "stage": "vector",
+        "features": features,
     }
 
-@app.post("/ingest")
-def ingest_transaction(tx: Transaction):
+@app.post("/ingest", dependencies=[Depends(require_ready)])
+async def ingest_transaction(tx: Transaction):
+    feature_scorer.observe(tx)
     doc = serialize_transaction(tx)
-    emb = get_embedding(doc)
+    emb = await embed(doc, INGEST_PRIORITY)
+
+    await run_in(upsert_pool, store.upsert, [to_vector(tx, emb)])
+
+    return {"status": "success", "id": tx.transaction_id}
+
+def to_vector(tx, emb):
+    return {"id": tx.transaction_id, "values": emb, "metadata": tx.dict()}
+
+def upsert_chunk(vectors):
+    store.upsert(vectors)
+    return len(vectors)
+
+@app.post("/ingest/bulk", dependencies=[Depends(require_ready)])
+async def ingest_bulk(request: Request):
+    """Ingest a streamed NDJSON or CSV body of transactions.
+
+    Responds with NDJSON: one line per upserted chunk or rejected record,
+    followed by a summary line.
+    """
+    fmt = detect_format(request.headers.get("content-type"))
+
+    async def progress():
+        loop = asyncio.get_running_loop()
+        totals = {"received": 0, "upserted": 0, "failed": 0, "chunks": 0}
+        pending = {}
+        batch = []
+
+        async def drain(limit):
+            while len(pending) > limit:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    chunk_number, ids = pending.pop(future)
+                    report = {"chunk": chunk_number, "count": len(ids), "first_id": ids[0], "last_id": ids[-1]}
+                    if future.exception() is None:
+                        totals["upserted"] += len(ids)
+                        report["status"] = "ok"
+                    else:
+                        totals["failed"] += len(ids)
+                        report["status"] = "error"
+                        report["error"] = str(future.exception())
+                    yield json.dumps(report) + "\n"
+
+        async def flush():
+            docs = [serialize_transaction(tx) for tx in batch]
+            try:
+                embeddings = await embed_many(docs, BULK_PRIORITY, whole=True)
+            except Exception as exc:
+                totals["failed"] += len(batch)
+                yield json.dumps({"status": "error", "count": len(batch), "first_id": batch[0].transaction_id,
+                                  "last_id": batch[-1].transaction_id, "error": f"encode failed: {exc}"}) + "\n"
+                batch.clear()
+                return
+            vectors = [to_vector(tx, emb) for tx, emb in zip(batch, embeddings)]
+            batch.clear()
+            for chunk in chunked(vectors, UPSERT_CHUNK_SIZE):
+                async for line in drain(UPSERT_CONCURRENCY - 1):
+                    yield line
+                totals["chunks"] += 1
+                future = loop.run_in_executor(upsert_pool, upsert_chunk, chunk)
+                pending[future] = (totals["chunks"], [vector["id"] for vector in chunk])
+
+        async for line_number, record in iter_records(request.stream(), fmt):
+            totals["received"] += 1
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                tx = Transaction(**record)
+                feature_scorer.observe(tx)
+                batch.append(tx)
+            except (ValueError, TypeError) as exc:
+                totals["failed"] += 1
+                yield json.dumps({"line": line_number, "status": "invalid", "error": str(exc)}) + "\n"
+                continue
+            if len(batch) >= INGEST_ENCODE_BATCH_SIZE:
+                async for line in flush():
+                    yield line
+
+        if batch:
+            async for line in flush():
+                yield line
+        async for line in drain(0):
+            yield line
+        yield json.dumps({"status": "done", **totals}) + "\n"
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+@app.post("/snapshot", dependencies=[Depends(require_ready)])
+def snapshot_store():
+    store.save()
+    return {"status": "success", "store": VECTOR_STORE}
+
+@app.get("/cache/stats", dependencies=[Depends(require_ready)])
+def cache_stats():
+    return embedding_cache.stats()
 
-    index.upsert([
-        {"id": tx.transaction_id, "values": emb, "metadata": tx.dict()}
-    ])
+@app.get("/livez")
+def liveness():
+    # A failed startup never becomes ready; report it so the orchestrator restarts the process
+    if startup_error is not None:
+        raise HTTPException(status_code=503, detail=startup_error)
+    return {"status": "alive"}
 
-    return {"status": "success", "id": tx.transaction_id}
\ No newline at end of file
+@app.get("/readyz")
+def readiness():
+    require_ready()
+    return {"status": "ready", "encoder": ENCODER_BACKEND, "store": VECTOR_STORE}
@@ -0,0 +1,163 @@
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+
+
+def parse_timestamp(value: str) -> float:
+    """Seconds since the epoch for an ISO-8601 or numeric timestamp; now if unparseable."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return time.time()
+
+
+def _ramp(value, low, high):
+    return min(1.0, max(0.0, (value - low) / (high - low)))
+
+
+class _BoundedMap(OrderedDict):
+    """Per-entity state that forgets the least recently seen entity past ``limit``."""
+
+    def __init__(self, limit, factory):
+        super().__init__()
+        self.limit = limit
+        self.factory = factory
+
+    def touch(self, key):
+        value = self.get(key)
+        if value is None:
+            value = self[key] = self.factory()
+            if len(self) > self.limit:
+                self.popitem(last=False)
+        else:
+            self.move_to_end(key)
+        return value
+
+
+class _AmountHistory:
+    __slots__ = ("amounts", "total", "total_sq")
+
+    def __init__(self, size):
+        self.amounts = deque(maxlen=size)
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, amount):
+        if len(self.amounts) == self.amounts.maxlen:
+            oldest = self.amounts[0]
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+        self.amounts.append(amount)
+        self.total += amount
+        self.total_sq += amount * amount
+
+    def zscore(self, amount, min_std_ratio, min_std):
+        n = len(self.amounts)
+        mean = self.total / n
+        std = math.sqrt(max(self.total_sq / n - mean * mean, 0.0))
+        # A sender who always pays the same amount has std ~0; without a floor
+        # a one-unit change would score as an extreme outlier
+        return (amount - mean) / max(std, min_std_ratio * abs(mean), min_std)
+
+
+class FeatureScorer:
+    """Cheap rule-based risk score over raw transaction fields.
+
+    Tracks per-sender and per-receiver velocity over ``window_s``, each
+    sender's last ``history_size`` amounts and last location. The amount
+    z-score needs ``min_history`` amounts and divides by at least
+    ``min_std_ratio`` of the mean or ``min_std``. Scoring only reads this
+    state; ``observe`` records it. ``decide`` returns ``"clean"`` or ``"fraud"`` when the risk is unambiguous and
+    ``None`` when the transaction should go through embedding similarity.
+    """
+
+    def __init__(self, window_s: float = 3600, history_size: int = 50, max_entities: int = 100_000,
+                 clean_below: float = 0.15, fraud_above: float = 0.9, min_history: int = 5,
+                 location_window_s: float = 6 * 3600, min_std_ratio: float = 0.1, min_std: float = 1.0):
+        self.window_s = window_s
+        self.clean_below = clean_below
+        self.fraud_above = fraud_above
+        self.min_history = min_history
+        self.min_std_ratio = min_std_ratio
+        self.min_std = min_std
+        self.location_window_s = location_window_s
+        self._senders = _BoundedMap(max_entities, lambda: deque(maxlen=1000))
+        self._receivers = _BoundedMap(max_entities, lambda: deque(maxlen=1000))
+        self._amounts = _BoundedMap(max_entities, lambda: _AmountHistory(history_size))
+        self._locations = _BoundedMap(max_entities, lambda: [None, 0.0])
+        self._seen = _BoundedMap(max_entities, lambda: True)
+        self._lock = threading.Lock()
+
+    def _velocity(self, times, now):
+        if times is None:
+            return 0
+        cutoff = now - self.window_s
+        return sum(1 for t in times if t >= cutoff)
+
+    def _prune(self, times, now):
+        while times and times[0] < now - self.window_s:
+            times.popleft()
+
+    def features(self, tx) -> dict:
+        # Plain lookups: scoring an unseen sender must not create or reorder state
+        now = parse_timestamp(tx.timestamp)
+        with self._lock:
+            sender_velocity = self._velocity(self._senders.get(tx.sender), now)
+            receiver_velocity = self._velocity(self._receivers.get(tx.receiver), now)
+            history = self._amounts.get(tx.sender)
+            last_location, last_seen = self._locations.get(tx.sender) or (None, 0.0)
+            history_size = len(history.amounts) if history is not None else 0
+            zscore = (
+                history.zscore(tx.amount, self.min_std_ratio, self.min_std)
+                if history_size >= self.min_history else None
+            )
+        location_changed = (
+            last_location is not None and tx.location != "Unknown" and tx.location != last_location
+        )
+        return {
+            "sender_velocity": sender_velocity,
+            "receiver_velocity": receiver_velocity,
+            "history_size": history_size,
+            "amount_zscore": zscore,
+            "location_changed": location_changed,
+            "seconds_since_last": now - last_seen if last_location is not None else None,
+        }
+
+    def risk(self, features: dict) -> float:
+        risks = [
+            0.6 * _ramp(features["sender_velocity"], 5, 20),
+            0.5 * _ramp(features["receiver_velocity"], 20, 100),
+        ]
+        if features["amount_zscore"] is not None:
+            risks.append(0.8 * _ramp(features["amount_zscore"], 2, 6))
+        if features["location_changed"]:
+            fast = features["seconds_since_last"] < self.location_window_s
+            risks.append(0.7 if fast else 0.2)
+        return 1.0 - math.prod(1.0 - r for r in risks)
+
+    def decide(self, risk: float, features: dict):
+        if risk >= self.fraud_above:
+            return "fraud"
+        if risk < self.clean_below and features["history_size"] >= self.min_history:
+            return "clean"
+        return None
+
+    def observe(self, tx):
+        """Record a transaction; repeated ``transaction_id``s are counted once."""
+        now = parse_timestamp(tx.timestamp)
+        with self._lock:
+            if tx.transaction_id in self._seen:
+                return
+            self._seen.touch(tx.transaction_id)
+            for times in (self._senders.touch(tx.sender), self._receivers.touch(tx.receiver)):
+                times.append(now)
+                self._prune(times, now)
+            self._amounts.touch(tx.sender).add(tx.amount)
+            if tx.location != "Unknown":
+                self._locations.touch(tx.sender)[:] = [tx.location, now]
@@ -0,0 +1,287 @@
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+
+VECTORS_FILE = "vectors.npy"
+FAISS_FILE = "index.faiss"
+META_FILE = "meta.json"
+
+
+@dataclass
+class Match:
+    id: str
+    score: float
+    metadata: dict = field(default_factory=dict)
+
+
+class VectorStore:
+    """Minimal interface the API needs from a vector index."""
+
+    def query(self, vector, top_k: int) -> list:
+        raise NotImplementedError
+
+    def upsert(self, vectors: list) -> None:
+        raise NotImplementedError
+
+    def save(self, path: str = None) -> None:
+        """Persist a snapshot. Remote stores are durable already."""
+
+
+class PineconeStore(VectorStore):
+    def __init__(self, index):
+        self.index = index
+
+    def query(self, vector, top_k):
+        results = self.index.query(vector=vector, top_k=top_k, include_metadata=True)
+        return [Match(m.id, m.score, m.metadata or {}) for m in results.matches]
+
+    def upsert(self, vectors):
+        self.index.upsert(vectors)
+
+
+def _normalize(matrix):
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def _write_meta(path, meta):
+    tmp = os.path.join(path, META_FILE + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(path, META_FILE))
+
+
+def _read_meta(path):
+    with open(os.path.join(path, META_FILE)) as f:
+        return json.load(f)
+
+
+class NumpyStore(VectorStore):
+    """Exact cosine top-k over an in-process float32 matrix.
+
+    Snapshots are a ``.npy`` matrix plus a JSON sidecar; reloading memory-maps
+    the matrix so several workers can share the pages read-only. The first
+    upsert after a mapped load copies the matrix into private memory.
+    """
+
+    def __init__(self, dim: int, path: str = None, mmap: bool = True):
+        self.dim = dim
+        self.path = path
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._size = 0
+        self._ids = []
+        self._metadata = []
+        self._rows = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(os.path.join(path, VECTORS_FILE)):
+            self.load(path, mmap=mmap)
+
+    def __len__(self):
+        return self._size
+
+    def upsert(self, vectors):
+        values = _normalize([v["values"] for v in vectors])
+        with self._lock:
+            if isinstance(self._vectors, np.memmap):
+                self._vectors = np.array(self._vectors)
+            for vector, value in zip(vectors, values):
+                row = self._rows.get(vector["id"])
+                if row is None:
+                    row = self._append_row()
+                    self._rows[vector["id"]] = row
+                    self._ids.append(vector["id"])
+                    self._metadata.append(vector.get("metadata") or {})
+                else:
+                    self._metadata[row] = vector.get("metadata") or {}
+                self._vectors[row] = value
+
+    def _append_row(self):
+        if self._size == len(self._vectors):
+            grown = np.zeros((max(1024, 2 * len(self._vectors)), self.dim), dtype=np.float32)
+            grown[:self._size] = self._vectors[:self._size]
+            self._vectors = grown
+        self._size += 1
+        return self._size - 1
+
+    def query(self, vector, top_k):
+        with self._lock:
+            matrix = self._vectors[:self._size]
+            ids, metadata = self._ids, self._metadata
+        if not len(matrix):
+            return []
+        scores = matrix @ _normalize(vector)
+        top_k = min(top_k, len(scores))
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+        return [Match(ids[row], float(scores[row]), metadata[row]) for row in top]
+
+    def save(self, path=None):
+        path = path or self.path
+        os.makedirs(path, exist_ok=True)
+        with self._lock:
+            matrix = np.array(self._vectors[:self._size])
+            meta = {"dim": self.dim, "ids": list(self._ids), "metadata": list(self._metadata)}
+        tmp = os.path.join(path, "vectors.tmp.npy")
+        np.save(tmp, matrix)
+        os.replace(tmp, os.path.join(path, VECTORS_FILE))
+        _write_meta(path, meta)
+
+    def load(self, path, mmap=True):
+        meta = _read_meta(path)
+        matrix = np.load(os.path.join(path, VECTORS_FILE), mmap_mode="r" if mmap else None)
+        with self._lock:
+            self._vectors = matrix
+            self._size = len(matrix)
+            self._ids = meta["ids"]
+            self._metadata = meta["metadata"]
+            self._rows = {vector_id: row for row, vector_id in enumerate(self._ids)}
+
+
+def _import_faiss():
+    try:
+        import faiss
+    except ImportError as exc:
+        raise ImportError("FAISS backends require `pip install faiss-cpu`") from exc
+    return faiss
+
+
+class FaissStore(VectorStore):
+    """Approximate cosine top-k with a FAISS HNSW or IVF index.
+
+    IVF needs training, so vectors are buffered (and searched exactly) until
+    ``train_size`` of them have arrived. FAISS indexes cannot overwrite a
+    vector in place, so re-upserting an id appends a new row and the old row
+    is skipped at query time.
+    """
+
+    def __init__(self, dim: int, kind: str = "hnsw", path: str = None, mmap: bool = True,
+                 hnsw_m: int = 32, ef_search: int = 64, nlist: int = 256, nprobe: int = 16):
+        self.faiss = _import_faiss()
+        self.dim = dim
+        self.kind = kind
+        self.path = path
+        self.ef_search = ef_search
+        self.nprobe = nprobe
+        self.train_size = nlist * 39
+        if kind == "hnsw":
+            self.factory = f"HNSW{hnsw_m}"
+        elif kind == "ivf":
+            self.factory = f"IVF{nlist},Flat"
+        else:
+            raise ValueError(f"Unknown FAISS index kind: {kind!r}")
+        self._index = self._new_index()
+        self._mapped = False
+        self._pending = []
+        self._ids = []
+        self._metadata = []
+        self._rows = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(os.path.join(path, FAISS_FILE)):
+            self.load(path, mmap=mmap)
+
+    def _new_index(self):
+        return self.faiss.index_factory(self.dim, self.factory, self.faiss.METRIC_INNER_PRODUCT)
+
+    def _tune(self, index):
+        if self.kind == "hnsw":
+            index.hnsw.efSearch = self.ef_search
+        else:
+            self.faiss.extract_index_ivf(index).nprobe = self.nprobe
+        return index
+
+    def upsert(self, vectors):
+        values = _normalize([v["values"] for v in vectors])
+        with self._lock:
+            if self._mapped:
+                self._index = self._tune(self.faiss.read_index(os.path.join(self.path, FAISS_FILE)))
+                self._mapped = False
+            for vector in vectors:
+                self._rows[vector["id"]] = len(self._ids)
+                self._ids.append(vector["id"])
+                self._metadata.append(vector.get("metadata") or {})
+            if self._index.is_trained:
+                self._index.add(values)
+                return
+            self._pending.extend(values)
+            if len(self._pending) >= self.train_size:
+                pending = np.stack(self._pending)
+                self._index.train(pending)
+                self._tune(self._index)
+                self._index.add(pending)
+                self._pending = []
+
+    def query(self, vector, top_k):
+        query = _normalize(vector).reshape(1, -1)
+        with self._lock:
+            stale = len(self._ids) - len(self._rows)
+            fetch = min(top_k + stale, len(self._ids), 4 * top_k)
+            if fetch == 0:
+                return []
+            if self._index.is_trained:
+                scores, rows = self._index.search(query, fetch)
+                scores, rows = scores[0], rows[0]
+            else:
+                exact = np.stack(self._pending) @ query[0]
+                rows = np.argsort(-exact)[:fetch]
+                scores = exact[rows]
+            matches = []
+            for score, row in zip(scores, rows):
+                if row < 0 or self._rows.get(self._ids[row]) != row:
+                    continue
+                matches.append(Match(self._ids[row], float(score), self._metadata[row]))
+                if len(matches) == top_k:
+                    break
+            return matches
+
+    def save(self, path=None):
+        path = path or self.path
+        os.makedirs(path, exist_ok=True)
+        with self._lock:
+            if self._pending:
+                np.save(os.path.join(path, VECTORS_FILE), np.stack(self._pending))
+            tmp = os.path.join(path, FAISS_FILE + ".tmp")
+            self.faiss.write_index(self._index, tmp)
+            os.replace(tmp, os.path.join(path, FAISS_FILE))
+            _write_meta(path, {"dim": self.dim, "factory": self.factory, "ids": list(self._ids),
+                               "metadata": list(self._metadata), "pending": len(self._pending)})
+
+    def load(self, path, mmap=True):
+        meta = _read_meta(path)
+        if meta["factory"] != self.factory:
+            raise ValueError(f"Snapshot at {path} is {meta['factory']}, expected {self.factory}")
+        index_file = os.path.join(path, FAISS_FILE)
+        mapped = False
+        if mmap:
+            try:
+                index = self.faiss.read_index(index_file, self.faiss.IO_FLAG_MMAP | self.faiss.IO_FLAG_READ_ONLY)
+                mapped = True
+            except RuntimeError:
+                index = self.faiss.read_index(index_file)
+        else:
+            index = self.faiss.read_index(index_file)
+        with self._lock:
+            self._index = self._tune(index) if index.is_trained else index
+            self._mapped = mapped
+            self._pending = list(np.load(os.path.join(path, VECTORS_FILE))) if meta.get("pending") else []
+            self._ids = meta["ids"]
+            self._metadata = meta["metadata"]
+            self._rows = {vector_id: row for row, vector_id in enumerate(self._ids)}
+
+
+def create_store(kind: str, dim: int = None, path: str = None, index=None) -> VectorStore:
+    """Build the store selected by ``FRAUD_VECTOR_STORE``.
+
+    ``pinecone`` wraps an existing Pinecone index; ``numpy`` is exact
+    in-process search; ``faiss-hnsw`` / ``faiss-ivf`` are approximate.
+    """
+    if kind == "pinecone":
+        return PineconeStore(index)
+    if kind == "numpy":
+        return NumpyStore(dim, path=path)
+    if kind in ("faiss-hnsw", "faiss-ivf"):
+        return FaissStore(dim, kind=kind.split("-", 1)[1], path=path)
+    raise ValueError(f"Unknown vector store: {kind!r}")
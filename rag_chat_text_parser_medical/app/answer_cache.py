@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from typing import Collection, Optional
+import hashlib
+import itertools
+import threading
+
+import numpy as np
+
+from app.config import ANSWER_CACHE_THRESHOLD, ANSWER_CACHE_MAX_ENTRIES, ANSWER_CACHE_MAX_BYTES
+
+
+class SemanticAnswerCache:
+    """Answers keyed by document-set fingerprint, conversation and query embedding.
+
+    A lookup hits when a cached question for the same fingerprint and the same
+    conversation so far (``history``, the text the prompt was built with) has
+    cosine similarity of at least ``threshold`` with the new one. Entries are evicted
+    least-recently-used once ``max_entries`` or ``max_bytes`` is exceeded.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1000, max_bytes: int = 16 * 1024 * 1024):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _unit(vector):
+        vector = np.asarray(vector, dtype=np.float32)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    @staticmethod
+    def _digest(history: str) -> str:
+        return hashlib.sha256(history.encode("utf-8")).hexdigest()
+
+    def get(self, fingerprint: str, query_vector, history: str = "") -> Optional[str]:
+        query = self._unit(query_vector)
+        conversation = self._digest(history)
+        with self._lock:
+            candidates = [(key, entry) for key, entry in self._entries.items()
+                          if entry[0] == fingerprint and entry[1] == conversation]
+            if candidates:
+                scores = np.stack([entry[2] for _, entry in candidates]) @ query
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    key, entry = candidates[best]
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[3]
+            self.misses += 1
+            return None
+
+    def put(self, fingerprint: str, query_vector, answer: str, history: str = ""):
+        vector = self._unit(query_vector)
+        size = vector.nbytes + len(answer.encode("utf-8"))
+        with self._lock:
+            self._entries[next(self._ids)] = (fingerprint, self._digest(history), vector, answer, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[4]
+
+    def retain(self, fingerprints: Collection[str]):
+        """Drop every entry built against a document set not in ``fingerprints``."""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[0] not in fingerprints]:
+                self._bytes -= self._entries.pop(key)[4]
+
+
+_answer_cache = None
+_answer_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> SemanticAnswerCache:
+    """Process-wide cache, shared by every Streamlit session."""
+    global _answer_cache
+    with _answer_cache_lock:
+        if _answer_cache is None:
+            _answer_cache = SemanticAnswerCache(ANSWER_CACHE_THRESHOLD, ANSWER_CACHE_MAX_ENTRIES,
+                                                ANSWER_CACHE_MAX_BYTES)
+        return _answer_cache
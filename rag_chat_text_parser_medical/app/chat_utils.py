@@ -1,10 +1,22 @@
 from euriai.langchain import create_chat_model
+from app.config import CHAT_BASE_URL
+import asyncio
+import time
 
 API_KEY = None
 MODEL = "gpt-4.1-nano"
 TEMPERATURE = 0.7
 
-def get_chat_model(api_key: str = None):
+def get_chat_model(api_key: str = None, base_url: str = None):
+    base_url = base_url or CHAT_BASE_URL
+    if base_url:
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(
+            base_url=base_url,
+            api_key=api_key or API_KEY or "stub",
+            model=MODEL,
+            temperature=TEMPERATURE
+        )
     return create_chat_model(
         api_key=api_key or API_KEY,
         model=MODEL,
@@ -15,3 +27,51 @@ def ask_chat_model(chat_model, prompt: str):
     response = chat_model.invoke(prompt)
     return response.content 
 
+def _record(stats: dict, start: float, first: float, chunks: int):
+    elapsed = time.perf_counter() - start
+    stats["ttft_ms"] = ((first or time.perf_counter()) - start) * 1000
+    stats["tokens"] = chunks
+    stats["total_ms"] = elapsed * 1000
+    generating = elapsed - (first - start) if first else 0
+    stats["tokens_per_s"] = chunks / generating if generating > 0 else 0.0
+
+def stream_chat_model(chat_model, prompt: str, stats: dict = None):
+    """Yield answer text as it arrives.
+
+    ``stats`` is filled with time to first token, streamed chunk count
+    (roughly one token each) and tokens/sec once the stream ends.
+    """
+    stats = {} if stats is None else stats
+    start, first, chunks = time.perf_counter(), None, 0
+    for chunk in chat_model.stream(prompt):
+        if not chunk.content:
+            continue
+        if first is None:
+            first = time.perf_counter()
+        chunks += 1
+        yield chunk.content
+    _record(stats, start, first, chunks)
+
+async def astream_chat_model(chat_model, prompt: str, stats: dict = None):
+    """Async variant of ``stream_chat_model`` over ``chat_model.astream``."""
+    stats = {} if stats is None else stats
+    start, first, chunks = time.perf_counter(), None, 0
+    async for chunk in chat_model.astream(prompt):
+        if not chunk.content:
+            continue
+        if first is None:
+            first = time.perf_counter()
+        chunks += 1
+        yield chunk.content
+    _record(stats, start, first, chunks)
+
+def iter_async(stream, loop: asyncio.AbstractEventLoop):
+    """Drive an async generator on ``loop`` from sync code such as ``st.write_stream``."""
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(stream.aclose())
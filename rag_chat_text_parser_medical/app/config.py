@@ -1 +1,40 @@
-EURI_API_KEY="test"
\ No newline at end of file
+EURI_API_KEY="test"
+
+# Persistent FAISS index shared across sessions and restarts
+INDEX_DIR="index_store"
+# A session idle this long is forgotten and documents no other session holds are deleted
+SESSION_TTL_S=3600
+SESSION_EXPIRY_CHECK_S=60
+
+# One embedding model per process, shared by all sessions
+EMBEDDING_MODEL="sentence-transformers/all-mpnet-base-v2"
+EMBED_BATCH_SIZE=64
+QUERY_CACHE_SIZE=512
+
+# PDF page extraction runs in a process pool; page text is cached per file hash
+PDF_CACHE_DIR="index_store/pdf_text"
+PDF_WORKERS=4
+PDF_PAGES_PER_TASK=16
+
+# Hybrid retrieval: BM25 + dense fused by reciprocal rank, optional cross-encoder rerank
+HYBRID_CANDIDATES=20
+RRF_K=60
+RERANK_ENABLED=False
+RERANK_MODEL="cross-encoder/ms-marco-MiniLM-L-6-v2"
+RERANK_TOP_N=12
+
+# Point the chat model at an OpenAI-compatible server, e.g. the repo's mock LLM:
+#   python benchmarks/mock_servers.py llm --port 8001  ->  CHAT_BASE_URL="http://127.0.0.1:8001/v1"
+CHAT_BASE_URL=None
+
+# Semantic answer cache: reuse answers to near-identical questions on the same documents
+ANSWER_CACHE_THRESHOLD=0.95
+ANSWER_CACHE_MAX_ENTRIES=1000
+ANSWER_CACHE_MAX_BYTES=16*1024*1024
+
+# Prompt and history limits
+CONTEXT_TOKEN_BUDGET=2000
+HISTORY_TOKEN_BUDGET=300
+HISTORY_TURNS=6
+HISTORY_WINDOW=20
+MAX_STORED_MESSAGES=200
@@ -0,0 +1,92 @@
+from typing import List, Tuple
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """Exact with tiktoken installed, otherwise the usual ~4 characters per token."""
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def _overlap(left: str, right: str, max_overlap: int = 400, min_overlap: int = 20) -> int:
+    for size in range(min(max_overlap, len(left), len(right)), min_overlap - 1, -1):
+        if left.endswith(right[:size]):
+            return size
+    return 0
+
+
+def _chunk_position(doc) -> Tuple[str, int]:
+    doc_hash, _, index = doc.metadata.get("chunk_id", ":").rpartition(":")
+    return doc_hash, int(index) if index.isdigit() else -1
+
+
+def merge_overlapping(docs) -> List[str]:
+    """Collapse retrieved chunks into passages, keeping retrieval order.
+
+    Consecutive chunks of one document are stitched together without the
+    text they share through ``chunk_overlap``; duplicates and chunks contained
+    in another are dropped.
+    """
+    passages = []
+    by_position = {}
+    for doc in docs:
+        text = doc.page_content
+        if any(text in passage["text"] for passage in passages):
+            continue
+        doc_hash, index = _chunk_position(doc)
+        previous = by_position.get((doc_hash, index - 1)) if index >= 0 else None
+        following = by_position.get((doc_hash, index + 1)) if index >= 0 else None
+        if previous is not None:
+            previous["text"] += text[_overlap(previous["text"], text):]
+            by_position[(doc_hash, index)] = previous
+            if following is not None and following is not previous:
+                previous["text"] += following["text"][_overlap(previous["text"], following["text"]):]
+                passages.remove(following)
+                for position, passage in by_position.items():
+                    if passage is following:
+                        by_position[position] = previous
+        elif following is not None:
+            following["text"] = text + following["text"][_overlap(text, following["text"]):]
+            by_position[(doc_hash, index)] = following
+        else:
+            passage = {"text": text}
+            passages.append(passage)
+            by_position[(doc_hash, index)] = passage
+    return [passage["text"] for passage in passages]
+
+
+def _truncate(text: str, budget: int) -> str:
+    if count_tokens(text) <= budget:
+        return text
+    cut = max(1, len(text) * budget // max(count_tokens(text), 1))
+    return text[:cut].rsplit(" ", 1)[0] + " …"
+
+
+def build_context(docs, budget: int) -> Tuple[str, dict]:
+    """Deduplicated passages in retrieval order, trimmed to ``budget`` tokens."""
+    parts, used = [], 0
+    passages = merge_overlapping(docs)
+    for passage in passages:
+        remaining = budget - used
+        if remaining < 50:
+            break
+        passage = _truncate(passage, remaining)
+        parts.append(passage)
+        used += count_tokens(passage)
+    return "\n\n".join(parts), {"chunks": len(docs), "passages": len(parts), "context_tokens": used}
+
+
+def summarize_history(messages: List[dict], turns: int, budget: int) -> str:
+    """The last ``turns`` messages, one short line each, within ``budget`` tokens."""
+    lines = []
+    per_message = max(budget // max(turns, 1), 20)
+    for message in messages[-turns:]:
+        content = " ".join(message["content"].split())
+        lines.append(f"{message['role'].title()}: {_truncate(content, per_message)}")
+    return "\n".join(lines)
@@ -0,0 +1,59 @@
+from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_core.embeddings import Embeddings
+from collections import OrderedDict
+from typing import Callable, List, Optional
+import threading
+
+from app.config import EMBEDDING_MODEL, EMBED_BATCH_SIZE, QUERY_CACHE_SIZE
+
+
+class SharedEmbeddings(Embeddings):
+    """Thread-safe wrapper around one HuggingFace model.
+
+    Documents are embedded in ``batch_size`` slices with an optional
+    ``progress(done, total)`` callback; query embeddings are kept in an LRU
+    cache of ``query_cache_size`` entries.
+    """
+
+    def __init__(self, model_name: str, batch_size: int = 64, query_cache_size: int = 512):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.query_cache_size = query_cache_size
+        self._model = HuggingFaceEmbeddings(model_name=model_name, encode_kwargs={"batch_size": batch_size})
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str], progress: Optional[Callable[[int, int], None]] = None):
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            with self._lock:
+                vectors.extend(self._model.embed_documents(batch))
+            if progress:
+                progress(len(vectors), len(texts))
+        return vectors
+
+    def embed_query(self, text: str):
+        with self._lock:
+            vector = self._queries.get(text)
+            if vector is not None:
+                self._queries.move_to_end(text)
+                return vector
+            vector = self._model.embed_query(text)
+            self._queries[text] = vector
+            if len(self._queries) > self.query_cache_size:
+                self._queries.popitem(last=False)
+            return vector
+
+
+_embeddings = None
+_embeddings_lock = threading.Lock()
+
+
+def get_embeddings() -> SharedEmbeddings:
+    """Process-wide embedding model, loaded on first use."""
+    global _embeddings
+    with _embeddings_lock:
+        if _embeddings is None:
+            _embeddings = SharedEmbeddings(EMBEDDING_MODEL, EMBED_BATCH_SIZE, QUERY_CACHE_SIZE)
+        return _embeddings
@@ -1,10 +1,97 @@
 from pypdf import  PdfReader
-from typing import List, Optional
+from typing import Collection, Iterable, Iterator, List, Optional
 from io import BytesIO
+from concurrent.futures import Executor, ProcessPoolExecutor
+import hashlib
+import json
+import os
+import threading
+
+from app.config import PDF_CACHE_DIR, PDF_WORKERS, PDF_PAGES_PER_TASK
 
 def extract_text_from_pdf(file):
     reader = PdfReader(file)
-    text = ' '
-    for page in reader.pages:
-        text = text + page.extract_text() or ''
-    return text
\ No newline at end of file
+    return ' ' + ''.join(page.extract_text() or '' for page in reader.pages)
+
+
+def _extract_pages(data: bytes, start: int, stop: int) -> List[str]:
+    reader = PdfReader(BytesIO(data))
+    return [reader.pages[i].extract_text() or '' for i in range(start, stop)]
+
+
+def _cache_file(data: bytes) -> str:
+    return os.path.join(PDF_CACHE_DIR, hashlib.sha256(data).hexdigest() + ".json")
+
+
+def iter_pdf_pages(data: bytes, executor: Optional[Executor] = None) -> Iterator[str]:
+    """Yield page texts of a PDF in order.
+
+    Extraction is submitted to ``executor`` in ``PDF_PAGES_PER_TASK`` page
+    ranges as soon as this is called, so several files can be extracted
+    while earlier pages are being consumed. Results are cached per file hash.
+    """
+    cache_file = _cache_file(data)
+    if os.path.exists(cache_file):
+        with open(cache_file) as f:
+            return iter(json.load(f))
+
+    page_count = len(PdfReader(BytesIO(data)).pages)
+    ranges = [(start, min(start + PDF_PAGES_PER_TASK, page_count))
+              for start in range(0, page_count, PDF_PAGES_PER_TASK)]
+    if executor is None:
+        parts = (_extract_pages(data, start, stop) for start, stop in ranges)
+    else:
+        futures = [executor.submit(_extract_pages, data, start, stop) for start, stop in ranges]
+        parts = (future.result() for future in futures)
+
+    def pages():
+        extracted = []
+        for part in parts:
+            extracted.extend(part)
+            yield from part
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        with open(cache_file + ".tmp", "w") as f:
+            json.dump(extracted, f)
+        os.replace(cache_file + ".tmp", cache_file)
+
+    return pages()
+
+
+def retain_cached_pages(doc_hashes: Collection[str]):
+    """Delete the cached page text of every file whose hash is not in ``doc_hashes``."""
+    if not os.path.isdir(PDF_CACHE_DIR):
+        return
+    for name in os.listdir(PDF_CACHE_DIR):
+        if name.endswith(".json") and name[:-len(".json")] not in doc_hashes:
+            os.remove(os.path.join(PDF_CACHE_DIR, name))
+
+
+def split_pages(pages: Iterable[str], text_splitter, chunk_size: int) -> Iterator[str]:
+    """Split a stream of pages into chunks without joining the whole document.
+
+    Pages accumulate in a small buffer; every chunk but the last is emitted
+    and the last is carried into the next round so chunks still span pages.
+    """
+    buffer = ""
+    for page in pages:
+        buffer = buffer + "\n" + page if buffer else page
+        if len(buffer) < 4 * chunk_size:
+            continue
+        chunks = text_splitter.split_text(buffer)
+        yield from chunks[:-1]
+        buffer = chunks[-1] if chunks else ""
+    if buffer:
+        yield from text_splitter.split_text(buffer)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_pdf_executor() -> Executor:
+    """Process pool for page extraction, shared by every Streamlit session."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+        return _executor
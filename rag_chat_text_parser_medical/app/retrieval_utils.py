@@ -0,0 +1,149 @@
+from collections import Counter, defaultdict
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+import heapq
+import math
+import re
+import threading
+import time
+
+from app.config import HYBRID_CANDIDATES, RRF_K, RERANK_ENABLED, RERANK_MODEL, RERANK_TOP_N
+
+# Keeps drug names, ICD codes (E11.9), lab values (7.2) and units (mg/dl) whole
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.\-/][a-z0-9]+)*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were with "
+    "what which who whom how when where does did do patient".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """Incremental Okapi BM25 over chunk ids, kept next to the FAISS index."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(dict)
+        self.lengths = {}
+        self.total_length = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, chunk_id: str, text: str):
+        counts = Counter(tokenize(text))
+        with self._lock:
+            for term, tf in counts.items():
+                self.postings[term][chunk_id] = tf
+            self.lengths[chunk_id] = sum(counts.values())
+            self.total_length += self.lengths[chunk_id]
+
+    def remove(self, chunk_id: str, text: str):
+        with self._lock:
+            for term in set(tokenize(text)):
+                postings = self.postings.get(term)
+                if postings is not None:
+                    postings.pop(chunk_id, None)
+                    if not postings:
+                        del self.postings[term]
+            self.total_length -= self.lengths.pop(chunk_id, 0)
+
+    def search(self, query: str, k: int, keep: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """Top ``k`` chunk ids for ``query``, restricted to those ``keep`` accepts."""
+        with self._lock:
+            n = len(self.lengths)
+            if not n:
+                return []
+            avg_length = self.total_length / n
+            scores = defaultdict(float)
+            for term in set(tokenize(query)):
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for chunk_id, tf in postings.items():
+                    if keep is not None and not keep(chunk_id):
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self.lengths[chunk_id] / avg_length)
+                    scores[chunk_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+
+_cross_encoder = None
+_cross_encoder_lock = threading.Lock()
+
+
+def get_cross_encoder():
+    global _cross_encoder
+    with _cross_encoder_lock:
+        if _cross_encoder is None:
+            from sentence_transformers import CrossEncoder
+            _cross_encoder = CrossEncoder(RERANK_MODEL, device="cpu")
+        return _cross_encoder
+
+
+def hybrid_search(document_index, query: str, k: int = 4, rerank: bool = RERANK_ENABLED,
+                  doc_hashes: Optional[Collection[str]] = None):
+    """Fuse FAISS and BM25 rankings with reciprocal rank fusion.
+
+    Only chunks of ``doc_hashes`` (all documents if ``None``) are returned.
+    The fused top ``RERANK_TOP_N`` are optionally rescored with a CPU
+    cross-encoder. Returns ``(docs, timings)`` with per-stage milliseconds.
+    """
+    timings: Dict[str, float] = {}
+    query_vector = document_index.embeddings.embed_query(query)
+    allowed = None if doc_hashes is None else frozenset(doc_hashes)
+    with document_index.reading():
+        vectorstore = document_index.vectorstore
+        if vectorstore is None or allowed is not None and not allowed:
+            return [], timings
+
+        start = time.perf_counter()
+        if allowed is None:
+            dense = vectorstore.similarity_search_by_vector(query_vector, k=HYBRID_CANDIDATES)
+        else:
+            # FAISS filters after the search, so widen it by how much of the index is out of scope
+            total = vectorstore.index.ntotal
+            owned = max(document_index.chunk_count(allowed), 1)
+            fetch_k = min(total, 2 * HYBRID_CANDIDATES * math.ceil(total / owned))
+            dense = vectorstore.similarity_search_by_vector(
+                query_vector, k=HYBRID_CANDIDATES, fetch_k=fetch_k,
+                filter=lambda metadata: metadata["doc_hash"] in allowed,
+            )
+        timings["dense_ms"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        keep = None if allowed is None else lambda chunk_id: document_index.document_of(chunk_id) in allowed
+        sparse = document_index.bm25.search(query, HYBRID_CANDIDATES, keep)
+        timings["bm25_ms"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        fused = defaultdict(float)
+        docs = {}
+        for rank, doc in enumerate(dense):
+            chunk_id = doc.metadata["chunk_id"]
+            docs[chunk_id] = doc
+            fused[chunk_id] += 1 / (RRF_K + rank + 1)
+        for rank, (chunk_id, _) in enumerate(sparse):
+            fused[chunk_id] += 1 / (RRF_K + rank + 1)
+        top = heapq.nlargest(RERANK_TOP_N if rerank else k, fused, key=fused.get)
+        results = [docs.get(chunk_id) or vectorstore.docstore.search(chunk_id) for chunk_id in top]
+        timings["fusion_ms"] = (time.perf_counter() - start) * 1000
+
+    if rerank and results:
+        start = time.perf_counter()
+        scores = get_cross_encoder().predict([(query, doc.page_content) for doc in results])
+        results = [doc for _, doc in sorted(zip(scores, results), key=lambda pair: -pair[0])]
+        timings["rerank_ms"] = (time.perf_counter() - start) * 1000
+
+    return results[:k], timings
@@ -1,13 +1,309 @@
 from langchain_community.vectorstores import FAISS
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from typing import List
+from contextlib import contextmanager
+from typing import Callable, Collection, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+import faiss
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+
+from app.answer_cache import get_answer_cache
+from app.config import INDEX_DIR, SESSION_TTL_S, SESSION_EXPIRY_CHECK_S
+from app.embedding_utils import get_embeddings
+from app.pdf_utils import retain_cached_pages
+from app.retrieval_utils import BM25Index
+
+INDEX_FILE = "index.faiss"
+DOCSTORE_FILE = "index.pkl"
+MANIFEST_FILE = "manifest.json"
+BM25_FILE = "bm25.pkl"
+SESSIONS_FILE = "sessions.json"
+
 
 def create_faiss_index(texts: List[str]) :
-    embeddings = HuggingFaceEmbeddings(model_name = "sentence-transformers/all-mpnet-base-v2")
-    return FAISS.from_texts(texts, embeddings)
+    return FAISS.from_texts(texts, get_embeddings())
 
 
 def retrive_relevant_docs(vectorstore: FAISS, query: str, k: int = 4):
     return vectorstore.similarity_search(query, k=k)
 
 
+def document_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class DocumentIndex:
+    """FAISS index persisted on disk and keyed by document content hash.
+
+    The index is shared by every session, but each session only sees the
+    documents it uploaded: ``sync`` records a session's document set, embeds
+    only documents nobody has indexed yet, and deletes a document once no
+    session holds it any more. Sessions idle for ``session_ttl_s`` are
+    forgotten by ``expire`` (also run on load), so documents of abandoned
+    sessions and their cached page text are deleted too. Searches filter by
+    the session's set and run under ``reading()`` so they never see a
+    half-applied change.
+    The index file is memory-mapped read-only on load and only copied into
+    memory before the first change. A BM25 index over the same chunks is
+    maintained alongside.
+    """
+
+    def __init__(self, path: str, embeddings, session_ttl_s: float = 3600):
+        self.path = path
+        self.embeddings = embeddings
+        self.session_ttl_s = session_ttl_s
+        self.vectorstore = None
+        self.manifest = {}
+        self.sessions: Dict[str, FrozenSet[str]] = {}
+        self.last_seen: Dict[str, float] = {}
+        self.bm25 = BM25Index()
+        self._mapped = False
+        # _lock guards the FAISS, BM25 and manifest state; _sync_lock orders whole syncs
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._load()
+        self.expire()
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _load(self):
+        if not os.path.exists(self._file(MANIFEST_FILE)):
+            return
+        with open(self._file(MANIFEST_FILE)) as f:
+            self.manifest = json.load(f)
+        if os.path.exists(self._file(SESSIONS_FILE)):
+            with open(self._file(SESSIONS_FILE)) as f:
+                for session_id, entry in json.load(f).items():
+                    self.sessions[session_id] = frozenset(entry["documents"])
+                    self.last_seen[session_id] = entry["last_seen"]
+        if not os.path.exists(self._file(INDEX_FILE)):
+            return
+        with open(self._file(DOCSTORE_FILE), "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+        try:
+            index = faiss.read_index(self._file(INDEX_FILE), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            self._mapped = True
+        except RuntimeError:
+            index = faiss.read_index(self._file(INDEX_FILE))
+        self.vectorstore = FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=index_to_docstore_id,
+        )
+        if os.path.exists(self._file(BM25_FILE)):
+            with open(self._file(BM25_FILE), "rb") as f:
+                self.bm25 = pickle.load(f)
+        else:
+            for chunk_id in index_to_docstore_id.values():
+                self.bm25.add(chunk_id, docstore.search(chunk_id).page_content)
+
+    def _writable(self):
+        if self._mapped:
+            self.vectorstore.index = faiss.read_index(self._file(INDEX_FILE))
+            self._mapped = False
+
+    @contextmanager
+    def reading(self):
+        """Hold off index changes while searching."""
+        with self._lock:
+            yield
+
+    @staticmethod
+    def fingerprint(doc_hashes: Collection[str]) -> str:
+        """Stable id of a document set."""
+        return hashlib.sha256("".join(sorted(doc_hashes)).encode()).hexdigest()
+
+    def live_fingerprints(self) -> Set[str]:
+        """Fingerprints of the document sets sessions currently hold."""
+        with self._lock:
+            return {self.fingerprint(doc_hashes) for doc_hashes in self.sessions.values()}
+
+    @staticmethod
+    def document_of(chunk_id: str) -> str:
+        """Content hash of the document a chunk id (``<doc_hash>:<n>``) belongs to."""
+        return chunk_id.split(":", 1)[0]
+
+    def chunk_count(self, doc_hashes: Collection[str]) -> int:
+        """Chunks indexed for ``doc_hashes``; call under ``reading()``."""
+        return sum(len(self.manifest[h]["chunk_ids"]) for h in doc_hashes if h in self.manifest)
+
+    def add_document(self, doc_hash: str, name: str, chunks: Iterable[str], progress=None):
+        """Embed and add ``chunks`` in batches as they arrive from the iterable."""
+        ids = []
+        batch = []
+        try:
+            for chunk in chunks:
+                batch.append(chunk)
+                if len(batch) == self.embeddings.batch_size:
+                    self._add_batch(doc_hash, name, batch, ids)
+                    batch = []
+                    if progress:
+                        progress(len(ids))
+            if batch:
+                self._add_batch(doc_hash, name, batch, ids)
+                if progress:
+                    progress(len(ids))
+        except Exception:
+            if ids:
+                with self._lock:
+                    self._delete_chunks(ids)
+            raise
+        with self._lock:
+            self.manifest[doc_hash] = {"name": name, "chunk_ids": ids}
+
+    def _add_batch(self, doc_hash, name, chunks, ids):
+        batch_ids = [f"{doc_hash}:{i}" for i in range(len(ids), len(ids) + len(chunks))]
+        metadatas = [{"source": name, "doc_hash": doc_hash, "chunk_id": chunk_id} for chunk_id in batch_ids]
+        # Embed outside the lock so searches keep running during ingest
+        text_embeddings = list(zip(chunks, self.embeddings.embed_documents(chunks)))
+        with self._lock:
+            if self.vectorstore is None:
+                self.vectorstore = FAISS.from_embeddings(
+                    text_embeddings, self.embeddings, metadatas=metadatas, ids=batch_ids
+                )
+            else:
+                self._writable()
+                self.vectorstore.add_embeddings(text_embeddings, metadatas=metadatas, ids=batch_ids)
+            for chunk_id, chunk in zip(batch_ids, chunks):
+                self.bm25.add(chunk_id, chunk)
+        ids.extend(batch_ids)
+
+    def _delete_chunks(self, ids):
+        for chunk_id in ids:
+            self.bm25.remove(chunk_id, self.vectorstore.docstore.search(chunk_id).page_content)
+        self.vectorstore.delete(ids)
+
+    def remove_document(self, doc_hash: str):
+        entry = self.manifest.pop(doc_hash)
+        if entry["chunk_ids"]:
+            self._writable()
+            self._delete_chunks(entry["chunk_ids"])
+
+    def touch(self, session_id: str) -> bool:
+        """Mark ``session_id`` as active; False if it expired and must sync again."""
+        with self._lock:
+            if session_id not in self.sessions:
+                return False
+            self.last_seen[session_id] = time.time()
+            return True
+
+    def _release(self) -> List[str]:
+        """Delete every indexed document no session holds; call under both locks."""
+        held = set().union(*self.sessions.values())
+        removed = [h for h in self.manifest if h not in held]
+        for doc_hash in removed:
+            self.remove_document(doc_hash)
+        return removed
+
+    def _expire_sessions(self, now: float) -> int:
+        expired = [s for s, seen in self.last_seen.items() if now - seen > self.session_ttl_s]
+        for session_id in expired:
+            del self.sessions[session_id]
+            del self.last_seen[session_id]
+        return len(expired)
+
+    def expire(self) -> int:
+        """Forget idle sessions and delete what only they held; returns sessions expired.
+
+        Skipped while a sync is running, since ``sync`` expires sessions itself.
+        """
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            with self._lock:
+                expired = self._expire_sessions(time.time())
+                removed = self._release()
+                if removed:
+                    self.save()
+                elif expired:
+                    self.save_sessions()
+                retain_cached_pages(self.manifest)
+            return expired
+        finally:
+            self._sync_lock.release()
+
+    def sync(self, session_id: str, documents: Dict[str, Tuple[str, Callable[[], Iterable[str]]]],
+             progress: Optional[Callable[[str, int], None]] = None) -> dict:
+        """Make ``session_id`` hold exactly ``documents``.
+
+        ``documents`` maps a content hash to ``(name, load_chunks)``;
+        ``load_chunks`` is only called for documents that are not indexed yet,
+        all of them up front so their extraction can overlap. Documents the
+        session held before are deleted only if no other session holds them,
+        as are those of sessions that expired.
+        ``progress(name, chunks_done)`` is called per embedded batch.
+        """
+        with self._sync_lock:
+            with self._lock:
+                now = time.time()
+                self._expire_sessions(now)
+                self.sessions[session_id] = frozenset(documents)
+                self.last_seen[session_id] = now
+                added = [h for h in documents if h not in self.manifest]
+                removed = self._release()
+                if removed:
+                    retain_cached_pages(self.manifest)
+            pending = [(doc_hash, documents[doc_hash][0], documents[doc_hash][1]()) for doc_hash in added]
+            for doc_hash, name, chunks in pending:
+                report = (lambda done, name=name: progress(name, done)) if progress else None
+                self.add_document(doc_hash, name, chunks, progress=report)
+            with self._lock:
+                if added or removed:
+                    self.save()
+                else:
+                    self.save_sessions()
+            return {"added": len(added), "skipped": len(documents) - len(added), "removed": len(removed)}
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        names = [MANIFEST_FILE]
+        if self.vectorstore is not None:
+            faiss.write_index(self.vectorstore.index, self._file(INDEX_FILE + ".tmp"))
+            with open(self._file(DOCSTORE_FILE + ".tmp"), "wb") as f:
+                pickle.dump((self.vectorstore.docstore, self.vectorstore.index_to_docstore_id), f)
+            with open(self._file(BM25_FILE + ".tmp"), "wb") as f:
+                pickle.dump(self.bm25, f)
+            names = [INDEX_FILE, DOCSTORE_FILE, BM25_FILE, MANIFEST_FILE]
+        with open(self._file(MANIFEST_FILE + ".tmp"), "w") as f:
+            json.dump(self.manifest, f)
+        for name in names:
+            os.replace(self._file(name + ".tmp"), self._file(name))
+        self.save_sessions()
+
+    def save_sessions(self):
+        """Persist session document sets so a restart still expires them."""
+        os.makedirs(self.path, exist_ok=True)
+        with open(self._file(SESSIONS_FILE + ".tmp"), "w") as f:
+            json.dump({session_id: {"documents": sorted(documents), "last_seen": self.last_seen[session_id]}
+                       for session_id, documents in self.sessions.items()}, f)
+        os.replace(self._file(SESSIONS_FILE + ".tmp"), self._file(SESSIONS_FILE))
+
+
+_document_index = None
+_document_index_lock = threading.Lock()
+
+
+def _expire_loop(document_index: DocumentIndex, interval: float):
+    while True:
+        time.sleep(interval)
+        if document_index.expire():
+            get_answer_cache().retain(document_index.live_fingerprints())
+
+
+def get_document_index() -> DocumentIndex:
+    """Process-wide index, shared by every Streamlit session.
+
+    Streamlit has no session-end hook, so a background thread expires idle
+    sessions every ``SESSION_EXPIRY_CHECK_S`` seconds.
+    """
+    global _document_index
+    with _document_index_lock:
+        if _document_index is None:
+            _document_index = DocumentIndex(INDEX_DIR, get_embeddings(), SESSION_TTL_S)
+            threading.Thread(target=_expire_loop, args=(_document_index, SESSION_EXPIRY_CHECK_S),
+                             daemon=True).start()
+        return _document_index
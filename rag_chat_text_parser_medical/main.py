@@ -1,11 +1,17 @@
 import streamlit as st
 from app.ui import pdf_uploader
-from app.pdf_utils import extract_text_from_pdf
-from app.vectorstore_utils import create_faiss_index, retrive_relevant_docs
-from app.chat_utils import get_chat_model, ask_chat_model
-from app.config import EURI_API_KEY
+from app.pdf_utils import iter_pdf_pages, split_pages, get_pdf_executor
+from app.vectorstore_utils import get_document_index, document_hash
+from app.retrieval_utils import hybrid_search
+from app.embedding_utils import get_embeddings
+from app.answer_cache import get_answer_cache
+from app.chat_utils import get_chat_model, astream_chat_model, iter_async
+from app.context_utils import build_context, summarize_history
+from app.config import EURI_API_KEY, CONTEXT_TOKEN_BUDGET, HISTORY_TOKEN_BUDGET, HISTORY_TURNS, HISTORY_WINDOW, MAX_STORED_MESSAGES
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+import asyncio
 import time
+import uuid
 
 
 st.set_page_config(
@@ -74,13 +80,32 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+async def lookup_and_search(document_index, fingerprint, history, question, doc_hashes):
+    """Check the answer cache while hybrid search runs; both block, so each gets a thread."""
+    def lookup():
+        query_vector = get_embeddings().embed_query(question)
+        return query_vector, get_answer_cache().get(fingerprint, query_vector, history)
+
+    (query_vector, cached), (docs, timings) = await asyncio.gather(
+        asyncio.to_thread(lookup),
+        asyncio.to_thread(hybrid_search, document_index, question, doc_hashes=doc_hashes),
+    )
+    return query_vector, cached, docs, timings
+
+
 if "messages" not in st.session_state:
     st.session_state.messages = []
-if "vectorstore" not in st.session_state:
-    st.session_state.vectorstore = None
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+# Content hashes of the documents this session processed; retrieval is limited to them
+if "doc_hashes" not in st.session_state:
+    st.session_state.doc_hashes = frozenset()
 if "chat_model" not in st.session_state:
     st.session_state.chat_model = None
-    
+if "history_window" not in st.session_state:
+    st.session_state.history_window = HISTORY_WINDOW
+
+
 st.markdown("""
 <div style="text-align: center; padding: 2rem 0;">
     <h1 style="color: #ff4b4b; font-size: 3rem; margin-bottom: 0.5rem;">🏥 MediChat Pro</h1>
@@ -101,27 +126,36 @@ with st.sidebar:
         # Process documents
         if st.button("🚀 Process Documents", type="primary"):
             with st.spinner("Processing your medical documents..."):
-                # Extract text from all PDFs
-                all_texts = []
-                for file in uploaded_files:
-                    text = extract_text_from_pdf(file)
-                    all_texts.append(text)
-                
-                # Split texts into chunks
                 text_splitter = RecursiveCharacterTextSplitter(
                     chunk_size=1000,
                     chunk_overlap=200,
                     length_function=len,
                 )
-                
-                chunks = []
-                for text in all_texts:
-                    chunks.extend(text_splitter.split_text(text))
-                
-                # Create FAISS index
-                vectorstore = create_faiss_index(chunks)
-                st.session_state.vectorstore = vectorstore
-                
+
+                # Only new documents are extracted, split and embedded;
+                # pages stream from the extraction pool into batched embedding
+                def load_chunks(data):
+                    return lambda: split_pages(iter_pdf_pages(data, get_pdf_executor()), text_splitter, 1000)
+
+                documents = {}
+                for file in uploaded_files:
+                    data = file.getvalue()
+                    documents[document_hash(data)] = (file.name, load_chunks(data))
+
+                progress_text = st.empty()
+
+                def report_progress(name, done):
+                    progress_text.caption(f"Embedding {name}: {done} chunks")
+
+                document_index = get_document_index()
+                stats = document_index.sync(st.session_state.session_id, documents, progress=report_progress)
+                progress_text.empty()
+                st.session_state.doc_hashes = frozenset(documents)
+                get_answer_cache().retain(document_index.live_fingerprints())
+                st.caption(
+                    f"{stats['added']} new, {stats['skipped']} already indexed, {stats['removed']} removed"
+                )
+
                 # Initialize chat model
                 chat_model = get_chat_model(EURI_API_KEY)
                 st.session_state.chat_model = chat_model
@@ -132,8 +166,12 @@ with st.sidebar:
 # Main chat interface
 st.markdown("### 💬 Chat with Your Medical Documents")
 
-# Display chat messages
-for message in st.session_state.messages:
+# Display the most recent chat messages; older ones load on demand
+hidden = len(st.session_state.messages) - st.session_state.history_window
+if hidden > 0 and st.button(f"⬆️ Show earlier messages ({hidden} hidden)"):
+    st.session_state.history_window += HISTORY_WINDOW
+    hidden -= HISTORY_WINDOW
+for message in st.session_state.messages[max(hidden, 0):]:
     with st.chat_message(message["role"]):
         st.markdown(message["content"])
         st.caption(message["timestamp"])
@@ -153,39 +191,75 @@ if prompt := st.chat_input("Ask about your medical documents..."):
         st.markdown(prompt)
         st.caption(timestamp)
     
+    # Sessions idle past SESSION_TTL_S lose their documents and must process them again
+    if st.session_state.doc_hashes and not get_document_index().touch(st.session_state.session_id):
+        st.session_state.doc_hashes = frozenset()
+
     # Generate response
-    if st.session_state.vectorstore and st.session_state.chat_model:
+    if st.session_state.doc_hashes and st.session_state.chat_model:
         with st.chat_message("assistant"):
-            with st.spinner("🔍 Searching documents..."):
-                # Retrieve relevant documents
-                relevant_docs = retrive_relevant_docs(st.session_state.vectorstore, prompt)
-                
-                # Create context from relevant documents
-                context = "\n\n".join([doc.page_content for doc in relevant_docs])
-                
-                # Create prompt with context
-                system_prompt = f"""You are MediChat Pro, an intelligent medical document assistant. 
-                Based on the following medical documents, provide accurate and helpful answers. 
-                If the information is not in the documents, clearly state that.
+            # Near-identical questions on the same documents and conversation reuse the cached answer
+            document_index = get_document_index()
+            fingerprint = document_index.fingerprint(st.session_state.doc_hashes)
+            history = summarize_history(
+                st.session_state.messages[:-1], HISTORY_TURNS, HISTORY_TOKEN_BUDGET
+            ) or "(none)"
+            loop = asyncio.new_event_loop()
+            try:
+                with st.spinner("🔍 Searching documents..."):
+                    # The cache lookup (query embedding) and retrieval (BM25 + dense,
+                    # optionally reranked) run concurrently; a hit discards the search
+                    query_vector, response, relevant_docs, retrieval_timings = loop.run_until_complete(
+                        lookup_and_search(document_index, fingerprint, history, prompt,
+                                          st.session_state.doc_hashes)
+                    )
 
-                Medical Documents:
-                {context}
+                if response is not None:
+                    st.markdown(response)
+                    st.caption(timestamp + " · cached answer")
+                    message_stats = {"cached": True}
+                else:
+                    # Create context from relevant documents, deduplicated and within budget
+                    context, context_stats = build_context(relevant_docs, CONTEXT_TOKEN_BUDGET)
+                    
+                    # Create prompt with context
+                    system_prompt = f"""You are MediChat Pro, an intelligent medical document assistant. 
+                    Based on the following medical documents, provide accurate and helpful answers. 
+                    If the information is not in the documents, clearly state that.
 
-                User Question: {prompt}
+                    Medical Documents:
+                    {context}
 
-                Answer:"""
-                
-                response = ask_chat_model(st.session_state.chat_model, system_prompt)
-            
-            st.markdown(response)
-            st.caption(timestamp)
+                    Recent Conversation:
+                    {history}
+
+                    User Question: {prompt}
+
+                    Answer:"""
+                    
+                    # Render tokens as they arrive
+                    generation_stats = {}
+                    response = st.write_stream(iter_async(
+                        astream_chat_model(st.session_state.chat_model, system_prompt, generation_stats), loop
+                    ))
+                    st.caption(timestamp + " · retrieval " + ", ".join(
+                        f"{stage[:-3]} {ms:.0f} ms" for stage, ms in retrieval_timings.items()
+                    ) + f" · first token {generation_stats['ttft_ms']:.0f} ms"
+                      f" · {generation_stats['tokens_per_s']:.1f} tokens/s")
+                    get_answer_cache().put(fingerprint, query_vector, response, history)
+                    message_stats = {**generation_stats, **retrieval_timings, **context_stats}
+            finally:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
             
             # Add assistant message to chat history
             st.session_state.messages.append({
                 "role": "assistant", 
                 "content": response, 
-                "timestamp": timestamp
+                "timestamp": timestamp,
+                "stats": message_stats
             })
+            del st.session_state.messages[:-MAX_STORED_MESSAGES]
     else:
         with st.chat_message("assistant"):
             st.error("⚠️ Please upload and process documents first!")